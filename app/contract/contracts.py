@@ -1,8 +1,8 @@
 from abc import ABC
 
-from data import LoggingUtil
+from data import LoggingUtil, NetworkUtil
 from data.usecase import PanelUseCase, IndexUseCase, SeriesUseCase, MovieUseCase, SeasonUseCase, EpisodeUseCase
-from di import UseCaseProvider
+from di import UseCaseProvider, UtilityClientScopeProvider
 from domain.model import Parameters
 
 
@@ -13,6 +13,7 @@ class CoreInteractor(ABC):
     _movie_use_case: MovieUseCase
     _season_use_case: SeasonUseCase
     _episode_use_case: EpisodeUseCase
+    _network_client: NetworkUtil
 
     def __init__(self, parameters: Parameters, __logging_client: LoggingUtil) -> None:
         self._parameters = parameters
@@ -22,4 +23,5 @@ class CoreInteractor(ABC):
         self._movie_use_case = UseCaseProvider.movie_use_case()
         self._season_use_case = UseCaseProvider.seasons_use_case()
         self._episode_use_case = UseCaseProvider.episodes_use_case()
+        self._network_client = UtilityClientScopeProvider.network_client()
         self._logger = __logging_client.get_default_logger(__name__)
@@ -2,9 +2,10 @@ from logging import Logger
 
 from app.usecase import ServiceInteractor
 from data import DatabaseUtil, LoggingUtil
+from data.source import CacheLogUtil
 from domain.model import Parameters
 
-from di import UtilityClientScopeProvider
+from di import UtilityClientScopeProvider, SourceUtilityProvider, LocalSourceProvider
 
 
 class Main:
@@ -12,16 +13,39 @@ class Main:
     __logging_client: LoggingUtil = UtilityClientScopeProvider.logging_client()
     __logger: Logger = __logging_client.get_default_logger(__name__)
     __database_client: DatabaseUtil = UtilityClientScopeProvider.database_client()
+    __cache_client: CacheLogUtil = SourceUtilityProvider.cache_client()
 
     def __init__(self, parameters: Parameters) -> None:
         self.__parameters = parameters
 
+    def __provision_indexes(self) -> None:
+        """
+        Creates the indexes of every collection once before discovery starts, see `indexes.provision`
+        :return:
+        """
+        self.__logger.info("Provisioning collection indexes..")
+        for dao in (
+                LocalSourceProvider.cache_collection(),
+                LocalSourceProvider.validator_collection(),
+                LocalSourceProvider.auth_collection(),
+                LocalSourceProvider.index_collection(),
+                LocalSourceProvider.index_snapshot_collection(),
+                LocalSourceProvider.panel_collection(),
+                LocalSourceProvider.series_collection(),
+                LocalSourceProvider.season_collection(),
+                LocalSourceProvider.episode_collection(),
+                LocalSourceProvider.movie_collection()
+        ):
+            dao.provision_indexes()
+
     def start(self) -> None:
         """
         Application starting point, check parameters and stars the application service
         :return:
         """
         try:
+            if self.__database_client.should_provision_indexes():
+                self.__provision_indexes()
             ServiceInteractor(
                 self.__parameters,
                 self.__logging_client
@@ -32,5 +56,7 @@ class Main:
                 exc_info=error
             )
         finally:
+            self.__logger.info("Flushing pending cache entries..")
+            self.__cache_client.flush()
             self.__logger.info("Attempting to close database connection..")
             self.__database_client.disconnect()
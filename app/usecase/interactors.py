@@ -1,27 +1,153 @@
-from asyncio import run
+from asyncio import run, Queue, ensure_future, gather, Task
+from functools import partial
+from typing import Callable, Awaitable, Any, List, Iterable
 
 from app.contract import CoreInteractor
+from domain.entity import Panel, Season
 
 
 class ServiceInteractor(CoreInteractor):
 
+    async def __has_changed(self, panel: Panel) -> bool:
+        """
+        Incremental crawls only descend into series whose panel markers moved, which are then refreshed regardless
+        of their cache age, everything else is left untouched until the next full crawl
+        :param panel: series panel
+        :return: True if the series or its seasons should be refreshed
+        """
+        if await self._series_use_case.has_changed(panel) or await self._season_use_case.has_changed(panel):
+            return True
+        self._logger.debug(f'Skipping unchanged series: {panel.id}')
+        return False
+
+    async def __changed_seasons(self, panels: List[Panel]) -> List[Season]:
+        """
+        Fetches the seasons of changed series panels
+        :param panels: changed series panels
+        :return: seasons which have new episodes
+        """
+        changed: List[Season] = []
+
+        async def on_seasons(panel: Panel) -> None:
+            seasons: Iterable[Season] = await self._season_use_case.fetch(panel, True)
+            for season in seasons:
+                if await self._episode_use_case.has_changed(season, panel):
+                    changed.append(season)
+
+        await self._season_use_case.fan_out(panels, on_seasons)
+        return changed
+
     async def __start_discovery(self):
         self._logger.info(f'Fetching index for service: {self._parameters.service}')
         index = await self._index_use_case.index_panel(self._parameters.service)
         self._logger.info(f'Fetching panels for index')
         panels = await self._panel_use_case.panels(self._parameters.service, index)
+        incremental = self._network_client.get_crawl().incremental
+        if incremental:
+            self._logger.info(f'Selecting changed series panels')
+            panels = [
+                panel async for panel in panels
+                if self._series_use_case.is_supported(panel) and await self.__has_changed(panel)
+            ]
+        # stored collections are paged with separate queries, so no cursor is held open by the rate limited stages
         self._logger.info(f'Fetching series for panels')
-        series = await self._series_use_case.series(panels)
+        series = await self._series_use_case.series(panels, incremental)
         self._logger.info(f'Fetching seasons for series')
-        seasons = await self._season_use_case.seasons(series)
+        if incremental:
+            seasons = await self.__changed_seasons(panels)
+        else:
+            seasons = await self._season_use_case.seasons(series)
         self._logger.info(f'Fetching movies for panels')
-        await self._movie_use_case.movies(panels)
+        await self._movie_use_case.movies(self._panel_use_case.stream_panels())
         self._logger.info(f'Fetching episodes for seasons')
-        await self._episode_use_case.episodes(seasons)
+        await self._episode_use_case.episodes(seasons, incremental)
+
+    def __start_workers(self, count: int, source: Queue, action: Callable[[Any], Awaitable[None]]) -> List[Task]:
+        """
+        Starts workers which consume items from the given queue until they are cancelled
+        :param count: number of workers to start
+        :param source: queue to consume from
+        :param action: coroutine function to apply on each item
+        :return: worker tasks
+        """
+        async def work() -> None:
+            while True:
+                item = await source.get()
+                try:
+                    await action(item)
+                except Exception as e:
+                    self._logger.warning(f'Unable to complete pipeline task for: {item}', exc_info=e)
+                finally:
+                    source.task_done()
+
+        return [ensure_future(work()) for _ in range(count)]
+
+    async def __start_streaming_discovery(self):
+        self._logger.info(f'Fetching index for service: {self._parameters.service}')
+        index = await self._index_use_case.index_panel(self._parameters.service)
+        self._logger.info(f'Fetching panels for index')
+        stored_panels = await self._panel_use_case.panels(self._parameters.service, index)
+        # panels are read up front so that feeding the stages never waits on a database read, projected panels are
+        # small. Stored collections are read in pages of separate queries, see `Dao._stream`
+        panels: List[Panel] = [panel async for panel in stored_panels]
+
+        queue_size = self._network_client.get_concurrency().queue_size
+        series_queue, movie_queue = Queue(queue_size), Queue(queue_size)
+        season_queue, episode_queue = Queue(queue_size), Queue(queue_size)
+        incremental = self._network_client.get_crawl().incremental
+
+        async def on_series(panel: Panel) -> None:
+            if incremental and not await self.__has_changed(panel):
+                return
+            await self._series_use_case.fetch(panel, incremental)
+            await season_queue.put(panel)
+
+        async def on_seasons(panel: Panel) -> None:
+            seasons: Iterable[Season] = await self._season_use_case.fetch(panel, incremental)
+            for season in seasons:
+                if not incremental or await self._episode_use_case.has_changed(season, panel):
+                    await episode_queue.put(season)
+
+        workers = self.__start_workers(
+            self._series_use_case.concurrency_limit, series_queue, on_series
+        ) + self.__start_workers(
+            self._season_use_case.concurrency_limit, season_queue, on_seasons
+        ) + self.__start_workers(
+            self._episode_use_case.concurrency_limit, episode_queue,
+            partial(self._episode_use_case.fetch, force=incremental)
+        ) + self.__start_workers(
+            self._movie_use_case.concurrency_limit, movie_queue, self._movie_use_case.fetch
+        )
+
+        try:
+            self._logger.info(f'Streaming panels through series, seasons, episodes and movies')
+            for panel in panels:
+                if self._series_use_case.is_supported(panel):
+                    await series_queue.put(panel)
+                elif self._movie_use_case.is_supported(panel):
+                    await movie_queue.put(panel)
+            # each stage only marks an item as done after it has been handed to the next stage
+            await series_queue.join()
+            self._series_use_case.flush()
+            await season_queue.join()
+            await episode_queue.join()
+            await movie_queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await gather(*workers, return_exceptions=True)
+            self._series_use_case.flush()
+            self._movie_use_case.flush()
 
     async def __on_start(self):
         self._logger.info('Starting discovery task..')
-        await self.__start_discovery()
+        try:
+            if self._network_client.get_concurrency().streaming:
+                await self.__start_streaming_discovery()
+            else:
+                await self.__start_discovery()
+        finally:
+            await self._network_client.close_client()
 
     def start_service(self):
         self._logger.info('Starting service coroutine..')
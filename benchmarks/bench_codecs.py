@@ -0,0 +1,54 @@
+"""
+Compares writing and reading panel documents through the strict (marshmallow + dacite) entity codecs
+against the compiled entity codecs
+
+    python -m benchmarks.bench_codecs [panel count] [repeats]
+"""
+import sys
+from timeit import repeat
+from typing import List
+
+import bson
+from bson.codec_options import CodecOptions, TypeRegistry
+from marshmallow import EXCLUDE
+
+from benchmarks.payloads import build_collection_payload
+from data.entity import PanelEntity
+from data.mapper import PanelMapper
+from data.model import CollectionContainerSchema, PanelModel
+from data.type_registry import ImageContainerEntityCodec, ImageEntityCodec, MoviePanelEntityCodec, \
+    SeriesPanelEntityCodec, SearchMetaEntityCodec, PanelEntityCodec
+
+
+def build_options(strict: bool) -> CodecOptions:
+    return CodecOptions(type_registry=TypeRegistry([
+        ImageContainerEntityCodec(strict),
+        ImageEntityCodec(strict),
+        MoviePanelEntityCodec(strict),
+        SeriesPanelEntityCodec(strict),
+        SearchMetaEntityCodec(strict)
+    ]))
+
+
+def main(count: int, repeats: int) -> None:
+    payload = build_collection_payload(count)
+    models: List[PanelModel] = CollectionContainerSchema().load(payload, unknown=EXCLUDE)['items']
+    # noinspection PyProtectedMember
+    panels: List[PanelEntity] = [PanelMapper._map_to_entity(model) for model in models]
+    documents = [bson.decode(bson.encode(dict(panel), codec_options=build_options(False))) for panel in panels]
+    for name, strict in (('strict', True), ('compiled', False)):
+        options = build_options(strict)
+        codec = PanelEntityCodec(strict)
+        encode = min(repeat(lambda: [bson.encode(dict(panel), codec_options=options) for panel in panels],
+                            number=1, repeat=repeats))
+        decode = min(repeat(lambda: [codec.transform_bson(document) for document in documents],
+                            number=1, repeat=repeats))
+        print(f'{name:>9} encode: {encode * 1000:8.2f} ms, decode: {decode * 1000:8.2f} ms for {count} panels')
+
+
+if __name__ == '__main__':
+    arguments = sys.argv[1:]
+    main(
+        count=int(arguments[0]) if len(arguments) > 0 else 5_000,
+        repeats=int(arguments[1]) if len(arguments) > 1 else 5
+    )
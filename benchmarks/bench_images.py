@@ -0,0 +1,48 @@
+"""
+Compares loading a catalogue with many images when the nested image lists are flattened into new lists before
+loading, as `CoreSchema` used to, against flattening them inside the image list field
+
+    python -m benchmarks.bench_images [panel count] [images per type] [repeats]
+"""
+import copy
+import sys
+from itertools import chain
+from timeit import repeat
+from typing import Dict
+
+from marshmallow import EXCLUDE
+
+from benchmarks.payloads import build_collection_payload
+from data.model import CollectionContainerSchema
+
+
+def flatten_before_load(payload: Dict) -> Dict:
+    for item in payload['items']:
+        images = item['images']
+        for image_type in ('poster_tall', 'poster_wide', 'thumbnail'):
+            if image_type in images:
+                images[image_type] = list(chain.from_iterable(images[image_type]))
+    return CollectionContainerSchema(unknown=EXCLUDE).load(payload)
+
+
+def flatten_in_field(payload: Dict) -> Dict:
+    return CollectionContainerSchema(unknown=EXCLUDE).load(payload)
+
+
+def main(count: int, image_count: int, repeats: int) -> None:
+    payload = build_collection_payload(count, image_count)
+    assert flatten_before_load(copy.deepcopy(payload)) == flatten_in_field(copy.deepcopy(payload))
+    for name, function in (('flatten before load', flatten_before_load), ('flatten in field', flatten_in_field)):
+        # both variants get a fresh payload as flattening before load modifies it
+        payloads = [copy.deepcopy(payload) for _ in range(repeats)]
+        best = min(repeat(lambda: function(payloads.pop()), number=1, repeat=repeats))
+        print(f'{name:>20}: {best * 1000:8.2f} ms for {count} panels with {image_count} images per type')
+
+
+if __name__ == '__main__':
+    arguments = sys.argv[1:]
+    main(
+        count=int(arguments[0]) if len(arguments) > 0 else 200,
+        image_count=int(arguments[1]) if len(arguments) > 1 else 20,
+        repeats=int(arguments[2]) if len(arguments) > 2 else 5
+    )
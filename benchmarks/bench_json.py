@@ -0,0 +1,56 @@
+"""
+Compares decoding a `browse` response body with requests' `Response.json`, the json module on the raw body
+and orjson on the raw body (when installed). A recorded response can be given instead of a synthetic one
+
+    python -m benchmarks.bench_json [panel count | path to a recorded browse response] [repeats]
+"""
+import json
+import os
+import sys
+from timeit import repeat
+from typing import Callable, Dict, Any
+
+from requests import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from benchmarks.payloads import build_collection_payload
+
+
+def build_response(source: str) -> Response:
+    if os.path.isfile(source):
+        with open(source, 'rb') as file:
+            content = file.read()
+    else:
+        content = json.dumps(build_collection_payload(int(source))).encode('utf-8')
+    response = Response()
+    response._content = content
+    response.status_code = 200
+    return response
+
+
+def main(source: str, repeats: int) -> None:
+    response = build_response(source)
+    decoders: Dict[str, Callable[[], Any]] = {
+        'Response.json': lambda: response.json(),
+        'json raw body': lambda: json.loads(response.content)
+    }
+    if orjson is not None:
+        decoders['orjson raw body'] = lambda: orjson.loads(response.content)
+    expected = response.json()
+    print(f'body: {len(response.content) / 1024:.0f} KiB')
+    for name, decode in decoders.items():
+        assert decode() == expected
+        best = min(repeat(decode, number=1, repeat=repeats))
+        print(f'{name:>16}: {best * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    arguments = sys.argv[1:]
+    main(
+        source=arguments[0] if len(arguments) > 0 else '5000',
+        repeats=int(arguments[1]) if len(arguments) > 1 else 5
+    )
@@ -0,0 +1,42 @@
+"""
+Compares converting panel models to entities through a marshmallow dump and dacite against the compiled converters
+
+    python -m benchmarks.bench_mappers [panel count] [repeats]
+"""
+import sys
+from timeit import repeat
+from typing import List
+
+from dacite import from_dict
+from marshmallow import EXCLUDE
+
+from benchmarks.payloads import build_collection_payload
+from data.entity import PanelEntity
+from data.mapper import PanelMapper
+from data.model import CollectionContainerSchema, PanelSchema, PanelModel
+
+
+def dump_and_rebuild(models: List[PanelModel]) -> List[PanelEntity]:
+    return [from_dict(PanelEntity, PanelSchema().dump(model)) for model in models]
+
+
+def compiled(models: List[PanelModel]) -> List[PanelEntity]:
+    # noinspection PyProtectedMember
+    return [PanelMapper._map_to_entity(model) for model in models]
+
+
+def main(count: int, repeats: int) -> None:
+    payload = build_collection_payload(count)
+    models: List[PanelModel] = CollectionContainerSchema().load(payload, unknown=EXCLUDE)['items']
+    assert dump_and_rebuild(models) == compiled(models)
+    for name, function in (('dump + from_dict', dump_and_rebuild), ('compiled', compiled)):
+        best = min(repeat(lambda: function(models), number=1, repeat=repeats))
+        print(f'{name:>18}: {best * 1000:8.2f} ms for {count} panels ({best / count * 1_000_000:6.2f} µs/panel)')
+
+
+if __name__ == '__main__':
+    arguments = sys.argv[1:]
+    main(
+        count=int(arguments[0]) if len(arguments) > 0 else 5_000,
+        repeats=int(arguments[1]) if len(arguments) > 1 else 5
+    )
@@ -0,0 +1,74 @@
+"""
+Compares the memory held by panel entities (including their nested image and metadata entities) built from
+a synthetic catalogue against equivalent dataclasses without `__slots__`, each variant runs in its own process
+
+    python -m benchmarks.bench_memory [panel count]
+"""
+import resource
+import subprocess
+import sys
+import tracemalloc
+from dataclasses import fields, is_dataclass, make_dataclass
+from typing import Any, Dict, List, Union, get_type_hints, get_origin, get_args
+
+from marshmallow import EXCLUDE
+
+from benchmarks.payloads import build_collection_payload
+from data.entity import PanelEntity
+from data.mapper import PanelMapper
+from data.mapper.compilers import compile_encoder, compile_decoder
+from data.model import CollectionContainerSchema
+
+VARIANTS = ('slotted', 'plain')
+
+
+def without_slots(annotation: Any, clones: Dict[type, type]) -> Any:
+    """
+    Rebuilds an annotation replacing every dataclass with a copy that does not declare `__slots__`
+    """
+    if is_dataclass(annotation):
+        if annotation not in clones:
+            hints = get_type_hints(annotation)
+            clones[annotation] = make_dataclass(
+                f'Plain{annotation.__name__}',
+                [(field.name, without_slots(hints[field.name], clones)) for field in fields(annotation)]
+            )
+        return clones[annotation]
+    if get_origin(annotation) is Union:
+        return Union[tuple(without_slots(argument, clones) for argument in get_args(annotation))]
+    if get_origin(annotation) is list:
+        return List[without_slots(get_args(annotation)[0], clones)]
+    return annotation
+
+
+def measure(variant: str, count: int) -> None:
+    models = CollectionContainerSchema().load(build_collection_payload(count), unknown=EXCLUDE)['items']
+    # noinspection PyProtectedMember
+    documents = [compile_encoder(PanelEntity)(PanelMapper._map_to_entity(model)) for model in models]
+    del models
+    entity_type = PanelEntity if variant == 'slotted' else without_slots(PanelEntity, {})
+    decode = compile_decoder(entity_type)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    entities = [decode(document) for document in documents]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        f'{variant:>8}: {len(entities)} panels hold {current / 1024 / 1024:7.2f} MiB, '
+        f'peak rss grew by {(rss_after - rss_before) / 1024:7.2f} MiB'
+    )
+
+
+def main(count: int) -> None:
+    for variant in VARIANTS:
+        subprocess.run([sys.executable, '-m', 'benchmarks.bench_memory', str(count), variant], check=True)
+
+
+if __name__ == '__main__':
+    arguments = sys.argv[1:]
+    panel_count = int(arguments[0]) if len(arguments) > 0 else 20_000
+    if len(arguments) > 1:
+        measure(arguments[1], panel_count)
+    else:
+        main(panel_count)
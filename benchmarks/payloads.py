@@ -0,0 +1,85 @@
+from typing import Dict, List
+
+
+def build_images(count: int) -> Dict:
+    """
+    Builds an images body in the nested list shape returned by the api
+    :param count: number of images per image type
+    :return: images body
+    """
+    def images(image_type: str) -> List[List[Dict]]:
+        return [[
+            {
+                'width': 60 * (index + 1),
+                'height': 90 * (index + 1),
+                'type': image_type,
+                'source': f'https://img.example.com/{image_type}/{index}.jpg'
+            } for index in range(count)
+        ]]
+
+    return {
+        'poster_tall': images('poster_tall'),
+        'poster_wide': images('poster_wide')
+    }
+
+
+def build_collection_payload(count: int, image_count: int = 6) -> Dict:
+    """
+    Builds a synthetic response for `CollectionContainerSchema` with a mix of series and movie panels
+    :param count: number of panels
+    :param image_count: number of images per image type of each panel
+    :return: collection response body
+    """
+    def panel(index: int) -> Dict:
+        body = {
+            'id': f'G{index:08d}',
+            'external_id': f'SRZ.{index}',
+            'channel_id': 'crunchyroll',
+            'title': f'Title {index}',
+            'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 4,
+            'slug': f'title-{index}',
+            'images': build_images(image_count),
+            'locale': 'en-US',
+            'search_metadata': {
+                'score': index,
+                'rank': index,
+                'popularity_score': index / 10
+            },
+            'last_public': '2020-11-08T19:32:09Z',
+            'new': index % 5 == 0
+        }
+        if index % 4:
+            body['type'] = 'series'
+            body['series_metadata'] = {
+                'episode_count': 24,
+                'season_count': 2,
+                'is_mature': False,
+                'mature_blocked': False,
+                'is_subbed': True,
+                'is_dubbed': index % 2 == 0,
+                'is_simulcast': index % 3 == 0,
+                'maturity_ratings': ['TV-14'],
+                'last_public_season_number': 2,
+                'last_public_episode_number': 24
+            }
+            body['movie_listing_metadata'] = None
+        else:
+            body['type'] = 'movie_listing'
+            body['movie_listing_metadata'] = {
+                'duration_ms': 5_400_000,
+                'movie_release_year': 2000 + index % 20,
+                'is_premium_only': False,
+                'is_mature': False,
+                'mature_blocked': False,
+                'is_subbed': True,
+                'is_dubbed': False,
+                'available_offline': True,
+                'maturity_ratings': ['TV-PG']
+            }
+            body['series_metadata'] = None
+        return body
+
+    return {
+        'total': count,
+        'items': [panel(index) for index in range(count)]
+    }
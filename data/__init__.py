@@ -1 +1 @@
-from .util import NetworkUtil, DatabaseUtil, LoggingUtil, TimeUtil
+from .util import NetworkUtil, DatabaseUtil, LoggingUtil, TimeUtil, RateLimitUtil
@@ -1,3 +1,3 @@
 from .entities import Entity, SigningPolicyEntity, IndexEntity, CacheLogEntity, ImageEntity, MovieEntity, \
     PanelEntity, SeriesPanelEntity, ImageContainerEntity, AdBreakEntity, EpisodeEntity, MoviePanelEntity, \
-    SearchMetaEntity, SeasonEntity, SeriesEntity
+    SearchMetaEntity, SeasonEntity, SeriesEntity, ValidatorEntity
@@ -1,12 +1,14 @@
 from abc import ABC
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional, List, Union, Iterable
 
 
 class Entity(ABC):
     """
-    Base entity type that can be iterated upon
+    Base entity type that can be iterated upon, entities declare `__slots__` as they are created in large numbers
     """
+    __slots__ = ()
 
     def __iter__(self) -> Iterable:
         """
@@ -19,6 +21,7 @@ class Entity(ABC):
 
 @dataclass()
 class CacheLogEntity(Entity):
+    __slots__ = ('collection', 'time_stamp', 'item_id')
     collection: str
     time_stamp: int
     item_id: Optional[str]
@@ -29,22 +32,39 @@ class CacheLogEntity(Entity):
         yield 'item_id', self.item_id
 
 
+@dataclass()
+class ValidatorEntity(Entity):
+    __slots__ = ('key', 'etag', 'last_modified')
+    key: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    def __iter__(self) -> Iterable:
+        yield 'key', self.key
+        yield 'etag', self.etag
+        yield 'last_modified', self.last_modified
+
+
 @dataclass()
 class SigningPolicyEntity(Entity):
+    __slots__ = ('name', 'path', 'value', 'expires', 'expires_at')
     name: str
     path: str
     value: str
     expires: int
+    expires_at: datetime
 
     def __iter__(self) -> Iterable:
         yield 'name', self.name
         yield 'path', self.path
         yield 'value', self.value
         yield 'expires', self.expires
+        yield 'expires_at', self.expires_at
 
 
 @dataclass()
 class IndexEntity(Entity):
+    __slots__ = ('prefix', 'offset', 'count')
     prefix: str
     offset: int
     count: int
@@ -57,6 +77,10 @@ class IndexEntity(Entity):
 
 @dataclass()
 class SeriesPanelEntity(Entity):
+    __slots__ = (
+        'episode_count', 'season_count', 'is_mature', 'mature_blocked', 'is_subbed', 'is_dubbed', 'is_simulcast',
+        'maturity_ratings', 'last_public_season_number', 'last_public_episode_number'
+    )
     episode_count: int
     season_count: int
     is_mature: bool
@@ -71,6 +95,10 @@ class SeriesPanelEntity(Entity):
 
 @dataclass()
 class MoviePanelEntity(Entity):
+    __slots__ = (
+        'duration_ms', 'movie_release_year', 'is_premium_only', 'is_mature', 'mature_blocked', 'is_subbed',
+        'is_dubbed', 'available_offline', 'maturity_ratings'
+    )
     duration_ms: int
     movie_release_year: int
     is_premium_only: bool
@@ -84,6 +112,7 @@ class MoviePanelEntity(Entity):
 
 @dataclass()
 class SearchMetaEntity(Entity):
+    __slots__ = ('score', 'rank', 'popularity_score')
     score: int
     rank: int
     popularity_score: float
@@ -91,6 +120,7 @@ class SearchMetaEntity(Entity):
 
 @dataclass()
 class ImageEntity(Entity):
+    __slots__ = ('width', 'height', 'type', 'source')
     width: int
     height: int
     type: str
@@ -99,6 +129,7 @@ class ImageEntity(Entity):
 
 @dataclass()
 class ImageContainerEntity(Entity):
+    __slots__ = ('poster_tall', 'poster_wide', 'thumbnail')
     poster_tall: Optional[List[ImageEntity]]
     poster_wide: Optional[List[ImageEntity]]
     thumbnail: Optional[List[ImageEntity]]
@@ -106,6 +137,10 @@ class ImageContainerEntity(Entity):
 
 @dataclass()
 class PanelEntity(Entity):
+    __slots__ = (
+        'id', 'external_id', 'channel_id', 'title', 'description', 'type', 'slug', 'images',
+        'movie_listing_metadata', 'series_metadata', 'locale', 'search_metadata', 'last_public', 'new'
+    )
     id: str
     external_id: str
     channel_id: str
@@ -140,12 +175,20 @@ class PanelEntity(Entity):
 
 @dataclass()
 class AdBreakEntity(Entity):
+    __slots__ = ('type', 'offset_ms')
     type: str
     offset_ms: int
 
 
 @dataclass()
 class EpisodeEntity(Entity):
+    __slots__ = (
+        'id', 'channel_id', 'series_id', 'series_title', 'season_id', 'season_title', 'season_number', 'episode',
+        'episode_number', 'sequence_number', 'production_episode_id', 'title', 'description', 'next_episode_id',
+        'next_episode_title', 'hd_flag', 'is_mature', 'mature_blocked', 'episode_air_date', 'is_subbed',
+        'is_dubbed', 'is_clip', 'season_tags', 'available_offline', 'media_type', 'slug', 'images', 'duration_ms',
+        'ad_breaks', 'is_premium_only', 'listing_id'
+    )
     id: str
     channel_id: str
     series_id: str
@@ -214,6 +257,10 @@ class EpisodeEntity(Entity):
 
 @dataclass()
 class SeasonEntity(Entity):
+    __slots__ = (
+        'id', 'channel_id', 'title', 'series_id', 'season_number', 'is_complete', 'description', 'keywords',
+        'season_tags', 'images', 'is_mature', 'mature_blocked', 'is_subbed', 'is_dubbed', 'is_simulcast'
+    )
     id: str
     channel_id: str
     title: str
@@ -250,6 +297,11 @@ class SeasonEntity(Entity):
 
 @dataclass()
 class SeriesEntity(Entity):
+    __slots__ = (
+        'id', 'channel_id', 'title', 'slug', 'description', 'keywords', 'season_tags', 'images', 'maturity_ratings',
+        'episode_count', 'season_count', 'media_count', 'content_provider', 'is_mature', 'mature_blocked',
+        'is_subbed', 'is_dubbed', 'is_simulcast'
+    )
     id: str
     channel_id: str
     title: str
@@ -292,6 +344,11 @@ class SeriesEntity(Entity):
 
 @dataclass()
 class MovieEntity(Entity):
+    __slots__ = (
+        'id', 'channel_id', 'title', 'slug', 'description', 'keywords', 'images', 'maturity_ratings', 'season_tags',
+        'hd_flag', 'is_premium_only', 'is_mature', 'mature_blocked', 'movie_release_year', 'content_provider',
+        'is_subbed', 'is_dubbed', 'available_offline'
+    )
     id: str
     channel_id: str
     title: str
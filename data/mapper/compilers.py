@@ -0,0 +1,207 @@
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Tuple, Union, get_type_hints, get_origin, get_args, List, Mapping
+
+__converters: Dict[Tuple[type, type], Any] = {}
+
+
+def __unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    """
+    Strips `Optional` from an annotation
+    :param annotation: type annotation of a field
+    :return: the wrapped annotation and whether it was optional
+    """
+    if get_origin(annotation) is Union:
+        arguments = [argument for argument in get_args(annotation) if argument is not type(None)]
+        if len(arguments) == 1:
+            return arguments[0], True
+    return annotation, False
+
+
+def __build_expression(
+        name: str,
+        source_type: Any,
+        target_type: Any,
+        namespace: Dict[str, Any]
+) -> str:
+    """
+    Builds a python expression which converts the attribute `name` of the model to the value expected by the entity
+    :param name: field name
+    :param source_type: annotation of the field on the model
+    :param target_type: annotation of the field on the entity
+    :param namespace: globals of the generated function, nested converters are registered here
+    :return: source of the expression
+    """
+    value = f'model.{name}'
+    source_type, _ = __unwrap_optional(source_type)
+    target_type, is_optional = __unwrap_optional(target_type)
+    if is_dataclass(target_type):
+        converter = f'_convert_{name}'
+        namespace[converter] = compile_converter(source_type, target_type)
+        expression = f'{converter}({value})'
+    elif get_origin(target_type) in (list, List):
+        (source_item,), (target_item,) = get_args(source_type), get_args(target_type)
+        target_item, _ = __unwrap_optional(target_item)
+        if is_dataclass(target_item):
+            converter = f'_convert_{name}'
+            namespace[converter] = compile_converter(__unwrap_optional(source_item)[0], target_item)
+            expression = f'[{converter}(item) if item is not None else None for item in {value}]'
+        else:
+            expression = f'list({value})'
+    else:
+        return value
+    if is_optional:
+        return f'({expression} if {value} is not None else None)'
+    return expression
+
+
+def compile_converter(source: type, target: type) -> Callable[[Any], Any]:
+    """
+    Generates a function which builds the `target` dataclass straight from a `source` dataclass with matching
+    field names, nested dataclasses and lists of dataclasses are converted recursively. Generated functions are cached
+    :param source: model dataclass type
+    :param target: entity dataclass type
+    :return: converter from source instance to target instance
+    """
+    key = (source, target)
+    if key in __converters:
+        return __converters[key]
+    source_hints = get_type_hints(source)
+    target_hints = get_type_hints(target)
+    namespace: Dict[str, Any] = {'_target': target}
+    arguments = [
+        f'        {field.name}={__build_expression(field.name, source_hints[field.name], target_hints[field.name], namespace)}'
+        for field in fields(target)
+        if field.init
+    ]
+    source_code = 'def convert(model):\n    return _target(\n' + ',\n'.join(arguments) + '\n    )\n'
+    exec(compile(source_code, f'<converter {source.__name__} -> {target.__name__}>', 'exec'), namespace)
+    converter: Callable[[Any], Any] = namespace['convert']
+    __converters[key] = converter
+    return converter
+
+
+def __build_encode_expression(value: str, annotation: Any, namespace: Dict[str, Any], name: str) -> str:
+    """
+    Builds a python expression which converts `value` into something BSON serializable
+    :param value: source of the value to convert
+    :param annotation: type annotation of the field
+    :param namespace: globals of the generated function, nested encoders are registered here
+    :param name: field name used to register nested encoders
+    :return: source of the expression
+    """
+    annotation, is_optional = __unwrap_optional(annotation)
+    if is_dataclass(annotation):
+        encoder = f'_encode_{name}'
+        namespace[encoder] = compile_encoder(annotation)
+        expression = f'{encoder}({value})'
+    elif get_origin(annotation) in (list, List):
+        item_type, _ = __unwrap_optional(get_args(annotation)[0])
+        if is_dataclass(item_type):
+            encoder = f'_encode_{name}'
+            namespace[encoder] = compile_encoder(item_type)
+            expression = f'[{encoder}(item) if item is not None else None for item in {value}]'
+        else:
+            expression = f'list({value})'
+    else:
+        return value
+    if is_optional:
+        return f'({expression} if {value} is not None else None)'
+    return expression
+
+
+def __build_decode_expression(name: str, annotation: Any, namespace: Dict[str, Any]) -> str:
+    """
+    Builds a python expression which reads the key `name` of a document into the value expected by the entity
+    :param name: field name
+    :param annotation: type annotation of the field
+    :param namespace: globals of the generated function, nested decoders are registered here
+    :return: source of the expression
+    """
+    annotation, is_optional = __unwrap_optional(annotation)
+    value = f'document.get({name!r})' if is_optional else f'document[{name!r}]'
+    if is_dataclass(annotation):
+        decoder = f'_decode_{name}'
+        namespace[decoder] = compile_decoder(annotation)
+        expression = f'{decoder}({value})'
+    elif get_origin(annotation) in (list, List):
+        item_type, _ = __unwrap_optional(get_args(annotation)[0])
+        if is_dataclass(item_type):
+            decoder = f'_decode_{name}'
+            namespace[decoder] = compile_decoder(item_type)
+            expression = f'[{decoder}(item) if item is not None else None for item in {value}]'
+        else:
+            expression = f'list({value})'
+    else:
+        return value
+    if is_optional:
+        return f'({expression} if {value} is not None else None)'
+    return expression
+
+
+def compile_encoder(source: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generates a function which writes a `source` dataclass into a dictionary keyed by field name, nested dataclasses
+    and lists of dataclasses are encoded recursively. Generated functions are cached
+    :param source: entity dataclass type
+    :return: encoder from source instance to a dictionary
+    """
+    key = (source, dict)
+    if key in __converters:
+        return __converters[key]
+    hints = get_type_hints(source)
+    namespace: Dict[str, Any] = {}
+    entries = [
+        f'        {field.name!r}: {__build_encode_expression(f"value.{field.name}", hints[field.name], namespace, field.name)}'
+        for field in fields(source)
+    ]
+    source_code = 'def encode(value):\n    return {\n' + ',\n'.join(entries) + '\n    }\n'
+    exec(compile(source_code, f'<encoder {source.__name__}>', 'exec'), namespace)
+    encoder: Callable[[Any], Dict[str, Any]] = namespace['encode']
+    __converters[key] = encoder
+    return encoder
+
+
+def compile_decoder(target: type) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Generates a function which builds a `target` dataclass from a dictionary keyed by field name, nested dictionaries
+    and lists of dictionaries are decoded recursively. Missing optional keys become `None`, missing required keys
+    raise `KeyError`, values are not type checked. Generated functions are cached
+    :param target: entity dataclass type
+    :return: decoder from a dictionary to target instance
+    """
+    key = (dict, target)
+    if key in __converters:
+        return __converters[key]
+    hints = get_type_hints(target)
+    namespace: Dict[str, Any] = {'_target': target}
+    arguments = [
+        f'        {field.name}={__build_decode_expression(field.name, hints[field.name], namespace)}'
+        for field in fields(target)
+        if field.init
+    ]
+    source_code = 'def decode(document):\n    return _target(\n' + ',\n'.join(arguments) + '\n    )\n'
+    exec(compile(source_code, f'<decoder {target.__name__}>', 'exec'), namespace)
+    decoder: Callable[[Dict[str, Any]], Any] = namespace['decode']
+    __converters[key] = decoder
+    return decoder
+
+
+def compile_field_decoders(target: type) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Generates one function per field of the `target` dataclass which reads only that field from a document,
+    allowing fields to be decoded individually when they are first accessed. Generated functions are cached
+    :param target: entity dataclass type
+    :return: decoders keyed by field name
+    """
+    key = (target, Mapping)
+    if key in __converters:
+        return __converters[key]
+    hints = get_type_hints(target)
+    decoders: Dict[str, Callable[[Any], Any]] = {}
+    for field in fields(target):
+        namespace: Dict[str, Any] = {}
+        source_code = f'def decode(document):\n    return {__build_decode_expression(field.name, hints[field.name], namespace)}\n'
+        exec(compile(source_code, f'<decoder {target.__name__}.{field.name}>', 'exec'), namespace)
+        decoders[field.name] = namespace['decode']
+    __converters[key] = decoders
+    return decoders
@@ -2,9 +2,8 @@ from abc import ABC
 from logging import Logger
 from typing import Dict, List, Optional, Union, Any, Iterable
 
-from dacite import from_dict
-
 from data import TimeUtil, LoggingUtil
+from .compilers import compile_converter
 from data.entity import SigningPolicyEntity, Entity, IndexEntity, PanelEntity, SeasonEntity, EpisodeEntity, \
     SeriesEntity, MovieEntity
 from data.model import Model, SigningPolicyModel, IndexModel, PanelModel, PanelSchema, SeasonSchema, SeasonModel, \
@@ -67,7 +66,8 @@ class SigningPolicyMapper(CoreMapper):
             name=model.name,
             path=model.path,
             value=model.value,
-            expires=expire_time_stamp
+            expires=expire_time_stamp,
+            expires_at=expires_date_time
         )
 
     def to_entity(self, model: List[SigningPolicyModel]) -> List[SigningPolicyEntity]:
@@ -94,19 +94,19 @@ class IndexMapper(CoreMapper):
 
 
 class PanelMapper(CoreMapper):
+    __schema = PanelSchema()
+    __convert = staticmethod(compile_converter(PanelModel, PanelEntity))
 
     def __init__(self, logging_client: LoggingUtil) -> None:
         super().__init__('items', logging_client)
 
     @classmethod
     def _map_to_dict(cls, model: Model) -> Dict:
-        schema = PanelSchema()
-        return schema.dump(model)
+        return cls.__schema.dump(model)
 
     @classmethod
     def _map_to_entity(cls, model: PanelModel) -> PanelEntity:
-        data: Dict = cls._map_to_dict(model)
-        return from_dict(PanelEntity, data)
+        return cls.__convert(model)
 
     def to_entity(self, model: List[PanelModel]) -> List[PanelEntity]:
         entities = map(self._map_to_entity, model)
@@ -114,19 +114,19 @@ class PanelMapper(CoreMapper):
 
 
 class SeasonMapper(CoreMapper):
+    __schema = SeasonSchema()
+    __convert = staticmethod(compile_converter(SeasonModel, SeasonEntity))
 
     def __init__(self, logging_client: LoggingUtil) -> None:
         super().__init__('items', logging_client)
 
     @classmethod
     def _map_to_dict(cls, model: Model) -> Dict:
-        schema = SeasonSchema()
-        return schema.dump(model)
+        return cls.__schema.dump(model)
 
     @classmethod
     def _map_to_entity(cls, model: SeasonModel) -> SeasonEntity:
-        data = cls._map_to_dict(model)
-        return from_dict(SeasonEntity, data)
+        return cls.__convert(model)
 
     def to_entity(self, model: List[SeasonModel]) -> List[SeasonEntity]:
         entities = map(self._map_to_entity, model)
@@ -134,19 +134,19 @@ class SeasonMapper(CoreMapper):
 
 
 class EpisodeMapper(CoreMapper):
+    __schema = EpisodeSchema()
+    __convert = staticmethod(compile_converter(EpisodeModel, EpisodeEntity))
 
     def __init__(self, logging_client: LoggingUtil) -> None:
         super().__init__('items', logging_client)
 
     @classmethod
     def _map_to_dict(cls, model: Model) -> Dict:
-        schema = EpisodeSchema()
-        return schema.dump(model)
+        return cls.__schema.dump(model)
 
     @classmethod
     def _map_to_entity(cls, model: EpisodeModel) -> EpisodeEntity:
-        data = cls._map_to_dict(model)
-        return from_dict(EpisodeEntity, data)
+        return cls.__convert(model)
 
     def to_entity(self, model: List[EpisodeModel]) -> List[EpisodeEntity]:
         entities = map(self._map_to_entity, model)
@@ -154,19 +154,19 @@ class EpisodeMapper(CoreMapper):
 
 
 class SeriesMapper(CoreMapper):
+    __schema = SeriesSchema()
+    __convert = staticmethod(compile_converter(SeriesModel, SeriesEntity))
 
     def __init__(self, logging_client: LoggingUtil) -> None:
         super().__init__(None, logging_client)
 
     @classmethod
     def _map_to_dict(cls, model: Model) -> Dict:
-        schema = SeriesSchema()
-        return schema.dump(model)
+        return cls.__schema.dump(model)
 
     @classmethod
     def _map_to_entity(cls, model: SeriesModel) -> SeriesEntity:
-        data = cls._map_to_dict(model)
-        return from_dict(SeriesEntity, data)
+        return cls.__convert(model)
 
     def to_entity(self, model: SeriesModel) -> SeriesEntity:
         entity = self._map_to_entity(model)
@@ -174,19 +174,19 @@ class SeriesMapper(CoreMapper):
 
 
 class MovieMapper(CoreMapper):
+    __schema = MovieSchema()
+    __convert = staticmethod(compile_converter(MovieModel, MovieEntity))
 
     def __init__(self, logging_client: LoggingUtil) -> None:
         super().__init__(None, logging_client)
 
     @classmethod
     def _map_to_dict(cls, model: Model) -> Dict:
-        schema = MovieSchema()
-        return schema.dump(model)
+        return cls.__schema.dump(model)
 
     @classmethod
     def _map_to_entity(cls, model: MovieModel) -> MovieEntity:
-        data = cls._map_to_dict(model)
-        return from_dict(MovieEntity, data)
+        return cls.__convert(model)
 
     def to_entity(self, model: MovieModel) -> MovieEntity:
         entity = self._map_to_entity(model)
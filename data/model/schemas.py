@@ -1,12 +1,9 @@
 import typing
-from itertools import chain
 from typing import Optional
 
 from dacite import from_dict
-from marshmallow import Schema, fields, RAISE, EXCLUDE, post_load, types
-from marshmallow.error_store import ErrorStore
+from marshmallow import Schema, fields, EXCLUDE, post_load, types, utils
 from marshmallow.fields import String, Integer, Float, Boolean, List
-from marshmallow.schema import _T as T
 
 from .models import SigningPolicyModel, EpisodeModel, SeasonModel, SeriesModel, IndexModel, PanelModel, MovieModel, \
     ImageContainerModel, AdBreakModel, SearchMetaModel, ImageModel, SeriesPanelModel, MoviePanelModel
@@ -30,6 +27,73 @@ class TypedSchema(Schema):
         obj = from_dict(self._type_inference, data)
         return obj
 
+    def _prepare_trusted(self, data: typing.Mapping[str, typing.Any]) -> typing.Mapping[str, typing.Any]:
+        """
+        Reshapes a single item before it is loaded by `load_trusted`, the input must not be modified
+        """
+        return data
+
+    def load_trusted(self, data: typing.Any, many: typing.Optional[bool] = None) -> typing.Any:
+        """
+        Builds the same result as `load` for payloads which are known to be valid, fields are neither validated
+        nor coerced and models are built directly from the payload. Falls back to `load` when the payload does
+        not fit the models, e.g. a required key is missing
+        :param data: decoded json payload
+        :param many: whether data is a collection, defaults to the `many` of this schema
+        :return: loaded model/s or dictionary when the schema has no `type_inference`
+        """
+        many = self.many if many is None else many
+        if many:
+            return [self.load_trusted(item, many=False) for item in data]
+        try:
+            return self.__build_trusted(self._prepare_trusted(data))
+        except (KeyError, TypeError, AttributeError):
+            return self.load(data, many=False)
+
+    def __build_trusted(self, data: typing.Mapping[str, typing.Any]) -> typing.Any:
+        if self._type_inference is not None:
+            # imported here as the mapper package depends on this module
+            from data.mapper.compilers import compile_decoder
+            return compile_decoder(self._type_inference)(data)
+        result = {}
+        for name, field in self.load_fields.items():
+            key = field.data_key or name
+            if key not in data:
+                continue
+            value = data[key]
+            if value is not None and isinstance(field, fields.Nested):
+                value = field.schema.load_trusted(value)
+            elif value is not None and isinstance(field, List) and isinstance(field.inner, fields.Nested):
+                schema = field.inner.schema
+                value = [schema.load_trusted(item) if item is not None else None for item in value]
+            result[field.attribute or name] = value
+        return result
+
+
+class FlattenedList(List):
+    """
+    List field for values which arrive as nested lists, e.g. images. Nested lists are flattened lazily before
+    the items are deserialized by `List`, so the input is not modified, flat lists are accepted as is
+    """
+
+    @staticmethod
+    def flatten(value: typing.Iterable[typing.Any]) -> typing.Iterator[typing.Any]:
+        """
+        Lazily flattens one level of nesting
+        :param value: list of items or lists of items
+        :return: iterator over the items
+        """
+        for each in value:
+            if isinstance(each, list):
+                yield from each
+            else:
+                yield each
+
+    def _deserialize(self, value, attr, data, **kwargs) -> typing.List[typing.Any]:
+        if utils.is_collection(value):
+            value = self.flatten(value)
+        return super()._deserialize(value, attr, data, **kwargs)
+
 
 class CoreSchema(TypedSchema):
     """
@@ -39,44 +103,17 @@ class CoreSchema(TypedSchema):
     __href__: String = fields.Str()
     __resource_key__: String = fields.Str(allow_none=True, )
 
-    @staticmethod
-    def __modify_image_body(
-            data: typing.Union[typing.Mapping[str, typing.Any], typing.Iterable[typing.Mapping[str, typing.Any]]]
-    ) -> typing.Union[typing.Mapping[str, typing.Any], typing.Iterable[typing.Mapping[str, typing.Any]]]:
-        # Images seem to be nested lists which is redundant so we're going to flatten the list
-        if 'images' in data:
-            images = data['images']
-            if 'poster_tall' in images:
-                poster_tall = list(chain.from_iterable(images['poster_tall']))
-                data['images']['poster_tall'] = poster_tall
-            if 'poster_wide' in images:
-                poster_wide = list(chain.from_iterable(images['poster_wide']))
-                data['images']['poster_wide'] = poster_wide
-            if 'thumbnail' in images:
-                thumbnail = list(chain.from_iterable(images['thumbnail']))
-                data['images']['thumbnail'] = thumbnail
-        return data
-
-    def _deserialize(
-            self,
-            data: typing.Union[
-                typing.Mapping[str, typing.Any],
-                typing.Iterable[typing.Mapping[str, typing.Any]],
-            ], *,
-            error_store: ErrorStore,
-            many: bool = False,
-            partial=False,
-            unknown=RAISE,
-            index=None
-    ) -> typing.Union[T, typing.List[T]]:
-        return super()._deserialize(
-            self.__modify_image_body(data),
-            error_store=error_store,
-            many=many,
-            partial=partial,
-            unknown=unknown,
-            index=index
-        )
+    def _prepare_trusted(self, data: typing.Mapping[str, typing.Any]) -> typing.Mapping[str, typing.Any]:
+        images = data.get('images')
+        if not images:
+            return data
+        flattened = dict(images)
+        for image_type in ('poster_tall', 'poster_wide', 'thumbnail'):
+            if images.get(image_type) is not None:
+                flattened[image_type] = FlattenedList.flatten(images[image_type])
+        prepared = dict(data)
+        prepared['images'] = flattened
+        return prepared
 
 
 class SigningPolicySchema(TypedSchema):
@@ -194,7 +231,7 @@ class ImageSchema(TypedSchema):
 
 
 class ImageContainerSchema(TypedSchema):
-    poster_tall: List = fields.List(
+    poster_tall: List = FlattenedList(
         fields.Nested(
             nested=ImageSchema,
             allow_none=True,
@@ -202,7 +239,7 @@ class ImageContainerSchema(TypedSchema):
             
         )
     )
-    poster_wide: List = fields.List(
+    poster_wide: List = FlattenedList(
         fields.Nested(
             nested=ImageSchema,
             allow_none=True,
@@ -210,7 +247,7 @@ class ImageContainerSchema(TypedSchema):
             
         )
     )
-    thumbnail: List = fields.List(
+    thumbnail: List = FlattenedList(
         fields.Nested(
             nested=ImageSchema,
             allow_none=True,
@@ -1,7 +1,24 @@
 class AttributeDict(dict):
     # A dict that supports attribute access.
     def __getattr__(self, key):
-        return self[key]
+        # fields left out of a projection are reported as missing attributes, so `getattr` defaults and `hasattr` work
+        try:
+            return self[key]
+        except KeyError as e:
+            raise AttributeError(key) from e
 
     def __setattr__(self, key, value):
         self[key] = value
+
+
+class NotModified(object):
+    """
+    Result of a conditional request which the api answered with 304, the stored copy is still current
+    """
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return 'NOT_MODIFIED'
+
+
+NOT_MODIFIED = NotModified()
@@ -1,21 +1,43 @@
+from asyncio import get_running_loop, Lock, Task, ensure_future, shield, Semaphore, gather
+from contextvars import copy_context
+from functools import partial
+from itertools import islice
 from json import JSONDecodeError
-from typing import List, Optional, Dict, Iterable
+from time import time
+from typing import List, Optional, Dict, Iterable, Callable, Any, Union, Iterator, AsyncIterator, Tuple
 
 from mongo_thingy import Thingy
+from pymongo.results import BulkWriteResult
 from uplink import Consumer
 
 from domain.entity import Index, Panel, Season, Series, Movie, Episode, Item
-from domain.model import LoginQuery
+from domain.model import LoginQuery, Paging, Freshness
 from domain.repository import CommonRepository
 from .. import LoggingUtil
 from ..entity import SigningPolicyEntity, PanelEntity, Entity, IndexEntity, MovieEntity, SeriesEntity, SeasonEntity, \
-    EpisodeEntity
-from ..model import MovieModel, SeriesModel
+    EpisodeEntity, ValidatorEntity
+from ..model import MovieModel, SeriesModel, NotModified
 from ..source import AuthenticationEndpoint, AuthenticationDao, DiscoverEndpoint, IndexDao, CacheLogUtil, PanelDao, \
-    SeasonDao, SeriesDao, MovieDao, EpisodeDao, CollectionEndpoint
+    SeasonDao, SeriesDao, MovieDao, EpisodeDao, CollectionEndpoint, IndexSnapshotDao, ValidatorUtil
 
 
 class IRepository(CommonRepository):
+    # fields read by `_from_entity`, only these are fetched when streaming or listing entities
+    _projection_fields: Optional[Tuple[str, ...]] = None
+
+    def __init__(
+            self,
+            remote_source: Consumer,
+            local_source: Thingy,
+            logging_client: LoggingUtil,
+            non_blocking: bool = False
+    ) -> None:
+        """
+        :param non_blocking: whether the remote source uses the async client, as configured by `network.client`,
+        in which case consumer methods return awaitable responses instead of blocking
+        """
+        super().__init__(remote_source, local_source, logging_client)
+        self._non_blocking = non_blocking
 
     @staticmethod
     def _from_entity(entities: List[Entity]) -> Iterable[Item]:
@@ -26,25 +48,143 @@ class IRepository(CommonRepository):
         """
         pass
 
+    async def _stream(self, entities: Iterator[Entity]) -> AsyncIterator[Item]:
+        """
+        Maps entities to domain entities one batch at a time, each batch is read off the event loop
+        so that waiting on the database does not stall other tasks
+        :param entities: lazy iterator of entities, e.g. pages read by a dao
+        :return: Async iterator of domain entries
+        """
+        loop = get_running_loop()
+        batch_size = self._local_source.read_batch_size
+        while True:
+            batch = await loop.run_in_executor(None, list, islice(entities, batch_size))
+            if not batch:
+                break
+            for item in self._from_entity(batch):
+                yield item
+
+    @staticmethod
+    async def _read(query: Callable[..., Any], *args) -> Any:
+        """
+        Runs a blocking database read on the default executor, so that waiting on the database does not stall
+        other tasks
+        :param query: local source method to invoke
+        :param args: arguments for the local source method
+        :return: result of the local source method
+        """
+        loop = get_running_loop()
+        return await loop.run_in_executor(None, partial(query, *args))
+
+    @staticmethod
+    def _is_acknowledged(result: Optional[BulkWriteResult]) -> bool:
+        """
+        Cache entries may only be recorded once the entity write has been acknowledged,
+        otherwise a crash could leave a fresh cache entry for data that was never stored
+        :param result: Result of persisting entities, None when the write failed
+        :return: True if the write was acknowledged
+        """
+        return result is not None and result.acknowledged
+
+    @staticmethod
+    def _is_not_modified(response: Any) -> bool:
+        """
+        :param response: Result of a conditional request
+        :return: True if the api answered with 304, in which case there is nothing to store
+        """
+        return isinstance(response, NotModified)
+
+    async def _execute(self, request: Callable[..., Any], **kwargs) -> Any:
+        """
+        Awaits a remote request on the async client, otherwise runs the blocking request on the
+        default executor, so that concurrent tasks can overlap. Blocking requests run in a copy of the current
+        context so that request templates see the same context variables, e.g. `ValidatorUtil.pending`
+        :param request: consumer method to invoke
+        :param kwargs: arguments for the consumer method
+        :return: response of the consumer method
+        """
+        if self._non_blocking:
+            return await request(**kwargs)
+        loop = get_running_loop()
+        return await loop.run_in_executor(None, partial(copy_context().run, request, **kwargs))
+
 
 class AuthenticationRepository(IRepository):
     _remote_source: AuthenticationEndpoint
     _local_source: AuthenticationDao
 
-    def __make_request(self) -> Optional[Dict]:
+    # policies are refreshed once they have less than this many seconds left
+    __REFRESH_MARGIN: int = 60 * 5
+
+    def __init__(
+            self,
+            remote_source: Consumer,
+            local_source: Thingy,
+            logging_client: LoggingUtil,
+            non_blocking: bool = False
+    ) -> None:
+        super().__init__(remote_source, local_source, logging_client, non_blocking)
+        self.__lock: Optional[Lock] = None
+        self.__policies: Dict[str, Tuple[List[SigningPolicyEntity], int]] = {}
+        self.__refreshes: Dict[str, Task] = {}
+
+    async def __make_request(self) -> Optional[Dict]:
         try:
-            return self._remote_source.get_authorization_token()
+            return await self._execute(
+                self._remote_source.get_authorization_token
+            )
         except JSONDecodeError as e:
             self._logger.error(f"Failed to authenticate: {e.doc}", exc_info=e)
             return None
 
-    async def signing_policies(self, path_type: str = 'cms') -> List[SigningPolicyEntity]:
-        if not self._local_source.contains_valid_sessions(path_type):
-            response = self.__make_request()
-            result = self._local_source.save_or_update(response)
+    async def __load_policies(self, path_type: str) -> List[SigningPolicyEntity]:
+        # created lazily so that the lock belongs to the running event loop
+        if self.__lock is None:
+            self.__lock = Lock()
+        async with self.__lock:
+            if not self._local_source.contains_valid_sessions(path_type, self.__REFRESH_MARGIN):
+                response = await self.__make_request()
+                result = self._local_source.save_or_update(response)
+            else:
+                self._logger.debug("Skipping singing policy authentication")
+            policies = self._local_source.fetch_policy_matching(path_type)
+        if policies:
+            self.__policies[path_type] = (policies, policies[0].expires)
+        return policies
+
+    def __refresh(self, path_type: str) -> Task:
+        """
+        Starts loading policies for the path type, unless a load is already in progress in which case it is reused
+        :param path_type: path type of the policies
+        :return: Task which resolves to the loaded policies
+        """
+        task = self.__refreshes.get(path_type)
+        if task is None or task.done():
+            task = ensure_future(self.__load_policies(path_type))
+            self.__refreshes[path_type] = task
+        return task
+
+    def __on_background_refresh(self, task: Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.warning('Unable to refresh signing policies in the background', exc_info=task.exception())
 
-        self._logger.debug("Skipping singing policy authentication")
-        return self._local_source.fetch_policy_matching(path_type)
+    async def signing_policies(self, path_type: str = 'cms') -> List[SigningPolicyEntity]:
+        """
+        Signing policies are served from memory while valid, when they are about to expire a refresh
+        is started in the background so that callers never have to wait on it
+        :param path_type: path type of the policies
+        :return: signing policies, policy, signature and key pair in that order
+        """
+        cached = self.__policies.get(path_type)
+        if cached is not None:
+            policies, expires = cached
+            time_to_live = expires - int(time())
+            if time_to_live > 0:
+                refresh = self.__refreshes.get(path_type)
+                if time_to_live <= self.__REFRESH_MARGIN and (refresh is None or refresh.done()):
+                    self.__refresh(path_type).add_done_callback(self.__on_background_refresh)
+                return policies
+        return await shield(self.__refresh(path_type))
 
     async def login(self, credentials: LoginQuery):
         pass
@@ -60,19 +200,26 @@ class IndexRepository(IRepository):
             local_source: Thingy,
             logging_client: LoggingUtil,
             cache_log_client: CacheLogUtil,
-            authentication_repository: AuthenticationRepository
+            authentication_repository: AuthenticationRepository,
+            validator_client: ValidatorUtil,
+            non_blocking: bool = False
     ) -> None:
-        super().__init__(remote_source, local_source, logging_client)
+        """
+        :param validator_client: validators captured while requesting a response are only kept once it is stored
+        """
+        super().__init__(remote_source, local_source, logging_client, non_blocking)
         self._cache_log_client = cache_log_client
         self._authentication = authentication_repository
+        self._validator_client = validator_client
 
-    def __make_request(
+    async def __make_request(
             self,
             service: str,
             signing_policies: List[SigningPolicyEntity]
     ) -> Optional[Dict]:
         try:
-            return self._remote_source.get_index(
+            return await self._execute(
+                self._remote_source.get_index,
                 channel_id=service,
                 policy=signing_policies[0].value,
                 signature=signing_policies[1].value,
@@ -97,9 +244,13 @@ class IndexRepository(IRepository):
         key = self._local_source.get_collection_name()
         if self._cache_log_client.is_cache_expired(key):
             signing_policies = await self._authentication.signing_policies('public')
-            response = self.__make_request(service, signing_policies)
-            result = self._local_source.save_or_update(response)
-            self._cache_log_client.save_or_update(key)
+            with self._validator_client.pending() as validators:
+                response = await self.__make_request(service, signing_policies)
+            if self._is_not_modified(response):
+                self._cache_log_client.save_or_update(key)
+            elif self._is_acknowledged(self._local_source.save_or_update(response)):
+                self._cache_log_client.save_or_update(key)
+                self._validator_client.commit(validators)
         index = self._local_source.fetch_index_list()
         self._logger.debug("Index collection: %s", len(index))
         return self._from_entity(index)
@@ -108,6 +259,9 @@ class IndexRepository(IRepository):
 class PanelRepository(IRepository):
     _remote_source: DiscoverEndpoint
     _local_source: PanelDao
+    _projection_fields = (
+        'id', 'channel_id', 'title', 'external_id', 'type', 'locale', 'last_public', 'new', 'series_metadata'
+    )
 
     def __init__(
             self,
@@ -115,24 +269,67 @@ class PanelRepository(IRepository):
             local_source: Thingy,
             logging_client: LoggingUtil,
             cache_log_client: CacheLogUtil,
-            authentication_repository: AuthenticationRepository
+            authentication_repository: AuthenticationRepository,
+            paging: Paging,
+            snapshot_source: IndexSnapshotDao,
+            freshness: Freshness,
+            validator_client: ValidatorUtil,
+            non_blocking: bool = False
     ) -> None:
-        super().__init__(remote_source, local_source, logging_client)
+        """
+        :param paging: when `page_size` is set each prefix is requested in pages of that size
+        :param snapshot_source: index entries as they were when the panels of each prefix were last stored
+        :param freshness: `unchanged_prefix` is used as the cache duration of prefixes whose count has not changed
+        :param validator_client: validators captured while requesting a page are only kept once it is stored
+        """
+        super().__init__(remote_source, local_source, logging_client, non_blocking)
         self._cache_log_client = cache_log_client
         self._authentication = authentication_repository
+        self._validator_client = validator_client
+        self._paging = paging
+        self._snapshot_source = snapshot_source
+        self._freshness = freshness
+        self._snapshot: Optional[Dict[str, int]] = None
+
+    def __get_snapshot(self) -> Dict[str, int]:
+        if self._snapshot is None:
+            self._snapshot = self._snapshot_source.fetch_snapshot()
+        return self._snapshot
+
+    def has_changed(self, index: Index) -> Optional[bool]:
+        """
+        Compares the index entry against the snapshot taken when the panels of its prefix were last stored
+        :param index: index entry of a prefix
+        :return: True if the count of the prefix moved, False if it did not and None if there is no snapshot
+        """
+        count = self.__get_snapshot().get(index.prefix)
+        if count is None:
+            return None
+        return count != index.count
 
-    def __make_request(
+    def prioritise(self, indexes: Iterable[Index]) -> List[Index]:
+        """
+        Orders prefixes whose count moved, or which have never been stored, ahead of prefixes which have not changed
+        :param indexes: index entries
+        :return: index entries in the order they should be requested
+        """
+        return sorted(indexes, key=lambda index: self.has_changed(index) is False)
+
+    async def __make_request(
             self,
             service: str,
             index: Index,
-            signing_policies: List[SigningPolicyEntity]
+            signing_policies: List[SigningPolicyEntity],
+            start: int,
+            count: int
     ) -> Optional[Dict]:
         try:
-            return self._remote_source.get_catalogue_by_prefix(
+            return await self._execute(
+                self._remote_source.get_catalogue_by_prefix,
                 channel_id=service,
                 sort_by='alphabetical',
-                start=0,
-                count=index.count,
+                start=start,
+                count=count,
                 query=index.prefix,
                 policy=signing_policies[0].value,
                 signature=signing_policies[1].value,
@@ -142,17 +339,83 @@ class PanelRepository(IRepository):
             self._logger.error(f"Request failed with reason: {e.doc}", exc_info=e)
             return None
 
+    async def __fetch_page(
+            self,
+            service: str,
+            index: Index,
+            signing_policies: List[SigningPolicyEntity],
+            start: int,
+            count: int
+    ) -> bool:
+        """
+        Requests and persists a single window of a prefix
+        :return: True if the page was stored or has not been modified since it was stored
+        """
+        with self._validator_client.pending() as validators:
+            response = await self.__make_request(service, index, signing_policies, start, count)
+        if response is None:
+            return False
+        if self._is_not_modified(response):
+            return True
+        if self._is_acknowledged(self._local_source.save_or_update(response)):
+            self._validator_client.commit(validators)
+            return True
+        return False
+
+    async def __fetch_pages(self, service: str, index: Index, signing_policies: List[SigningPolicyEntity]) -> bool:
+        """
+        Splits the prefix into `page_size` windows which are requested concurrently, each page is stored as soon as
+        it arrives so a failed request only loses its own page
+        :return: True if every page was stored
+        """
+        page_size = self._paging.page_size
+        semaphore = Semaphore(max(1, self._paging.concurrency))
+
+        async def fetch(start: int) -> bool:
+            async with semaphore:
+                try:
+                    return await self.__fetch_page(
+                        service, index, signing_policies, start, min(page_size, index.count - start)
+                    )
+                except Exception as e:
+                    self._logger.warning(f'Unable to fetch page at {start} for prefix: {index.prefix}', exc_info=e)
+                    return False
+
+        results = await gather(*(fetch(start) for start in range(0, index.count, page_size)))
+        return all(results)
+
+    def __is_expired(self, key: str, index: Index) -> bool:
+        """
+        Prefixes whose count moved are requested regardless of their cache age, unchanged prefixes are only requested
+        once `unchanged_prefix` has elapsed while prefixes without a snapshot follow the default cache duration
+        """
+        has_changed = self.has_changed(index)
+        if has_changed:
+            return True
+        if has_changed is None:
+            return self._cache_log_client.is_cache_expired(key, index.prefix)
+        return self._cache_log_client.is_cache_expired(key, index.prefix, duration=self._freshness.unchanged_prefix)
+
+    def __store_snapshot(self, index: Index) -> None:
+        self._snapshot_source.save_or_update(IndexEntity(index.prefix, index.offset, index.count))
+        self.__get_snapshot()[index.prefix] = index.count
+
     async def panel(self, service: str, index: Index) -> None:
         key = self._local_source.get_collection_name()
-        if self._cache_log_client.is_cache_expired(key, index.prefix):
+        if self.__is_expired(key, index):
             signing_policies = await self._authentication.signing_policies('public')
-            response = self.__make_request(service, index, signing_policies)
-            result = self._local_source.save_or_update(response)
-            self._cache_log_client.save_or_update(key, index.prefix)
+            if self._paging.page_size > 0:
+                is_stored = await self.__fetch_pages(service, index, signing_policies)
+            else:
+                is_stored = await self.__fetch_page(service, index, signing_policies, 0, index.count)
+            if is_stored:
+                self._cache_log_client.save_or_update(key, index.prefix)
+                self.__store_snapshot(index)
 
     @staticmethod
     def _from_entity(entities: List[PanelEntity]) -> Iterable[Panel]:
         def map_to(entity: PanelEntity) -> Panel:
+            series_metadata = entity.series_metadata
             return Panel(
                 id=entity.id,
                 channel_id=entity.channel_id,
@@ -161,20 +424,36 @@ class PanelRepository(IRepository):
                 type=entity.type,
                 locale=entity.locale,
                 last_public=entity.last_public,
-                new=entity.new
+                new=entity.new,
+                is_simulcast=series_metadata is not None and series_metadata.is_simulcast,
+                episode_count=series_metadata.episode_count if series_metadata is not None else None,
+                season_count=series_metadata.season_count if series_metadata is not None else None,
+                last_public_season_number=(
+                    series_metadata.last_public_season_number if series_metadata is not None else None
+                ),
+                last_public_episode_number=(
+                    series_metadata.last_public_episode_number if series_metadata is not None else None
+                )
             )
 
         return map(map_to, entities)
 
     async def all_panels(self) -> Iterable[Panel]:
-        catalogues = self._local_source.fetch_catalogue_list()
+        catalogues = self._local_source.fetch_catalogue_list(self._projection_fields)
         self._logger.debug("Catalogue collection: %s", len(catalogues))
         return self._from_entity(catalogues)
 
+    def stream_panels(self) -> AsyncIterator[Panel]:
+        return self._stream(self._local_source.stream_catalogue_list(self._projection_fields))
+
 
 class SeasonRepository(IRepository):
     _remote_source: CollectionEndpoint
     _local_source: SeasonDao
+    _projection_fields = (
+        'id', 'channel_id', 'title', 'series_id', 'season_number', 'is_mature', 'is_subbed', 'is_dubbed',
+        'is_simulcast'
+    )
 
     def __init__(
             self,
@@ -182,19 +461,26 @@ class SeasonRepository(IRepository):
             local_source: Thingy,
             logging_client: LoggingUtil,
             cache_log_client: CacheLogUtil,
-            authentication_repository: AuthenticationRepository
+            authentication_repository: AuthenticationRepository,
+            validator_client: ValidatorUtil,
+            non_blocking: bool = False
     ) -> None:
-        super().__init__(remote_source, local_source, logging_client)
+        """
+        :param validator_client: validators captured while requesting a response are only kept once it is stored
+        """
+        super().__init__(remote_source, local_source, logging_client, non_blocking)
         self._cache_log_client = cache_log_client
         self._authentication = authentication_repository
+        self._validator_client = validator_client
 
-    def __make_request(
+    async def __make_request(
             self,
-            series: Series,
+            series: Union[Series, Panel],
             signing_policies: List[SigningPolicyEntity]
     ) -> Optional[Dict]:
         try:
-            return self._remote_source.get_seasons_for_series_id(
+            return await self._execute(
+                self._remote_source.get_seasons_for_series_id,
                 series_id=series.id,
                 policy=signing_policies[0].value,
                 signature=signing_policies[1].value,
@@ -204,13 +490,24 @@ class SeasonRepository(IRepository):
             self._logger.error(f"Request failed with reason: {e.doc}", exc_info=e)
             return None
 
-    async def seasons(self, series: Series) -> None:
+    async def seasons(self, series: Union[Series, Panel], force: bool = False) -> Iterable[Season]:
+        """
+        :param series: series or the series panel
+        :param force: request the seasons even if the cache has not expired
+        :return: seasons of the series
+        """
         key = self._local_source.get_collection_name()
-        if self._cache_log_client.is_cache_expired(key, series.id):
+        if force or self._cache_log_client.is_cache_expired(key, series.id, series):
             signing_policies = await self._authentication.signing_policies()
-            response = self.__make_request(series, signing_policies)
-            result = self._local_source.save_or_update(response)
-            self._cache_log_client.save_or_update(key, series.id)
+            with self._validator_client.pending() as validators:
+                response = await self.__make_request(series, signing_policies)
+            if self._is_not_modified(response):
+                self._cache_log_client.save_or_update(key, series.id)
+            elif self._is_acknowledged(self._local_source.save_or_update(response)):
+                self._cache_log_client.save_or_update(key, series.id)
+                self._validator_client.commit(validators)
+        seasons = self._local_source.fetch_season_list_for_series(series.id, self._projection_fields)
+        return self._from_entity(seasons)
 
     @staticmethod
     def _from_entity(entities: List[SeasonEntity]) -> Iterable[Season]:
@@ -223,20 +520,31 @@ class SeasonRepository(IRepository):
                 season_number=entity.season_number,
                 is_mature=entity.is_mature,
                 is_subbed=entity.is_subbed,
-                is_dubbed=entity.is_dubbed
+                is_dubbed=entity.is_dubbed,
+                is_simulcast=entity.is_simulcast
             )
 
         return map(map_to, entities)
 
+    async def contains_season(self, series_id: str, season_number: int) -> bool:
+        return await self._read(self._local_source.contains_season, series_id, season_number)
+
     async def all_seasons(self) -> Iterable[Season]:
-        seasons = self._local_source.fetch_season_list()
+        seasons = self._local_source.fetch_season_list(self._projection_fields)
         self._logger.debug("Seasons collection: %s", len(seasons))
         return self._from_entity(seasons)
 
+    def stream_seasons(self) -> AsyncIterator[Season]:
+        return self._stream(self._local_source.stream_season_list(self._projection_fields))
+
 
 class SeriesRepository(IRepository):
     _remote_source: CollectionEndpoint
     _local_source: SeriesDao
+    _projection_fields = (
+        'id', 'channel_id', 'title', 'slug', 'maturity_ratings', 'episode_count', 'season_count',
+        'media_count', 'content_provider', 'is_mature', 'is_subbed', 'is_dubbed', 'is_simulcast'
+    )
 
     def __init__(
             self,
@@ -244,19 +552,26 @@ class SeriesRepository(IRepository):
             local_source: Thingy,
             logging_client: LoggingUtil,
             cache_log_client: CacheLogUtil,
-            authentication_repository: AuthenticationRepository
+            authentication_repository: AuthenticationRepository,
+            validator_client: ValidatorUtil,
+            non_blocking: bool = False
     ) -> None:
-        super().__init__(remote_source, local_source, logging_client)
+        """
+        :param validator_client: validators captured while requesting a response are only kept once it is stored
+        """
+        super().__init__(remote_source, local_source, logging_client, non_blocking)
         self._cache_log_client = cache_log_client
         self._authentication = authentication_repository
+        self._validator_client = validator_client
 
-    def __make_request(
+    async def __make_request(
             self,
             panel: Panel,
             signing_policies: List[SigningPolicyEntity]
     ) -> Optional[SeriesModel]:
         try:
-            return self._remote_source.get_series_by_id(
+            return await self._execute(
+                self._remote_source.get_series_by_id,
                 series_id=panel.id,
                 policy=signing_policies[0].value,
                 signature=signing_policies[1].value,
@@ -266,13 +581,34 @@ class SeriesRepository(IRepository):
             self._logger.error(f"Request failed with reason: {e.doc}", exc_info=e)
             return None
 
-    async def series(self, panel: Panel) -> None:
+    async def series(self, panel: Panel, force: bool = False) -> None:
+        """
+        :param panel: series panel
+        :param force: request the series even if the cache has not expired
+        """
         key = self._local_source.get_collection_name()
-        if self._cache_log_client.is_cache_expired(key, panel.id):
+        if force or self._cache_log_client.is_cache_expired(key, panel.id, panel):
             signing_policies = await self._authentication.signing_policies()
-            response = self.__make_request(panel, signing_policies)
-            result = self._local_source.save_or_update(response)
-            self._cache_log_client.save_or_update(key, panel.id)
+            with self._validator_client.pending() as validators:
+                response = await self.__make_request(panel, signing_policies)
+            if self._is_not_modified(response):
+                self._cache_log_client.save_or_update(key, panel.id)
+                return
+            self._local_source.save_or_update(
+                response,
+                partial(self.__on_stored, key, panel.id, validators)
+            )
+
+    def __on_stored(self, key: str, identifier: str, validators: List[ValidatorEntity]) -> None:
+        self._cache_log_client.save_or_update(key, identifier)
+        self._validator_client.commit(validators)
+
+    def is_cache_expired(self, panel: Panel) -> bool:
+        """
+        :param panel: series panel
+        :return: True if the stored series is due for a refresh
+        """
+        return self._cache_log_client.is_cache_expired(self._local_source.get_collection_name(), panel.id, panel)
 
     @staticmethod
     def _from_entity(entities: List[SeriesEntity]) -> Iterable[Series]:
@@ -289,20 +625,44 @@ class SeriesRepository(IRepository):
                 content_provider=entity.content_provider,
                 is_mature=entity.is_mature,
                 is_subbed=entity.is_subbed,
-                is_dubbed=entity.is_dubbed
+                is_dubbed=entity.is_dubbed,
+                is_simulcast=entity.is_simulcast
             )
 
         return map(map_to, entities)
 
+    def flush(self) -> None:
+        """
+        Writes series which are still waiting to be persisted
+        """
+        self._local_source.flush()
+
+    async def stored_series(self, series_id: str) -> Optional[Series]:
+        """
+        :param series_id: Identifier of the series
+        :return: the stored series, or None if it has not been stored yet
+        """
+        entity = await self._read(self._local_source.fetch_series, series_id, self._projection_fields)
+        if entity is None:
+            return None
+        return next(iter(self._from_entity([entity])))
+
     async def all_series(self) -> Iterable[Series]:
-        series = self._local_source.fetch_series_list()
+        series = self._local_source.fetch_series_list(self._projection_fields)
         self._logger.debug("Series collection: %s", len(series))
         return self._from_entity(series)
 
+    def stream_series(self) -> AsyncIterator[Series]:
+        return self._stream(self._local_source.stream_series_list(self._projection_fields))
+
 
 class MovieRepository(IRepository):
     _remote_source: CollectionEndpoint
     _local_source: MovieDao
+    _projection_fields = (
+        'id', 'channel_id', 'title', 'slug', 'maturity_ratings', 'movie_release_year', 'content_provider',
+        'is_mature', 'is_subbed', 'is_dubbed'
+    )
 
     def __init__(
             self,
@@ -310,19 +670,26 @@ class MovieRepository(IRepository):
             local_source: Thingy,
             logging_client: LoggingUtil,
             cache_log_client: CacheLogUtil,
-            authentication_repository: AuthenticationRepository
+            authentication_repository: AuthenticationRepository,
+            validator_client: ValidatorUtil,
+            non_blocking: bool = False
     ) -> None:
-        super().__init__(remote_source, local_source, logging_client)
+        """
+        :param validator_client: validators captured while requesting a response are only kept once it is stored
+        """
+        super().__init__(remote_source, local_source, logging_client, non_blocking)
         self._cache_log_client = cache_log_client
         self._authentication = authentication_repository
+        self._validator_client = validator_client
 
-    def __make_request(
+    async def __make_request(
             self,
             panel: Panel,
             signing_policies: List[SigningPolicyEntity]
     ) -> Optional[MovieModel]:
         try:
-            return self._remote_source.get_movie_by_id(
+            return await self._execute(
+                self._remote_source.get_movie_by_id,
                 movie_id=panel.id,
                 policy=signing_policies[0].value,
                 signature=signing_policies[1].value,
@@ -334,11 +701,21 @@ class MovieRepository(IRepository):
 
     async def movie(self, panel: Panel) -> None:
         key = self._local_source.get_collection_name()
-        if self._cache_log_client.is_cache_expired(key, panel.id):
+        if self._cache_log_client.is_cache_expired(key, panel.id, panel):
             signing_policies = await self._authentication.signing_policies()
-            response = self.__make_request(panel, signing_policies)
-            result = self._local_source.save_or_update(response)
-            self._cache_log_client.save_or_update(key, panel.id)
+            with self._validator_client.pending() as validators:
+                response = await self.__make_request(panel, signing_policies)
+            if self._is_not_modified(response):
+                self._cache_log_client.save_or_update(key, panel.id)
+                return
+            self._local_source.save_or_update(
+                response,
+                partial(self.__on_stored, key, panel.id, validators)
+            )
+
+    def __on_stored(self, key: str, identifier: str, validators: List[ValidatorEntity]) -> None:
+        self._cache_log_client.save_or_update(key, identifier)
+        self._validator_client.commit(validators)
 
     @staticmethod
     def _from_entity(entities: List[MovieEntity]) -> Iterable[Movie]:
@@ -358,15 +735,28 @@ class MovieRepository(IRepository):
 
         return map(map_to, entities)
 
+    def flush(self) -> None:
+        """
+        Writes movies which are still waiting to be persisted
+        """
+        self._local_source.flush()
+
     async def all_movies(self) -> Iterable[Movie]:
-        movies = self._local_source.fetch_movie_list()
+        movies = self._local_source.fetch_movie_list(self._projection_fields)
         self._logger.debug("Movie collection: %s", len(movies))
         return self._from_entity(movies)
 
+    def stream_movies(self) -> AsyncIterator[Movie]:
+        return self._stream(self._local_source.stream_movie_list(self._projection_fields))
+
 
 class EpisodeRepository(IRepository):
     _remote_source: CollectionEndpoint
     _local_source: EpisodeDao
+    _projection_fields = (
+        'id', 'channel_id', 'title', 'series_id', 'season_id', 'season_number', 'episode', 'episode_number',
+        'is_mature', 'episode_air_date', 'is_subbed', 'is_dubbed', 'media_type', 'duration_ms'
+    )
 
     def __init__(
             self,
@@ -374,19 +764,26 @@ class EpisodeRepository(IRepository):
             local_source: Thingy,
             logging_client: LoggingUtil,
             cache_log_client: CacheLogUtil,
-            authentication_repository: AuthenticationRepository
+            authentication_repository: AuthenticationRepository,
+            validator_client: ValidatorUtil,
+            non_blocking: bool = False
     ) -> None:
-        super().__init__(remote_source, local_source, logging_client)
+        """
+        :param validator_client: validators captured while requesting a response are only kept once it is stored
+        """
+        super().__init__(remote_source, local_source, logging_client, non_blocking)
         self._cache_log_client = cache_log_client
         self._authentication = authentication_repository
+        self._validator_client = validator_client
 
-    def __make_request(
+    async def __make_request(
             self,
             season: Season,
             signing_policies: List[SigningPolicyEntity]
     ) -> Optional[Dict]:
         try:
-            return self._remote_source.get_episodes_for_season(
+            return await self._execute(
+                self._remote_source.get_episodes_for_season,
                 season_id=season.id,
                 policy=signing_policies[0].value,
                 signature=signing_policies[1].value,
@@ -396,13 +793,21 @@ class EpisodeRepository(IRepository):
             self._logger.error(f"Request failed with reason: {e.doc}", exc_info=e)
             return None
 
-    async def episode(self, season: Season) -> None:
+    async def episode(self, season: Season, force: bool = False) -> None:
+        """
+        :param season: season to request episodes for
+        :param force: request the episodes even if the cache has not expired
+        """
         key = self._local_source.get_collection_name()
-        if self._cache_log_client.is_cache_expired(key, season.id):
+        if force or self._cache_log_client.is_cache_expired(key, season.id, season):
             signing_policies = await self._authentication.signing_policies()
-            response = self.__make_request(season, signing_policies)
-            result = self._local_source.save_or_update(response)
-            self._cache_log_client.save_or_update(key, season.id)
+            with self._validator_client.pending() as validators:
+                response = await self.__make_request(season, signing_policies)
+            if self._is_not_modified(response):
+                self._cache_log_client.save_or_update(key, season.id)
+            elif self._is_acknowledged(self._local_source.save_or_update(response)):
+                self._cache_log_client.save_or_update(key, season.id)
+                self._validator_client.commit(validators)
 
     @staticmethod
     def _from_entity(entities: List[EpisodeEntity]) -> Iterable[Episode]:
@@ -426,7 +831,13 @@ class EpisodeRepository(IRepository):
 
         return map(map_to, entities)
 
+    async def contains_episode(self, season_id: str, episode_number: Optional[int] = None) -> bool:
+        return await self._read(self._local_source.contains_episode, season_id, episode_number)
+
     async def all_episodes(self) -> Iterable[Episode]:
-        episodes = self._local_source.fetch_episode_list()
+        episodes = self._local_source.fetch_episode_list(self._projection_fields)
         self._logger.debug("Episode collection: %s", len(episodes))
         return self._from_entity(episodes)
+
+    def stream_episodes(self) -> AsyncIterator[Episode]:
+        return self._stream(self._local_source.stream_episode_list(self._projection_fields))
@@ -1,4 +1,4 @@
 from .remote_sources import AuthenticationEndpoint, DiscoverEndpoint, CollectionEndpoint, DetailEndpoint
 from .local_sources import IndexDao, PanelDao, SeasonDao, SeriesDao, MovieDao, EpisodeDao, \
-    AuthenticationDao, CacheLogDao
-from .source_utilities import CacheLogUtil
+    AuthenticationDao, CacheLogDao, IndexSnapshotDao, ValidatorDao
+from .source_utilities import CacheLogUtil, ValidatorUtil, ConditionalRequestTemplate
@@ -1,30 +1,31 @@
-from logging import Logger
-from typing import List, Dict, Optional, MutableMapping
+from typing import List, Dict, Optional, MutableMapping, Type, Tuple, Callable, Any, Set, Iterator, Iterable
 
 from bson import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from bson.codec_options import TypeRegistry
 from mongo_thingy import Thingy
 from mongo_thingy.cursor import Cursor
-from pymongo import MongoClient, ReplaceOne, InsertOne
+from pymongo import MongoClient, ReplaceOne, InsertOne, UpdateOne, ASCENDING, DESCENDING
 from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.errors import ConfigurationError
+from pymongo.errors import PyMongoError, BulkWriteError
 from pymongo.results import BulkWriteResult, DeleteResult, UpdateResult
 
 from data import TimeUtil, LoggingUtil, DatabaseUtil
 from data.entity import CacheLogEntity, SigningPolicyEntity, IndexEntity, Entity, PanelEntity, SeasonEntity, \
-    EpisodeEntity, MovieEntity, SeriesEntity
+    EpisodeEntity, MovieEntity, SeriesEntity, ValidatorEntity
 from data.mapper import SigningPolicyMapper, IndexMapper, EpisodeMapper, MovieMapper, SeriesMapper, \
     SeasonMapper, PanelMapper
 from data.model import IndexModel, SigningPolicyModel, PanelModel, SeasonModel, SeriesModel, MovieModel, EpisodeModel, \
     AttributeDict
 from data.type_registry import CoreEntityCodec, PanelEntityCodec, SeriesEntityCodec, SeasonEntityCodec, \
-    MovieEntityCodec, EpisodeEntityCodec
+    MovieEntityCodec, EpisodeEntityCodec, LazyEntity
 
 
 class Dao(Thingy):
     """ Database access object contract """
     __DEFAULT_PROJECTION__: Dict = {'_id': False}
+    _entity_codec: Optional[Type[CoreEntityCodec]] = None
 
     def __init__(
             self,
@@ -37,32 +38,196 @@ class Dao(Thingy):
         self._logger = logger_client.get_default_logger(__name__)
         self._timezone_client = timezone_client
         self._type_codecs = type_codecs
-        self.__start_database(database_client, self._logger)
+        self.__db_collection: Optional[Collection] = None
+        self.__entity_db_collection: Optional[Collection] = None
+        self.__plain_db_collection: Optional[Collection] = None
+        self.__raw_db_collection: Optional[Collection] = None
+        self.__lazy = database_client.should_read_lazily()
+        self.__strict_codecs = database_client.should_use_strict_codecs()
+        self.__batch_size = max(1, database_client.get_write_batch_size())
+        self.__read_batch_size = max(1, database_client.get_read_batch_size())
+        self.__pending_writes: List[Tuple[ReplaceOne, Optional[Callable[[], Any]]]] = []
+        self.__provision = database_client.should_provision_indexes()
+        self.__start_database(database_client)
 
     @classmethod
-    def __start_database(cls, database_client: DatabaseUtil, logger: Logger):
-        __connection_uri = database_client.create_connection_string()
-        cls._client: MongoClient = MongoClient(
-            host=__connection_uri,
-            maxIdleTimeMS=45_000,
-            appname='anime-meta'
-        )
+    def __start_database(cls, database_client: DatabaseUtil):
+        cls._client: MongoClient = database_client.get_client()
+        cls._database = database_client.get_database()
+
+    def provision_indexes(self) -> None:
+        """
+        Creates indexes registered with `add_index` for this collection when `indexes.provision` is set, existing
+        indexes are left untouched. Called once when the application starts rather than when the dao is created,
+        as creating the dependency containers must not wait on the database
+        """
+        if not self.__provision:
+            return
         try:
-            cls._database = cls._client.get_database()
-        except ConfigurationError as e:
-            logger.debug(
-                f'Configuration error prevented database from connecting: {__connection_uri}',
-                exc_info=e
+            self.create_indexes()
+        except PyMongoError as e:
+            self._logger.warning(f'Unable to provision indexes for collection: {self._collection_name}', exc_info=e)
+
+    @property
+    def _db_collection(self) -> Collection:
+        """
+        Collection with codec options for this dao's type codecs, built once and reused
+        :return: Collection for the current database connection
+        """
+        if self.__db_collection is None:
+            self.__db_collection = self.get_db_collection(
+                type_codecs=self._type_codecs
             )
+        return self.__db_collection
 
-    @classmethod
-    def close_database(cls, logger: Logger):
+    @property
+    def _entity_db_collection(self) -> Collection:
+        """
+        Collection which additionally decodes documents with `_entity_codec`, built once and reused. The codec is strict
+        when `validation.strict_codecs` is set
+        :return: Collection for the current database connection
+        """
+        if self.__entity_db_collection is None:
+            self.__entity_db_collection = self.get_db_collection(
+                type_codecs=self._type_codecs + [self._entity_codec(self.__strict_codecs)]
+            )
+        return self.__entity_db_collection
+
+    @property
+    def _plain_db_collection(self) -> Collection:
+        """
+        Collection without any type codecs, documents are returned as `AttributeDict` without nested decoding
+        :return: Collection for the current database connection
+        """
+        if self.__plain_db_collection is None:
+            self.__plain_db_collection = self.get_db_collection(
+                type_codecs=[]
+            )
+        return self.__plain_db_collection
+
+    @property
+    def _raw_db_collection(self) -> Collection:
+        """
+        Collection which returns documents as undecoded `RawBSONDocument`, built once and reused
+        :return: Collection for the current database connection
+        """
+        if self.__raw_db_collection is None:
+            self.__raw_db_collection = self.get_db_collection(
+                type_codecs=[],
+                document_class=RawBSONDocument
+            )
+        return self.__raw_db_collection
+
+    def _find_entities(self, query: Optional[Dict] = None, fields: Optional[Iterable[str]] = None) -> Cursor:
+        """
+        Finds entities, when `fields` are given only those are fetched from the server and no codecs are applied.
+        When lazy reads are enabled documents are left undecoded, see `_load`
+        :param query: Optional filter for the query
+        :param fields: Optional fields required by the caller
+        :return: Cursor over the matching documents
+        """
+        if self.__lazy:
+            projection = dict(self.__DEFAULT_PROJECTION__)
+            if fields is not None:
+                projection.update((field, True) for field in fields)
+            return self._raw_db_collection.find(
+                filter=query,
+                projection=projection
+            )
+        if fields is None:
+            return self._entity_db_collection.find(
+                filter=query,
+                projection=self.__DEFAULT_PROJECTION__
+            )
+        projection = dict(self.__DEFAULT_PROJECTION__)
+        projection.update((field, True) for field in fields)
+        return self._plain_db_collection.find(
+            filter=query,
+            projection=projection
+        )
+
+    @property
+    def read_batch_size(self) -> int:
+        return self.__read_batch_size
+
+    def _load(self, documents: Iterable) -> Iterator:
+        """
+        Wraps documents found by `_find_entities` in a `LazyEntity` when lazy reads are enabled
+        :param documents: Documents to wrap
+        :return: Iterator of entities
+        """
+        if not self.__lazy:
+            return iter(documents)
+        entity_type = self._entity_codec().python_type
+        return (LazyEntity(document, entity_type) for document in documents)
+
+    def _stream(self, query: Optional[Dict] = None, fields: Optional[Iterable[str]] = None) -> Iterator:
+        """
+        Iterates matching entities ordered by `id`, `read_batch_size` at a time. Each page is a separate query which
+        resumes after the last `id` of the previous page and is read completely, so no cursor is left open while
+        callers work through a page, which at the pace of rate limited requests could outlive the server's idle
+        cursor timeout. Streamed collections have a unique index on `id` and `fields` must include it
+        :param query: Optional filter for the query
+        :param fields: Optional fields required by the caller
+        :return: Iterator of entities
+        """
+        last_id: Optional[str] = None
+        while True:
+            page_query = dict(query or {})
+            if last_id is not None:
+                page_query['id'] = {'$gt': last_id}
+            cursor = self._find_entities(query=page_query, fields=fields)
+            page = list(self._load(cursor.sort('id', ASCENDING).limit(self.__read_batch_size)))
+            yield from page
+            if len(page) < self.__read_batch_size:
+                return
+            last_id = page[-1].id
+
+    def _enqueue_write(self, operation: ReplaceOne, on_acknowledged: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Collects a write operation which is flushed together with others once `batch_size` operations are pending
+        :param operation: The write operation
+        :param on_acknowledged: Invoked once the operation has been acknowledged by the database
+        """
+        self.__pending_writes.append((operation, on_acknowledged))
+        if len(self.__pending_writes) >= self.__batch_size:
+            self.flush()
+
+    def flush(self) -> Optional[BulkWriteResult]:
+        """
+        Writes all pending operations in a single unordered bulk write, callbacks are only invoked
+        for operations which succeeded so failed items are not marked as cached
+        :return: Bulk write result, or None if nothing was written
+        """
+        if not self.__pending_writes:
+            return None
+        pending, self.__pending_writes = self.__pending_writes, []
+        failed_indexes: Set[int] = set()
+        bulk_write_result: Optional[BulkWriteResult] = None
         try:
-            cls.client.close()
-            cls._client = None
-            cls._database = None
-        except Exception as e:
-            logger.info(msg='Unable to disconnect from database', exc_info=e)
+            bulk_write_result = self._db_collection.bulk_write(
+                [operation for operation, _ in pending],
+                ordered=False
+            )
+            self._logger.info(
+                f'{self._collection_name} bulk write results -> matched: {bulk_write_result.matched_count} '
+                f'upserted: {bulk_write_result.upserted_count}'
+            )
+        except BulkWriteError as e:
+            failed_indexes = {error['index'] for error in e.details.get('writeErrors', [])}
+            self._logger.warning(
+                f'Unable to persist {len(failed_indexes)} of {len(pending)} items to collection: {self._collection_name}',
+                exc_info=e
+            )
+        except PyMongoError as e:
+            self._logger.warning(
+                f'Unable to persist {len(pending)} items to collection: {self._collection_name}', exc_info=e
+            )
+            return None
+        for index, (_, on_acknowledged) in enumerate(pending):
+            if on_acknowledged is not None and index not in failed_indexes:
+                on_acknowledged()
+        return bulk_write_result
 
     def _get_current_timestamp(self) -> int:
         return self._timezone_client.get_current_timestamp()
@@ -139,9 +304,7 @@ class CacheLogDao(Dao):
 
     def save_or_update_cache_entry(self, cache_log: CacheLogEntity) -> UpdateResult:
         update_filter = self.__create_filter(cache_log)
-        result: UpdateResult = self.get_db_collection(
-            type_codecs=self._type_codecs
-        ).update_one(
+        result: UpdateResult = self._db_collection.update_one(
             filter=update_filter,
             update={
                 '$set': cache_log
@@ -153,15 +316,103 @@ class CacheLogDao(Dao):
         )
         return result
 
+    def save_or_update_cache_entries(self, cache_logs: List[CacheLogEntity]) -> Optional[BulkWriteResult]:
+        """
+        Upserts many cache entries in a single unordered bulk write
+        :param cache_logs: Cache entries to persist
+        :return: Bulk write result, or None if the write failed
+        """
+        update_items = [
+            UpdateOne(
+                filter=self.__create_filter(cache_log),
+                update={
+                    '$set': dict(cache_log)
+                },
+                upsert=True
+            ) for cache_log in cache_logs
+        ]
+        try:
+            bulk_write_result: BulkWriteResult = self._db_collection.bulk_write(update_items, ordered=False)
+            self._logger.debug(
+                f'Cache bulk write results -> matched: {bulk_write_result.matched_count} '
+                f'upserted: {bulk_write_result.upserted_count}'
+            )
+            return bulk_write_result
+        except PyMongoError as e:
+            self._logger.warning(f'Unable to persist {len(update_items)} cache entries', exc_info=e)
+            return None
+
     def get_cache_log_entry(self, search_filter: Dict) -> Optional[CacheLogEntity]:
-        entity: Optional[CacheLogEntity] = self.get_db_collection(
-            type_codecs=self._type_codecs
-        ).find_one(
+        entity: Optional[CacheLogEntity] = self._db_collection.find_one(
             filter=search_filter,
             projection=self.__DEFAULT_PROJECTION__
         )
         return entity
 
+    def get_cache_log_entries(self, collection: str) -> List[AttributeDict]:
+        """
+        Fetches every cache entry of a collection in a single query, only projecting fields needed to check expiry
+        :param collection: Collection as the key of the cache records
+        :return: List of cache entries with `item_id` and `time_stamp`
+        """
+        cursor: Cursor = self._db_collection.find(
+            filter={
+                'collection': collection
+            },
+            projection={
+                '_id': False,
+                'item_id': True,
+                'time_stamp': True
+            }
+        )
+        return list(cursor)
+
+
+CacheLogDao.add_index([('collection', ASCENDING), ('item_id', ASCENDING)])
+
+
+class ValidatorDao(Dao):
+    """
+    `ETag` and `Last-Modified` validators of responses, keyed by request url without signing parameters
+    """
+    _collection_name = 'validator'
+
+    @staticmethod
+    def _map_to_replace_query(entity: ValidatorEntity) -> ReplaceOne:
+        return ReplaceOne(
+            filter={
+                'key': entity.key
+            },
+            replacement=dict(entity),
+            upsert=True
+        )
+
+    def save_or_update_validators(self, validators: List[ValidatorEntity]) -> Optional[BulkWriteResult]:
+        """
+        Writes validators in a single unordered bulk write
+        :param validators: Validators to write
+        :return: Bulk write result, or None if the write failed
+        """
+        if not validators:
+            return None
+        try:
+            return self._db_collection.bulk_write(
+                [self._map_to_replace_query(validator) for validator in validators],
+                ordered=False
+            )
+        except PyMongoError as e:
+            self._logger.warning(f'Unable to persist {len(validators)} validators', exc_info=e)
+            return None
+
+    def fetch_validators(self) -> List[AttributeDict]:
+        cursor: Cursor = self._db_collection.find(
+            projection=self.__DEFAULT_PROJECTION__
+        )
+        return list(cursor)
+
+
+ValidatorDao.add_index([('key', ASCENDING)], unique=True)
+
 
 class AuthenticationDao(Dao):
     _collection_name = 'authentication'
@@ -183,28 +434,24 @@ class AuthenticationDao(Dao):
                 '$lt': self._get_current_timestamp()
             }
         }
-        delete_result: DeleteResult = self.get_db_collection(
-            type_codecs=self._type_codecs
-        ).delete_many(filter=query)
+        delete_result: DeleteResult = self._db_collection.delete_many(filter=query)
         deleted_count = delete_result.deleted_count
         if deleted_count > 0:
             self._logger.info(
                 f'Invalidated database items with query: {query} and returned result: {deleted_count}'
             )
 
-    def contains_valid_sessions(self, path_type: str) -> bool:
+    def contains_valid_sessions(self, path_type: str, min_time_to_live: int = 0) -> bool:
         query = {
             'expires': {
-                '$gt': self._get_current_timestamp()
+                '$gt': self._get_current_timestamp() + min_time_to_live
             },
             'path': {
                 '$regex': f'/{path_type}/',
                 '$options': 'g'
             }
         }
-        valid_session_could = self.get_db_collection(
-            type_codecs=self._type_codecs
-        ).count_documents(query)
+        valid_session_could = self._db_collection.count_documents(query)
         self._logger.debug(f'Query results for query: {query} returned `{valid_session_could}` results')
         return valid_session_could > 0
 
@@ -224,9 +471,7 @@ class AuthenticationDao(Dao):
         entities: List[SigningPolicyEntity] = self.mapper.to_entity(model)
         replacement_items = self.__add_items(entities)
         try:
-            bulk_write_result: BulkWriteResult = self.get_db_collection(
-                type_codecs=self._type_codecs
-            ).bulk_write(replacement_items)
+            bulk_write_result: BulkWriteResult = self._db_collection.bulk_write(replacement_items)
             self._logger.info(
                 f'{self._collection_name} bulk write results -> updated or inserted: {bulk_write_result.upserted_ids}'
             )
@@ -238,19 +483,26 @@ class AuthenticationDao(Dao):
 
     def fetch_policy_matching(self, path_type: str) -> List[SigningPolicyEntity]:
         query = {
+            'expires': {
+                '$gt': self._get_current_timestamp()
+            },
             'path': {
                 '$regex': f'/{path_type}/',
                 '$options': 'g'
             }
         }
-        cursor = self.get_db_collection(
-            type_codecs=self._type_codecs
-        ).find(
-            filter=query, projection=self.__DEFAULT_PROJECTION__
+        # latest policies first, insertion order keeps policy, signature and key pair in the order they were received
+        cursor = self._db_collection.find(
+            filter=query, projection=self.__DEFAULT_PROJECTION__, sort=[('expires', DESCENDING), ('_id', ASCENDING)]
         )
         return list(cursor)
 
 
+AuthenticationDao.add_index([('expires', ASCENDING)])
+# signing policies are removed by the server once they expire
+AuthenticationDao.add_index([('expires_at', ASCENDING)], expireAfterSeconds=0)
+
+
 class IndexDao(Dao):
     _collection_name = 'index'
 
@@ -284,9 +536,7 @@ class IndexDao(Dao):
         entities: List[IndexEntity] = self.mapper.to_entity(models)
         replacement_items = self.__replace_items(entities)
         try:
-            bulk_write_result: BulkWriteResult = self.get_db_collection(
-                type_codecs=self._type_codecs
-            ).bulk_write(replacement_items)
+            bulk_write_result: BulkWriteResult = self._db_collection.bulk_write(replacement_items)
             self._logger.info(
                 f'{self._collection_name} bulk write results -> updated or inserted: {bulk_write_result.upserted_ids}'
             )
@@ -297,16 +547,50 @@ class IndexDao(Dao):
             )
 
     def fetch_index_list(self) -> List[IndexEntity]:
-        cursor: Cursor = self.get_db_collection(
-            type_codecs=self._type_codecs
-        ).find(
+        cursor: Cursor = self._db_collection.find(
             projection=self.__DEFAULT_PROJECTION__
         )
         return list(cursor)
 
 
+IndexDao.add_index([('prefix', ASCENDING)], unique=True)
+
+
+class IndexSnapshotDao(Dao):
+    """
+    Index entries as they were when the panels of each prefix were last stored
+    """
+    _collection_name = 'index_snapshot'
+
+    def save_or_update(self, entity: IndexEntity) -> UpdateResult:
+        return self._db_collection.replace_one(
+            filter={
+                'prefix': entity.prefix
+            },
+            replacement=dict(entity),
+            upsert=True
+        )
+
+    def fetch_snapshot(self) -> Dict[str, int]:
+        """
+        :return: count of each prefix keyed by prefix
+        """
+        cursor: Cursor = self._db_collection.find(
+            projection={
+                '_id': False,
+                'prefix': True,
+                'count': True
+            }
+        )
+        return {document['prefix']: document['count'] for document in cursor}
+
+
+IndexSnapshotDao.add_index([('prefix', ASCENDING)], unique=True)
+
+
 class PanelDao(Dao):
     _collection_name = 'catalogue'
+    _entity_codec = PanelEntityCodec
 
     def __init__(
             self,
@@ -338,9 +622,7 @@ class PanelDao(Dao):
         entities: List[PanelEntity] = self.mapper.to_entity(models)
         replacement_items = self.__replace_items(entities)
         try:
-            bulk_write_result: BulkWriteResult = self.get_db_collection(
-                type_codecs=self._type_codecs
-            ).bulk_write(replacement_items)
+            bulk_write_result: BulkWriteResult = self._db_collection.bulk_write(replacement_items)
             self._logger.info(
                 f'{self._collection_name} bulk write results -> updated or inserted: {bulk_write_result.upserted_ids}'
             )
@@ -350,17 +632,20 @@ class PanelDao(Dao):
                 f'Unable to persist to collection: {self._collection_name} -> {replacement_items}', e
             )
 
-    def fetch_catalogue_list(self) -> List[PanelEntity]:
-        cursor: Cursor = self.get_db_collection(
-            type_codecs=self._type_codecs + [PanelEntityCodec()]
-        ).find(
-            projection=self.__DEFAULT_PROJECTION__
-        )
-        return list(cursor)
+    def fetch_catalogue_list(self, fields: Optional[Iterable[str]] = None) -> List[PanelEntity]:
+        cursor: Cursor = self._find_entities(fields=fields)
+        return list(self._load(cursor))
+
+    def stream_catalogue_list(self, fields: Optional[Iterable[str]] = None) -> Iterator[PanelEntity]:
+        return self._stream(fields=fields)
+
+
+PanelDao.add_index([('id', ASCENDING)], unique=True)
 
 
 class SeasonDao(Dao):
     _collection_name = 'season'
+    _entity_codec = SeasonEntityCodec
 
     def __init__(
             self,
@@ -392,9 +677,7 @@ class SeasonDao(Dao):
         entities: List[SeasonEntity] = self.mapper.to_entity(models)
         replacement_items = self.__replace_items(entities)
         try:
-            bulk_write_result: BulkWriteResult = self.get_db_collection(
-                type_codecs=self._type_codecs
-            ).bulk_write(replacement_items)
+            bulk_write_result: BulkWriteResult = self._db_collection.bulk_write(replacement_items)
             self._logger.info(
                 f'{self._collection_name} bulk write results -> updated or inserted: {bulk_write_result.upserted_ids}'
             )
@@ -404,17 +687,46 @@ class SeasonDao(Dao):
                 f'Unable to persist to collection: {self._collection_name} -> {replacement_items}', e
             )
 
-    def fetch_season_list(self) -> List[SeasonEntity]:
-        cursor: Cursor = self.get_db_collection(
-            type_codecs=self._type_codecs + [SeasonEntityCodec()]
-        ).find(
-            projection=self.__DEFAULT_PROJECTION__
+    def fetch_season_list(self, fields: Optional[Iterable[str]] = None) -> List[SeasonEntity]:
+        cursor: Cursor = self._find_entities(fields=fields)
+        return list(self._load(cursor))
+
+    def stream_season_list(self, fields: Optional[Iterable[str]] = None) -> Iterator[SeasonEntity]:
+        return self._stream(fields=fields)
+
+    def fetch_season_list_for_series(
+            self,
+            series_id: str,
+            fields: Optional[Iterable[str]] = None
+    ) -> List[SeasonEntity]:
+        cursor: Cursor = self._find_entities(
+            query={
+                'series_id': series_id
+            },
+            fields=fields
         )
-        return list(cursor)
+        return list(self._load(cursor))
+
+    def contains_season(self, series_id: str, season_number: int) -> bool:
+        """
+        :param series_id: Series the season belongs to
+        :param season_number: Number of the season
+        :return: True if the season has been stored
+        """
+        query = {
+            'series_id': series_id,
+            'season_number': season_number
+        }
+        return self._db_collection.count_documents(query, limit=1) > 0
+
+
+SeasonDao.add_index([('id', ASCENDING)], unique=True)
+SeasonDao.add_index([('series_id', ASCENDING), ('season_number', ASCENDING)])
 
 
 class SeriesDao(Dao):
     _collection_name = 'series'
+    _entity_codec = SeriesEntityCodec
 
     def __init__(
             self,
@@ -437,33 +749,38 @@ class SeriesDao(Dao):
             upsert=True
         )
 
-    def save_or_update(self, response: SeriesModel) -> BulkWriteResult:
-        entity = self.mapper.to_entity(response)
-        replacement_items = [self._map_to_replace_query(entity)]
-        try:
-            bulk_write_result: BulkWriteResult = self.get_db_collection(
-                type_codecs=self._type_codecs
-            ).bulk_write(replacement_items)
-            self._logger.info(
-                f'{self._collection_name} bulk write results -> updated or inserted: {bulk_write_result.upserted_ids}'
-            )
-            return bulk_write_result
-        except Exception as e:
-            self._logger.warning(
-                f'Unable to persist to collection: {self._collection_name} -> {replacement_items}', e
-            )
+    def save_or_update(self, response: SeriesModel, on_acknowledged: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Queues the response for a batched write, call `flush` to write any remaining items
+        :param response: Response to persist
+        :param on_acknowledged: Invoked once the item has been written
+        """
+        entity: SeriesEntity = self.mapper.to_entity(response)
+        self._enqueue_write(self._map_to_replace_query(entity), on_acknowledged)
 
-    def fetch_series_list(self) -> List[SeriesEntity]:
-        cursor: Cursor = self.get_db_collection(
-            type_codecs=self._type_codecs + [SeriesEntityCodec()]
-        ).find(
-            projection=self.__DEFAULT_PROJECTION__
+    def fetch_series_list(self, fields: Optional[Iterable[str]] = None) -> List[SeriesEntity]:
+        cursor: Cursor = self._find_entities(fields=fields)
+        return list(self._load(cursor))
+
+    def stream_series_list(self, fields: Optional[Iterable[str]] = None) -> Iterator[SeriesEntity]:
+        return self._stream(fields=fields)
+
+    def fetch_series(self, series_id: str, fields: Optional[Iterable[str]] = None) -> Optional[SeriesEntity]:
+        cursor: Cursor = self._find_entities(
+            query={
+                'id': series_id
+            },
+            fields=fields
         )
-        return list(cursor)
+        return next(self._load(cursor.limit(1)), None)
+
+
+SeriesDao.add_index([('id', ASCENDING)], unique=True)
 
 
 class MovieDao(Dao):
     _collection_name = 'movie'
+    _entity_codec = MovieEntityCodec
 
     def __init__(
             self,
@@ -486,33 +803,29 @@ class MovieDao(Dao):
             upsert=True
         )
 
-    def save_or_update(self, response: MovieModel) -> BulkWriteResult:
+    def save_or_update(self, response: MovieModel, on_acknowledged: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Queues the response for a batched write, call `flush` to write any remaining items
+        :param response: Response to persist
+        :param on_acknowledged: Invoked once the item has been written
+        """
         entity: MovieEntity = self.mapper.to_entity(response)
-        replacement_items = [self._map_to_replace_query(entity)]
-        try:
-            bulk_write_result: BulkWriteResult = self.get_db_collection(
-                type_codecs=self._type_codecs
-            ).bulk_write(replacement_items)
-            self._logger.info(
-                f'{self._collection_name} bulk write results -> updated or inserted: {bulk_write_result.upserted_ids}'
-            )
-            return bulk_write_result
-        except Exception as e:
-            self._logger.warning(
-                f'Unable to persist to collection: {self._collection_name} -> {replacement_items}', e
-            )
+        self._enqueue_write(self._map_to_replace_query(entity), on_acknowledged)
 
-    def fetch_movie_list(self) -> List[MovieEntity]:
-        cursor: Cursor = self.get_db_collection(
-            type_codecs=self._type_codecs + [MovieEntityCodec()]
-        ).find(
-            projection=self.__DEFAULT_PROJECTION__
-        )
-        return list(cursor)
+    def fetch_movie_list(self, fields: Optional[Iterable[str]] = None) -> List[MovieEntity]:
+        cursor: Cursor = self._find_entities(fields=fields)
+        return list(self._load(cursor))
+
+    def stream_movie_list(self, fields: Optional[Iterable[str]] = None) -> Iterator[MovieEntity]:
+        return self._stream(fields=fields)
+
+
+MovieDao.add_index([('id', ASCENDING)], unique=True)
 
 
 class EpisodeDao(Dao):
     _collection_name = 'episode'
+    _entity_codec = EpisodeEntityCodec
 
     def __init__(
             self,
@@ -544,9 +857,7 @@ class EpisodeDao(Dao):
         entities: List[EpisodeEntity] = self.mapper.to_entity(models)
         replacement_items = self.__replace_items(entities)
         try:
-            bulk_write_result: BulkWriteResult = self.get_db_collection(
-                type_codecs=self._type_codecs
-            ).bulk_write(replacement_items)
+            bulk_write_result: BulkWriteResult = self._db_collection.bulk_write(replacement_items)
             self._logger.info(
                 f'{self._collection_name} bulk write results -> updated or inserted: {bulk_write_result.upserted_ids}'
             )
@@ -556,10 +867,26 @@ class EpisodeDao(Dao):
                 f'Unable to persist to collection: {self._collection_name} -> {replacement_items}', e
             )
 
-    def fetch_episode_list(self) -> List[EpisodeEntity]:
-        cursor: Cursor = self.get_db_collection(
-            type_codecs=self._type_codecs + [EpisodeEntityCodec()]
-        ).find(
-            projection=self.__DEFAULT_PROJECTION__
-        )
-        return list(cursor)
+    def fetch_episode_list(self, fields: Optional[Iterable[str]] = None) -> List[EpisodeEntity]:
+        cursor: Cursor = self._find_entities(fields=fields)
+        return list(self._load(cursor))
+
+    def stream_episode_list(self, fields: Optional[Iterable[str]] = None) -> Iterator[EpisodeEntity]:
+        return self._stream(fields=fields)
+
+    def contains_episode(self, season_id: str, episode_number: Optional[int] = None) -> bool:
+        """
+        :param season_id: Season the episode belongs to
+        :param episode_number: Optional number of the episode, when omitted any episode of the season matches
+        :return: True if a matching episode has been stored
+        """
+        query: Dict[str, Any] = {
+            'season_id': season_id
+        }
+        if episode_number is not None:
+            query['episode_number'] = episode_number
+        return self._db_collection.count_documents(query, limit=1) > 0
+
+
+EpisodeDao.add_index([('id', ASCENDING)], unique=True)
+EpisodeDao.add_index([('season_id', ASCENDING), ('episode_number', ASCENDING)])
@@ -1,7 +1,11 @@
 from logging import Logger
 
 from marshmallow import EXCLUDE
-from uplink import get, timeout, retry, ratelimit, Consumer, Query, Path, error_handler
+from uplink import get, timeout, retry, Consumer, Query, Path, error_handler
+from uplink.clients.io import RequestTemplate, transitions
+from uplink.decorators import MethodAnnotation
+
+from data import RateLimitUtil
 
 from data.model import SigningPolicyContainerSchema, IndexContainerSchema, CollectionContainerSchema, \
     MovieSchema, SeriesSchema, EpisodeContainerSchema, SeasonContainerSchema
@@ -9,7 +13,6 @@ from data.model import SigningPolicyContainerSchema, IndexContainerSchema, Colle
 
 __TIME_OUT__: int = 25
 __MAX_ATTEMPTS__: int = 5
-__RATE_LIMIT_CALLS__: int = 5
 __RATE_LIMIT_PERIOD_CALLS__: int = 10
 
 
@@ -22,6 +25,72 @@ def raise_api_error(exc_type, exc_val, exc_tb):
     logger.warning(msg="Exception caught")
 
 
+class RateLimitTemplate(RequestTemplate):
+    """
+    Takes a token from the shared rate limiter before every attempt of a request, throttled responses are
+    reported to the limiter and retried once it allows requests again
+    """
+
+    def __init__(self, limiter: RateLimitUtil) -> None:
+        self._limiter = limiter
+        self._is_queued = False
+        self._throttled_attempts = 0
+
+    def __leave_queue(self) -> None:
+        if self._is_queued:
+            self._limiter.leave_queue()
+            self._is_queued = False
+
+    def before_request(self, request):
+        delay = self._limiter.reserve()
+        if delay <= 0:
+            self.__leave_queue()
+            return None
+        if not self._is_queued:
+            self._limiter.enter_queue()
+            self._is_queued = True
+        return transitions.sleep(delay)
+
+    def after_response(self, request, response):
+        delay = self._limiter.on_response(response.status_code, response.headers.get('Retry-After'))
+        if delay is None or self._throttled_attempts >= __MAX_ATTEMPTS__:
+            return None
+        self._throttled_attempts += 1
+        return transitions.sleep(delay)
+
+    def after_exception(self, request, exc_type, exc_val, exc_tb):
+        self.__leave_queue()
+        return None
+
+
+# noinspection PyPep8Naming
+class shared_ratelimit(MethodAnnotation):
+    """
+    Rate limits a consumer through the process wide `RateLimitUtil`, so that every endpoint draws from the same quota
+    """
+
+    def modify_request(self, request_builder):
+        from di import UtilityClientScopeProvider
+        request_builder.add_request_template(
+            RateLimitTemplate(UtilityClientScopeProvider.rate_limit_client())
+        )
+
+
+# noinspection PyPep8Naming
+class conditional(MethodAnnotation):
+    """
+    Sends conditional requests using the validators of previous responses when `network.conditional` is enabled,
+    responses answered with 304 are converted to `NOT_MODIFIED`
+    """
+
+    def modify_request(self, request_builder):
+        from di import SourceUtilityProvider
+        from .source_utilities import ConditionalRequestTemplate
+        validator_client = SourceUtilityProvider.validator_client()
+        if validator_client.is_enabled():
+            request_builder.add_request_template(ConditionalRequestTemplate(validator_client))
+
+
 @timeout(
     seconds=__TIME_OUT__
 )
@@ -31,10 +100,7 @@ def raise_api_error(exc_type, exc_val, exc_tb):
     stop=retry.stop.after_attempt(__MAX_ATTEMPTS__) | retry.stop.after_delay(__RATE_LIMIT_PERIOD_CALLS__),
     backoff=retry.backoff.jittered(multiplier=0.5)
 )
-@ratelimit(
-    calls=__RATE_LIMIT_CALLS__,
-    period=__RATE_LIMIT_PERIOD_CALLS__
-)
+@shared_ratelimit()
 class AuthenticationEndpoint(Consumer):
 
     @get("index")
@@ -55,10 +121,8 @@ class AuthenticationEndpoint(Consumer):
     stop=retry.stop.after_attempt(__MAX_ATTEMPTS__) | retry.stop.after_delay(__RATE_LIMIT_PERIOD_CALLS__),
     backoff=retry.backoff.jittered(multiplier=0.5)
 )
-@ratelimit(
-    calls=__RATE_LIMIT_CALLS__,
-    period=__RATE_LIMIT_PERIOD_CALLS__
-)
+@shared_ratelimit()
+@conditional()
 class DiscoverEndpoint(Consumer):
 
     @get("browse/index")
@@ -139,10 +203,8 @@ class DiscoverEndpoint(Consumer):
     stop=retry.stop.after_attempt(__MAX_ATTEMPTS__) | retry.stop.after_delay(__RATE_LIMIT_PERIOD_CALLS__),
     backoff=retry.backoff.jittered(multiplier=0.5)
 )
-@ratelimit(
-    calls=__RATE_LIMIT_CALLS__,
-    period=__RATE_LIMIT_PERIOD_CALLS__
-)
+@shared_ratelimit()
+@conditional()
 class CollectionEndpoint(Consumer):
 
     @get("seasons")
@@ -209,10 +271,8 @@ class CollectionEndpoint(Consumer):
     stop=retry.stop.after_attempt(__MAX_ATTEMPTS__) | retry.stop.after_delay(__RATE_LIMIT_PERIOD_CALLS__),
     backoff=retry.backoff.jittered(multiplier=0.5)
 )
-@ratelimit(
-    calls=__RATE_LIMIT_CALLS__,
-    period=__RATE_LIMIT_PERIOD_CALLS__
-)
+@shared_ratelimit()
+@conditional()
 class DetailEndpoint(Consumer):
 
     @get("series/{series_id}")
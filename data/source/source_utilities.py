@@ -1,17 +1,80 @@
-from typing import Optional
+from asyncio import get_running_loop, TimerHandle
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import monotonic
+from typing import Optional, Dict, Tuple, Set, Union, List, Iterator, Mapping, Any
+from urllib.parse import urlencode
+
+from uplink.clients.io import RequestTemplate
 
 from data import LoggingUtil, TimeUtil
-from data.entity import CacheLogEntity
-from data.source import CacheLogDao
+from data.entity import CacheLogEntity, ValidatorEntity
+from data.source import CacheLogDao, ValidatorDao
+from domain.entity import Panel, Season, Series
+from domain.model import Cache, Freshness
 
 
 class CacheLogUtil(object):
-    __DEFAULT_CACHE_DURATION: int = 60 * 60 * 24 * 2  # 2 days cache time before our next request
+    __SECONDS_PER_DAY: int = 60 * 60 * 24
 
-    def __init__(self, local_source: CacheLogDao, logging_client: LoggingUtil, timezone_client: TimeUtil) -> None:
+    def __init__(
+            self,
+            local_source: CacheLogDao,
+            logging_client: LoggingUtil,
+            timezone_client: TimeUtil,
+            cache: Cache,
+            freshness: Freshness
+    ) -> None:
+        """
+        :param cache: cache behaviour, `preload` serves expiry checks from an in-memory snapshot of each collection
+         while `buffer_size` and `flush_interval` control how cache updates are batched before being written.
+         Within a running event loop buffered entries are flushed by a timer at the latest `flush_interval` seconds
+         after the first of them was buffered, outside of one the interval is only checked on write
+        :param freshness: seconds before an item is requested again, depending on the metadata stored for the item
+        """
         self._local_source = local_source
         self._timezone_client = timezone_client
         self._logger = logging_client.get_default_logger(__name__)
+        self._freshness = freshness
+        self._preload = cache.preload
+        self._buffer_size = max(1, cache.buffer_size)
+        self._flush_interval = cache.flush_interval
+        self._snapshot: Dict[Tuple[str, Optional[str]], int] = {}
+        self._preloaded_collections: Set[str] = set()
+        self._buffer: Dict[Tuple[str, Optional[str]], CacheLogEntity] = {}
+        self._last_flush = monotonic()
+        self._flush_timer: Optional[TimerHandle] = None
+
+    def __on_flush_timer(self) -> None:
+        self._flush_timer = None
+        self.flush()
+
+    def __schedule_flush(self) -> None:
+        """
+        Flushes the buffer `flush_interval` seconds from now on the running event loop, unless a flush is already
+        scheduled, so that entries do not wait on further writes when requests slow down
+        """
+        if self._flush_timer is not None:
+            return
+        try:
+            loop = get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_timer = loop.call_later(self._flush_interval, self.__on_flush_timer)
+
+    def __preload_collection(self, collection: str) -> None:
+        """
+        Loads every cache entry for the given collection into the in-memory snapshot, once per collection
+        :param collection: Collection as the key of the cache record
+        """
+        if collection in self._preloaded_collections:
+            return
+        entries = self._local_source.get_cache_log_entries(collection)
+        for entry in entries:
+            self._snapshot[(collection, entry.get('item_id'))] = entry['time_stamp']
+        self._preloaded_collections.add(collection)
+        self._logger.info(f'Preloaded {len(entries)} cache entries for collection: `{collection}`')
 
     def get_cache_log(self, collection: str, identifier: Optional[str] = None) -> Optional[CacheLogEntity]:
         """
@@ -20,6 +83,15 @@ class CacheLogUtil(object):
         :param identifier: Optional identifier for the request if it is id driven
         :return: CacheLog entry
         """
+        if self._preload:
+            self.__preload_collection(collection)
+            time_stamp = self._snapshot.get((collection, identifier))
+            if time_stamp is None:
+                return None
+            return CacheLogEntity(collection, time_stamp, identifier)
+        buffered = self._buffer.get((collection, identifier))
+        if buffered is not None:
+            return buffered
         if identifier is not None:
             search_filter = {
                 'collection': collection,
@@ -34,22 +106,95 @@ class CacheLogUtil(object):
 
     def save_or_update(self, collection: str, identifier: Optional[str] = None) -> bool:
         """
-        Save or update for the given parameters
+        Save or update for the given parameters, the entry is buffered and written once the buffer is full
+        or `flush_interval` has elapsed, see `__init__`. Callers must only record entries for items which have been
+        persisted
         :param collection: Collection as the key of the cache record
         :param identifier: Optional identifier for the request if it is id driven
         :return: True if operation was successful, otherwise False
         """
         time_stamp = self._timezone_client.get_current_timestamp()
         self._logger.debug(f'Saving or updating cache state -> collection: `{collection}` timestamp: `{time_stamp}`')
-        cache_log = CacheLogEntity(collection, time_stamp, identifier)
-        result = self._local_source.save_or_update_cache_entry(cache_log)
-        return result.acknowledged
+        self._buffer[(collection, identifier)] = CacheLogEntity(collection, time_stamp, identifier)
+        if self._preload:
+            self._snapshot[(collection, identifier)] = time_stamp
+        if len(self._buffer) >= self._buffer_size or monotonic() - self._last_flush >= self._flush_interval:
+            return self.flush()
+        self.__schedule_flush()
+        return True
+
+    def flush(self) -> bool:
+        """
+        Writes all buffered cache entries in a single bulk write, entries which could not be written
+        are kept in the buffer for the next flush unless they have been replaced by a newer entry
+        :return: True if operation was successful, otherwise False
+        """
+        self._last_flush = monotonic()
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._buffer:
+            return True
+        pending, self._buffer = self._buffer, {}
+        result = self._local_source.save_or_update_cache_entries(list(pending.values()))
+        if result is None or not result.acknowledged:
+            for key, cache_log in pending.items():
+                self._buffer.setdefault(key, cache_log)
+            self.__schedule_flush()
+            return False
+        self._logger.debug(f'Flushed {len(pending)} cache entries')
+        return True
+
+    def __days_since(self, time_unit: str) -> Optional[float]:
+        """
+        :param time_unit: time formatted as `TimeUtil.TIME_FORMAT_TEMPLATE`
+        :return: days elapsed since the given time, or None if it could not be parsed
+        """
+        try:
+            time_stamp = self._timezone_client.from_date_time_to_time_stamp(
+                self._timezone_client.as_local_time(time_unit)
+            )
+        except ValueError:
+            self._logger.debug(f'Unable to parse time: `{time_unit}`')
+            return None
+        return (self._timezone_client.get_current_timestamp() - time_stamp) / self.__SECONDS_PER_DAY
 
-    def is_cache_expired(self, collection: str, identifier: Optional[str] = None) -> bool:
+    def get_cache_duration(self, item: Optional[Union[Panel, Season, Series]] = None) -> int:
+        """
+        Picks the freshness policy for an item, airing simulcasts first, then new or recently published items and
+        finally items which have not been published to in a long time. Items without metadata use the default
+        :param item: Optional item the cache record belongs to
+        :return: number of seconds before the item should be requested again
+        """
+        if item is None:
+            return self._freshness.default
+        if item.is_simulcast:
+            return self._freshness.simulcast
+        if getattr(item, 'new', False):
+            return self._freshness.recent
+        last_public = getattr(item, 'last_public', None)
+        if last_public:
+            days = self.__days_since(last_public)
+            if days is not None:
+                if days <= self._freshness.recent_days:
+                    return self._freshness.recent
+                if days >= self._freshness.archived_days:
+                    return self._freshness.archived
+        return self._freshness.default
+
+    def is_cache_expired(
+            self,
+            collection: str,
+            identifier: Optional[str] = None,
+            item: Optional[Union[Panel, Season, Series]] = None,
+            duration: Optional[int] = None
+    ) -> bool:
         """
         State of the cache for given parameters
         :param collection: Collection as the key of the cache record
         :param identifier: Optional identifier for the request if it is id driven
+        :param item: Optional item the cache record belongs to, used to pick its freshness policy
+        :param duration: Optional number of seconds the cache is valid for, overrides the freshness policy
         :return: True if cache has expired, otherwise False
         """
         cache_log = self.get_cache_log(collection, identifier)
@@ -57,6 +202,131 @@ class CacheLogUtil(object):
             cache_time = cache_log.time_stamp
             current_time = self._timezone_client.get_current_timestamp()
             difference = current_time - cache_time
-            has_expired = difference > self.__DEFAULT_CACHE_DURATION
+            if duration is None:
+                duration = self.get_cache_duration(item)
+            has_expired = difference > duration
             return has_expired
         return True
+
+
+class ValidatorUtil(object):
+    """
+    Store of `ETag` and `Last-Modified` validators used to send conditional requests. Validators captured from a
+    response are only kept once the caller has stored the response, otherwise a later 304 would skip data which was
+    never written, see `pending` and `commit`
+    """
+    # query parameters which sign a request, they change with every signing policy and are left out of keys
+    __SIGNING_PARAMETERS = frozenset(('Policy', 'Signature', 'Key-Pair-Id'))
+    __pending: ContextVar[Optional[List[ValidatorEntity]]] = ContextVar('pending_validators', default=None)
+
+    def __init__(self, local_source: ValidatorDao, logging_client: LoggingUtil, enabled: bool) -> None:
+        """
+        :param enabled: whether consumers send conditional requests, see `network.conditional`
+        """
+        self._local_source = local_source
+        self._logger = logging_client.get_default_logger(__name__)
+        self._enabled = enabled
+        self._lock = Lock()
+        self._validators: Optional[Dict[str, ValidatorEntity]] = None
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    @classmethod
+    def create_key(cls, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        :param url: url of the request
+        :param params: query parameters of the request
+        :return: url with the query parameters which do not sign the request, in a stable order
+        """
+        if not params:
+            return url
+        query = sorted((name, value) for name, value in params.items() if name not in cls.__SIGNING_PARAMETERS)
+        if not query:
+            return url
+        return f'{url}?{urlencode(query)}'
+
+    def __get_validators(self) -> Dict[str, ValidatorEntity]:
+        with self._lock:
+            if self._validators is None:
+                self._validators = {
+                    document['key']: ValidatorEntity(document['key'], document['etag'], document['last_modified'])
+                    for document in self._local_source.fetch_validators()
+                }
+                self._logger.info(f'Loaded {len(self._validators)} validators')
+            return self._validators
+
+    def get_validator(self, key: str) -> Optional[ValidatorEntity]:
+        return self.__get_validators().get(key)
+
+    @contextmanager
+    def pending(self) -> Iterator[List[ValidatorEntity]]:
+        """
+        Collects validators captured by requests made within the context, for the caller to `commit` once the
+        responses have been stored. Requests running on an executor must be run in a copy of the current context
+        :return: validators captured so far
+        """
+        validators: List[ValidatorEntity] = []
+        token = self.__pending.set(validators)
+        try:
+            yield validators
+        finally:
+            self.__pending.reset(token)
+
+    def capture(self, validator: ValidatorEntity) -> None:
+        """
+        Holds the validator until it is committed when a `pending` context is active, otherwise keeps it right away
+        :param validator: validator of a response
+        """
+        validators = self.__pending.get()
+        if validators is not None:
+            validators.append(validator)
+        else:
+            self.commit([validator])
+
+    def commit(self, validators: List[ValidatorEntity]) -> None:
+        """
+        Keeps validators of responses which have been stored
+        :param validators: validators to keep
+        """
+        if not validators:
+            return
+        stored = self.__get_validators()
+        with self._lock:
+            for validator in validators:
+                stored[validator.key] = validator
+        self._local_source.save_or_update_validators(validators)
+
+
+class ConditionalRequestTemplate(RequestTemplate):
+    """
+    Adds `If-None-Match` and `If-Modified-Since` headers from stored validators to a request, and captures the
+    validators of successful responses
+    """
+    __OK_STATUS: int = 200
+
+    def __init__(self, validator_client: ValidatorUtil) -> None:
+        self._validator_client = validator_client
+
+    def before_request(self, request):
+        _, url, extras = request
+        validator = self._validator_client.get_validator(
+            self._validator_client.create_key(url, extras.get('params'))
+        )
+        if validator is not None:
+            headers = extras.setdefault('headers', {})
+            if validator.etag:
+                headers['If-None-Match'] = validator.etag
+            if validator.last_modified:
+                headers['If-Modified-Since'] = validator.last_modified
+        return None
+
+    def after_response(self, request, response):
+        if response.status_code != self.__OK_STATUS:
+            return None
+        etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        if etag or last_modified:
+            _, url, extras = request
+            key = self._validator_client.create_key(url, extras.get('params'))
+            self._validator_client.capture(ValidatorEntity(key, etag, last_modified))
+        return None
@@ -1,4 +1,5 @@
 from .type_registries import CoreEntityCodec, CacheLogEntityCodec, SigningPolicyEntityCodec, \
     IndexEntityCodec, AdBreakEntityCodec, EpisodeEntityCodec, SeasonEntityCodec, SeriesEntityCodec, \
     ImageContainerEntityCodec, MoviePanelEntityCodec, SearchMetaEntityCodec, SeriesPanelEntityCodec, \
-    ImageEntityCodec, MovieEntityCodec, PanelEntityCodec
+    ImageEntityCodec, MovieEntityCodec, PanelEntityCodec, ValidatorEntityCodec
+from .lazy_entities import LazyEntity
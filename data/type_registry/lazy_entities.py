@@ -0,0 +1,65 @@
+from dataclasses import fields
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from bson import decode
+from bson.raw_bson import RawBSONDocument
+
+from data.entity import Entity
+from data.mapper.compilers import compile_field_decoders, compile_decoder
+
+
+class LazyEntity(Entity):
+    """
+    Read only entity backed by a `RawBSONDocument`, the document bytes are decoded on first access and each field is
+    only converted when it is read, so nested entities such as images are never built for callers that only read
+    scalar fields. The bytes are decoded with `bson.decode` rather than through the `RawBSONDocument` mapping, which
+    inflates nested documents in python and is slower than decoding them in one pass
+    """
+    __slots__ = ('_document', '_entity_type', '_decoders', '_fields', '_values')
+
+    def __init__(self, document: RawBSONDocument, entity_type: type) -> None:
+        """
+        :param document: raw document as returned by the database
+        :param entity_type: entity dataclass which describes the fields of the document
+        """
+        self._document = document
+        self._entity_type = entity_type
+        self._decoders: Dict[str, Callable[[Any], Any]] = compile_field_decoders(entity_type)
+        self._fields: Optional[Dict[str, Any]] = None
+        self._values: Dict[str, Any] = {}
+
+    def __decoded_fields(self) -> Dict[str, Any]:
+        """
+        Decodes the document bytes once, nested documents are left as dictionaries
+        :return: top level fields of the document
+        """
+        if self._fields is None:
+            self._fields = decode(self._document.raw)
+        return self._fields
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._values:
+            return self._values[name]
+        decoder = self._decoders.get(name)
+        if decoder is None:
+            raise AttributeError(f"'{self._entity_type.__name__}' has no attribute '{name}'")
+        try:
+            value = decoder(self.__decoded_fields())
+        except KeyError as e:
+            raise AttributeError(f"'{self._entity_type.__name__}' document has no field '{name}'") from e
+        self._values[name] = value
+        return value
+
+    def __iter__(self) -> Iterable:
+        for field in fields(self._entity_type):
+            yield field.name, getattr(self, field.name)
+
+    def __repr__(self) -> str:
+        return f'LazyEntity({self._entity_type.__name__}, {self._document.raw!r})'
+
+    def to_entity(self) -> Entity:
+        """
+        Decodes every field of the document
+        :return: the fully built entity
+        """
+        return compile_decoder(self._entity_type)(self.__decoded_fields())
@@ -1,13 +1,15 @@
 from abc import ABC, abstractproperty
-from typing import Dict, Optional
+from typing import Dict, Optional, Callable
 from bson.codec_options import TypeCodec
 from dacite import from_dict, Config, MissingValueError
 from dacite.dataclasses import DefaultValueNotFoundError
 from marshmallow import Schema
 
+from data.mapper.compilers import compile_encoder, compile_decoder
+
 from data.entity import Entity, CacheLogEntity, IndexEntity, SigningPolicyEntity, SeriesPanelEntity, \
     MoviePanelEntity, SearchMetaEntity, ImageEntity, ImageContainerEntity, PanelEntity, AdBreakEntity, \
-    EpisodeEntity, SeasonEntity, SeriesEntity, MovieEntity
+    EpisodeEntity, SeasonEntity, SeriesEntity, MovieEntity, ValidatorEntity
 
 from data.model import SigningPolicySchema, IndexSchema, SeriesPanelMetaSchema, MoviePanelMetaSchema, \
     SearchMetaSchema, ImageSchema, ImageContainerSchema, PanelSchema, AdBreakSchema, EpisodeSchema, \
@@ -15,11 +17,25 @@ from data.model import SigningPolicySchema, IndexSchema, SeriesPanelMetaSchema,
 
 
 class CoreEntityCodec(TypeCodec, ABC):
-    """Base entity codec"""
+    """
+    Base entity codec, by default values are converted by functions compiled once from the dataclass fields
+    of `python_type`. Strict codecs use `_schema_type` and dacite instead, which validates types on every value
+    """
     _config: Optional[Config] = None
 
+    def __init__(self, strict: bool = False) -> None:
+        """
+        :param strict: when True values are dumped through `_schema_type` and type checked by dacite when read
+        """
+        self._strict = strict
+        self._encode: Callable[[Entity], Dict] = compile_encoder(self.python_type)
+        self._decode: Callable[[Dict], Entity] = compile_decoder(self.python_type)
+
     def transform_python(self, value: Entity) -> Dict:
         """Convert the given Python object into something serializable."""
+        if not self._strict:
+            return self._encode(value)
+
         if self._schema_type:
             _schema_type: type = self._schema_type
             # noinspection PyTypeChecker
@@ -31,6 +47,9 @@ class CoreEntityCodec(TypeCodec, ABC):
 
     def transform_bson(self, value: Dict) -> Entity:
         """Convert the given BSON value into our own type."""
+        if not self._strict:
+            return self._decode(value)
+
         try:
             return from_dict(
                 data_class=self.python_type,
@@ -66,9 +85,23 @@ class CacheLogEntityCodec(CoreEntityCodec):
         return CacheLogEntity
 
 
+class ValidatorEntityCodec(CoreEntityCodec):
+
+    @property
+    def _schema_type(self) -> Optional[type]:
+        """The schema type to be used to convert value objects to `bson_type`"""
+        return None
+
+    @property
+    def python_type(self) -> type:
+        """The Python type to be converted into something serializable."""
+        return ValidatorEntity
+
+
 class SigningPolicyEntityCodec(CoreEntityCodec):
 
-    def __init__(self) -> None:
+    def __init__(self, strict: bool = False) -> None:
+        super().__init__(strict)
         self._config = Config()
 
     @property
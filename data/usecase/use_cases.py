@@ -1,11 +1,95 @@
-from typing import Iterable
+from asyncio import Semaphore, ensure_future, gather, Task
+from functools import partial
+from typing import Iterable, Callable, Awaitable, Any, TypeVar, Union, AsyncIterable, AsyncIterator, Set
 
+from data import LoggingUtil
 from data.repository import AuthenticationRepository, IndexRepository, PanelRepository, SeasonRepository, \
     SeriesRepository, MovieRepository, EpisodeRepository
 from domain.entity import Index, Panel, Season, Series
+from domain.repository import CommonRepository
 from domain.usecase import CommonUseCase
 from domain.model import LoginQuery
 
+T = TypeVar('T')
+
+
+class ConcurrentUseCase(CommonUseCase):
+    """
+    Use case that fans out repository calls across a bounded number of concurrent tasks
+    """
+
+    def __init__(self, repository: CommonRepository, logging_client: LoggingUtil, concurrency_limit: int = 1) -> None:
+        """
+        :param repository: repository for the use case
+        :param logging_client: logging utility
+        :param concurrency_limit: maximum number of items that may be in flight at the same time
+        """
+        super().__init__(repository, logging_client)
+        self._concurrency_limit = max(1, concurrency_limit)
+
+    @property
+    def concurrency_limit(self) -> int:
+        return self._concurrency_limit
+
+    @staticmethod
+    async def _filter(
+            predicate: Callable[[T], bool],
+            items: Union[Iterable[T], AsyncIterable[T]]
+    ) -> AsyncIterator[T]:
+        """
+        Filters either a regular or an asynchronous iterable without consuming it upfront
+        :param predicate: items for which this returns True are kept
+        :param items: items to filter
+        :return: Async iterator of matching items
+        """
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                if predicate(item):
+                    yield item
+        else:
+            for item in items:
+                if predicate(item):
+                    yield item
+
+    async def fan_out(
+            self,
+            items: Union[Iterable[T], AsyncIterable[T]],
+            action: Callable[[T], Awaitable[Any]]
+    ) -> None:
+        """
+        Runs the action for every item, while only allowing `concurrency_limit` of them to run at once.
+        Items are only pulled from `items` once a slot is free, so streamed collections are never fully
+        held in memory. Failures are logged per item so that a single failed request does not abort the remaining items
+        :param items: items to process, either a regular or an asynchronous iterable
+        :param action: coroutine function to apply on each item
+        :return:
+        """
+        semaphore = Semaphore(self._concurrency_limit)
+        tasks: Set[Task] = set()
+
+        async def run(item: T) -> None:
+            try:
+                await action(item)
+            except Exception as e:
+                self._logger.warning(f'Unable to complete task for: {item}', exc_info=e)
+            finally:
+                semaphore.release()
+
+        async def schedule(item: T) -> None:
+            await semaphore.acquire()
+            task = ensure_future(run(item))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                await schedule(item)
+        else:
+            for item in items:
+                await schedule(item)
+        if tasks:
+            await gather(*tasks)
+
 
 class AuthenticationUseCase(CommonUseCase):
     """
@@ -33,74 +117,197 @@ class PanelUseCase(CommonUseCase):
     """
     _repository: PanelRepository
 
-    async def panels(self, service: str, index_collection: Iterable[Index]) -> Iterable[Panel]:
-        for index in index_collection:
+    async def panels(self, service: str, index_collection: Iterable[Index]) -> AsyncIterator[Panel]:
+        for index in self._repository.prioritise(index_collection):
             self._logger.info(f'Searching for collection panel using: {index}')
             await self._repository.panel(service, index)
-        return await self._repository.all_panels()
+        return self.stream_panels()
 
+    def stream_panels(self) -> AsyncIterator[Panel]:
+        """
+        Streams stored panels without loading the whole collection
+        :return: Async iterator of panels
+        """
+        return self._repository.stream_panels()
 
-class SeasonUseCase(CommonUseCase):
+
+class SeasonUseCase(ConcurrentUseCase):
     """
     Season use case for a given series
     """
     _repository: SeasonRepository
 
-    async def seasons(self, series_collection: Iterable[Series]) -> Iterable[Season]:
-        for item in series_collection:
-            self._logger.info(f'Searching seasons for series: {item.id} -> {item.title}')
-            await self._repository.seasons(item)
-        return await self._repository.all_seasons()
+    async def fetch(self, item: Union[Series, Panel], force: bool = False) -> Iterable[Season]:
+        """
+        Fetches seasons for a single series
+        :param item: series or the series panel
+        :param force: request the seasons even if the cache has not expired
+        :return: seasons of the series
+        """
+        self._logger.info(f'Searching seasons for series: {item.id} -> {item.title}')
+        return await self._repository.seasons(item, force)
+
+    async def has_changed(self, panel: Panel) -> bool:
+        """
+        A series panel has new seasons when its latest public season has not been stored yet
+        :param panel: series panel
+        :return: True if the seasons of the series should be refreshed
+        """
+        if panel.last_public_season_number is None:
+            return False
+        return not await self._repository.contains_season(panel.id, panel.last_public_season_number)
+
+    async def seasons(
+            self,
+            series_collection: Union[Iterable[Series], AsyncIterable[Series]],
+            force: bool = False
+    ) -> AsyncIterator[Season]:
+        await self.fan_out(series_collection, partial(self.fetch, force=force))
+        return self._repository.stream_seasons()
 
 
-class SeriesUseCase(CommonUseCase):
+class SeriesUseCase(ConcurrentUseCase):
     """
     Series use case for a panel
     """
     _repository: SeriesRepository
 
     @staticmethod
-    def __filter_only_series_types(panel_collection: Iterable[Panel]) -> Iterable[Panel]:
-        return filter(
-            lambda panel: panel.type == 'series',
+    def is_supported(panel: Panel) -> bool:
+        return panel.type == 'series'
+
+    @classmethod
+    def __filter_only_series_types(
+            cls,
+            panel_collection: Union[Iterable[Panel], AsyncIterable[Panel]]
+    ) -> AsyncIterator[Panel]:
+        return cls._filter(
+            cls.is_supported,
             panel_collection
         )
 
-    async def series(self, panel_collection: Iterable[Panel]) -> Iterable[Series]:
+    async def fetch(self, item: Panel, force: bool = False) -> None:
+        """
+        Fetches series details for a single panel
+        :param item: series panel
+        :param force: request the series even if the cache has not expired
+        :return:
+        """
+        self._logger.info(f'Searching series for using: {item}')
+        await self._repository.series(item, force)
+
+    async def has_changed(self, panel: Panel) -> bool:
+        """
+        Compares the markers of a series panel against the stored series, panels without a stored series and panels
+        whose episode or season count moved have changed. New panels whose stored series matches their markers have
+        only changed once the cache of the series has expired
+        :param panel: series panel
+        :return: True if the series should be refreshed
+        """
+        series = await self._repository.stored_series(panel.id)
+        if series is None:
+            return True
+        if series.episode_count != panel.episode_count or series.season_count != panel.season_count:
+            return True
+        return panel.new and self._repository.is_cache_expired(panel)
+
+    def flush(self) -> None:
+        """
+        Persists series which have been fetched but not yet written
+        :return:
+        """
+        self._repository.flush()
+
+    async def series(
+            self,
+            panel_collection: Union[Iterable[Panel], AsyncIterable[Panel]],
+            force: bool = False
+    ) -> AsyncIterator[Series]:
         panels = self.__filter_only_series_types(panel_collection)
-        for item in panels:
-            self._logger.info(f'Searching series for using: {item}')
-            await self._repository.series(item)
-        return await self._repository.all_series()
+        try:
+            await self.fan_out(panels, partial(self.fetch, force=force))
+        finally:
+            self.flush()
+        return self._repository.stream_series()
 
 
-class MovieUseCase(CommonUseCase):
+class MovieUseCase(ConcurrentUseCase):
     """
     Movie use case for a panel
     """
     _repository: MovieRepository
 
     @staticmethod
-    def __filter_only_movie_types(panel_collection: Iterable[Panel]) -> Iterable[Panel]:
-        return filter(
-            lambda panel: panel.type == 'movie_listing',
+    def is_supported(panel: Panel) -> bool:
+        return panel.type == 'movie_listing'
+
+    @classmethod
+    def __filter_only_movie_types(
+            cls,
+            panel_collection: Union[Iterable[Panel], AsyncIterable[Panel]]
+    ) -> AsyncIterator[Panel]:
+        return cls._filter(
+            cls.is_supported,
             panel_collection
         )
 
-    async def movies(self, panel_collection: Iterable[Panel]) -> None:
+    async def fetch(self, item: Panel) -> None:
+        """
+        Fetches movie details for a single panel
+        :param item: movie listing panel
+        :return:
+        """
+        self._logger.info(f'Searching for movie using: {item}')
+        await self._repository.movie(item)
+
+    def flush(self) -> None:
+        """
+        Persists movies which have been fetched but not yet written
+        :return:
+        """
+        self._repository.flush()
+
+    async def movies(self, panel_collection: Union[Iterable[Panel], AsyncIterable[Panel]]) -> None:
         panels = self.__filter_only_movie_types(panel_collection)
-        for item in panels:
-            self._logger.info(f'Searching for movie using: {item}')
-            await self._repository.movie(item)
+        try:
+            await self.fan_out(panels, self.fetch)
+        finally:
+            self.flush()
 
 
-class EpisodeUseCase(CommonUseCase):
+class EpisodeUseCase(ConcurrentUseCase):
     """
     Episode use case for given season
     """
     _repository: EpisodeRepository
 
-    async def episodes(self, season_collection: Iterable[Season]) -> None:
-        for item in season_collection:
-            self._logger.info(f'Searching for episodes for season {item.season_number}: {item.series_id}')
-            await self._repository.episode(item)
+    async def fetch(self, item: Season, force: bool = False) -> None:
+        """
+        Fetches episodes for a single season
+        :param item: season
+        :param force: request the episodes even if the cache has not expired
+        :return:
+        """
+        self._logger.info(f'Searching for episodes for season {item.season_number}: {item.series_id}')
+        await self._repository.episode(item, force)
+
+    async def has_changed(self, season: Season, panel: Panel) -> bool:
+        """
+        A season has new episodes when none of its episodes have been stored yet, or when it is the latest public
+        season of the series panel and the latest public episode has not been stored yet
+        :param season: season of the series
+        :param panel: series panel the season belongs to
+        :return: True if the episodes of the season should be refreshed
+        """
+        if not await self._repository.contains_episode(season.id):
+            return True
+        if season.season_number != panel.last_public_season_number or panel.last_public_episode_number is None:
+            return False
+        return not await self._repository.contains_episode(season.id, panel.last_public_episode_number)
+
+    async def episodes(
+            self,
+            season_collection: Union[Iterable[Season], AsyncIterable[Season]],
+            force: bool = False
+    ) -> None:
+        await self.fan_out(season_collection, partial(self.fetch, force=force))
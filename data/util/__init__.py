@@ -1 +1 @@
-from .data_utils import DatabaseUtil, NetworkUtil, LoggingUtil, TimeUtil
+from .data_utils import DatabaseUtil, NetworkUtil, LoggingUtil, TimeUtil, JsonSchemaConverter, RateLimitUtil
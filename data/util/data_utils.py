@@ -1,15 +1,42 @@
 from datetime import datetime, tzinfo
+from email.utils import parsedate_to_datetime
+import json
 import logging
+from random import random
 from logging import Logger
-from typing import Dict
+from threading import Lock
+from time import monotonic
+from typing import Dict, Union, Optional, Callable, Any, Tuple
+from urllib.parse import urlencode
 
 import pytz
+from oauthlib.oauth1 import Client
+from pymongo import MongoClient
+from pymongo.database import Database
+from pymongo.errors import ConfigurationError
+from pymongo.monitoring import ConnectionPoolListener
 from pytz import BaseTzInfo
+from requests import Response
 from requests_oauthlib import OAuth1Session
+from uplink import AiohttpClient
+from uplink.clients.aiohttp_ import ThreadedResponse
+from uplink.converters import MarshmallowConverter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from core.util.file_system import FileSystem, Logging
+from data.model.wrappers import NOT_MODIFIED
 
-from domain.model import Configuration, Oauth, Header
+from domain.model import Configuration, Oauth, Header, Concurrency, Network, Cache, Freshness, Pool, Indexes, Writes, \
+    Reads, Validation, Paging, RateLimit, Crawl
 
 
 class LoggingUtil:
@@ -25,6 +52,30 @@ class LoggingUtil:
 
 
 class BaseUtil(object):
+    __DEFAULT_CONCURRENCY: int = 1
+    __DEFAULT_QUEUE_SIZE: int = 100
+    __DEFAULT_NETWORK_CLIENT: str = 'requests'
+    __DEFAULT_POOL_SIZE: int = 100
+    __DEFAULT_JSON_DECODER: str = 'json'
+    __DEFAULT_CACHE_BUFFER_SIZE: int = 1
+    __DEFAULT_CACHE_FLUSH_INTERVAL: int = 30
+    __DEFAULT_CACHE_DURATION: int = 60 * 60 * 24 * 2
+    __DEFAULT_SIMULCAST_CACHE_DURATION: int = 60 * 60
+    __DEFAULT_RECENT_CACHE_DURATION: int = 60 * 60 * 6
+    __DEFAULT_RECENT_DAYS: int = 14
+    __DEFAULT_ARCHIVED_CACHE_DURATION: int = 60 * 60 * 24 * 30
+    __DEFAULT_ARCHIVED_DAYS: int = 365
+    __DEFAULT_UNCHANGED_PREFIX_CACHE_DURATION: int = 60 * 60 * 24 * 7
+    __DEFAULT_MAX_POOL_SIZE: int = 100
+    __DEFAULT_MIN_POOL_SIZE: int = 0
+    __DEFAULT_WRITE_BATCH_SIZE: int = 1
+    __DEFAULT_READ_BATCH_SIZE: int = 100
+    __DEFAULT_VALIDATION_SAMPLE_RATE: float = 0.01
+    __DEFAULT_PAGE_SIZE: int = 0
+    __DEFAULT_PAGE_CONCURRENCY: int = 2
+    __DEFAULT_RATE_LIMIT_CALLS: int = 5
+    __DEFAULT_RATE_LIMIT_PERIOD: int = 10
+    __DEFAULT_RATE_LIMIT_MIN_CALLS: int = 1
 
     def __init__(self) -> None:
         self._logger = LoggingUtil().get_default_logger(__name__)
@@ -32,8 +83,117 @@ class BaseUtil(object):
             FileSystem.get_file_contents('configuration.yaml')
         )
 
-    @staticmethod
-    def __build_configuration(attachment: Dict) -> Configuration:
+    @classmethod
+    def __build_concurrency(cls, attachment: Dict) -> Concurrency:
+        concurrency = attachment.get('concurrency') or {}
+        return Concurrency(
+            series=concurrency.get('series', cls.__DEFAULT_CONCURRENCY),
+            seasons=concurrency.get('seasons', cls.__DEFAULT_CONCURRENCY),
+            movies=concurrency.get('movies', cls.__DEFAULT_CONCURRENCY),
+            episodes=concurrency.get('episodes', cls.__DEFAULT_CONCURRENCY),
+            queue_size=concurrency.get('queue_size', cls.__DEFAULT_QUEUE_SIZE),
+            streaming=concurrency.get('streaming', False)
+        )
+
+    @classmethod
+    def __build_network(cls, attachment: Dict) -> Network:
+        network = attachment.get('network') or {}
+        return Network(
+            client=network.get('client', cls.__DEFAULT_NETWORK_CLIENT),
+            pool_size=network.get('pool_size', cls.__DEFAULT_POOL_SIZE),
+            json_decoder=network.get('json_decoder', cls.__DEFAULT_JSON_DECODER),
+            raw_body=network.get('raw_body', False),
+            conditional=network.get('conditional', False)
+        )
+
+    @classmethod
+    def __build_cache(cls, attachment: Dict) -> Cache:
+        cache = attachment.get('cache') or {}
+        return Cache(
+            preload=cache.get('preload', False),
+            buffer_size=cache.get('buffer_size', cls.__DEFAULT_CACHE_BUFFER_SIZE),
+            flush_interval=cache.get('flush_interval', cls.__DEFAULT_CACHE_FLUSH_INTERVAL)
+        )
+
+    @classmethod
+    def __build_freshness(cls, attachment: Dict) -> Freshness:
+        freshness = attachment.get('freshness') or {}
+        return Freshness(
+            default=freshness.get('default', cls.__DEFAULT_CACHE_DURATION),
+            simulcast=freshness.get('simulcast', cls.__DEFAULT_SIMULCAST_CACHE_DURATION),
+            recent=freshness.get('recent', cls.__DEFAULT_RECENT_CACHE_DURATION),
+            recent_days=freshness.get('recent_days', cls.__DEFAULT_RECENT_DAYS),
+            archived=freshness.get('archived', cls.__DEFAULT_ARCHIVED_CACHE_DURATION),
+            archived_days=freshness.get('archived_days', cls.__DEFAULT_ARCHIVED_DAYS),
+            unchanged_prefix=freshness.get('unchanged_prefix', cls.__DEFAULT_UNCHANGED_PREFIX_CACHE_DURATION)
+        )
+
+    @classmethod
+    def __build_pool(cls, attachment: Dict) -> Pool:
+        pool = attachment.get('pool') or {}
+        return Pool(
+            max_pool_size=pool.get('max_pool_size', cls.__DEFAULT_MAX_POOL_SIZE),
+            min_pool_size=pool.get('min_pool_size', cls.__DEFAULT_MIN_POOL_SIZE),
+            wait_queue_timeout_ms=pool.get('wait_queue_timeout_ms')
+        )
+
+    @classmethod
+    def __build_indexes(cls, attachment: Dict) -> Indexes:
+        indexes = attachment.get('indexes') or {}
+        return Indexes(
+            provision=indexes.get('provision', True)
+        )
+
+    @classmethod
+    def __build_writes(cls, attachment: Dict) -> Writes:
+        writes = attachment.get('writes') or {}
+        return Writes(
+            batch_size=writes.get('batch_size', cls.__DEFAULT_WRITE_BATCH_SIZE)
+        )
+
+    @classmethod
+    def __build_reads(cls, attachment: Dict) -> Reads:
+        reads = attachment.get('reads') or {}
+        return Reads(
+            batch_size=reads.get('batch_size', cls.__DEFAULT_READ_BATCH_SIZE),
+            lazy=reads.get('lazy', False)
+        )
+
+    @classmethod
+    def __build_validation(cls, attachment: Dict) -> Validation:
+        validation = attachment.get('validation') or {}
+        return Validation(
+            trusted=validation.get('trusted', False),
+            sample_rate=validation.get('sample_rate', cls.__DEFAULT_VALIDATION_SAMPLE_RATE),
+            strict_codecs=validation.get('strict_codecs', False)
+        )
+
+    @classmethod
+    def __build_paging(cls, attachment: Dict) -> Paging:
+        paging = attachment.get('paging') or {}
+        return Paging(
+            page_size=paging.get('page_size', cls.__DEFAULT_PAGE_SIZE),
+            concurrency=paging.get('concurrency', cls.__DEFAULT_PAGE_CONCURRENCY)
+        )
+
+    @classmethod
+    def __build_rate_limit(cls, attachment: Dict) -> RateLimit:
+        rate_limit = attachment.get('rate_limit') or {}
+        return RateLimit(
+            calls=rate_limit.get('calls', cls.__DEFAULT_RATE_LIMIT_CALLS),
+            period=rate_limit.get('period', cls.__DEFAULT_RATE_LIMIT_PERIOD),
+            min_calls=rate_limit.get('min_calls', cls.__DEFAULT_RATE_LIMIT_MIN_CALLS)
+        )
+
+    @classmethod
+    def __build_crawl(cls, attachment: Dict) -> Crawl:
+        crawl = attachment.get('crawl') or {}
+        return Crawl(
+            incremental=crawl.get('incremental', False)
+        )
+
+    @classmethod
+    def __build_configuration(cls, attachment: Dict) -> Configuration:
         return Configuration(
             client=attachment['client'],
             api_key=attachment['api_key'],
@@ -51,12 +211,90 @@ class BaseUtil(object):
                 accept_encoding=attachment['header']['accept_encoding'],
                 accept=attachment['header']['accept'],
                 accept_language=attachment['header']['accept_language']
-            )
+            ),
+            concurrency=cls.__build_concurrency(attachment),
+            network=cls.__build_network(attachment),
+            cache=cls.__build_cache(attachment),
+            freshness=cls.__build_freshness(attachment),
+            pool=cls.__build_pool(attachment),
+            indexes=cls.__build_indexes(attachment),
+            writes=cls.__build_writes(attachment),
+            reads=cls.__build_reads(attachment),
+            validation=cls.__build_validation(attachment),
+            paging=cls.__build_paging(attachment),
+            rate_limit=cls.__build_rate_limit(attachment),
+            crawl=cls.__build_crawl(attachment)
         )
 
 
+class PoolStatisticsListener(ConnectionPoolListener):
+    """
+    Connection pool listener which keeps track of connection usage across all pools of a client
+    """
+
+    def __init__(self) -> None:
+        self.__lock = Lock()
+        self.__statistics: Dict[str, int] = {
+            'connections_open': 0,
+            'connections_in_use': 0,
+            'peak_connections_in_use': 0,
+            'checkouts': 0,
+            'failed_checkouts': 0,
+            'pools_cleared': 0
+        }
+
+    def __increment(self, key: str, value: int = 1) -> None:
+        with self.__lock:
+            self.__statistics[key] += value
+            if key == 'connections_in_use':
+                self.__statistics['peak_connections_in_use'] = max(
+                    self.__statistics['peak_connections_in_use'],
+                    self.__statistics['connections_in_use']
+                )
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self.__lock:
+            return dict(self.__statistics)
+
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        self.__increment('pools_cleared')
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_created(self, event) -> None:
+        self.__increment('connections_open')
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        self.__increment('connections_open', -1)
+
+    def connection_check_out_started(self, event) -> None:
+        pass
+
+    def connection_check_out_failed(self, event) -> None:
+        self.__increment('failed_checkouts')
+
+    def connection_checked_out(self, event) -> None:
+        self.__increment('checkouts')
+        self.__increment('connections_in_use')
+
+    def connection_checked_in(self, event) -> None:
+        self.__increment('connections_in_use', -1)
+
+
 class DatabaseUtil(BaseUtil):
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.__client: Optional[MongoClient] = None
+        self.__pool_listener = PoolStatisticsListener()
+
     def create_connection_string(self) -> str:
         __schema = 'mongodb://'
         __client = self._configuration.client
@@ -65,9 +303,71 @@ class DatabaseUtil(BaseUtil):
         __host_name = self._configuration.host_name
         return f'{__schema}{__client}:{__api_key}@{__host_name}/{__authenticator}'
 
+    def get_client(self) -> MongoClient:
+        """
+        Provides the process wide database client, all data access objects share its connection pool
+        :return: Mongo client configured with pool settings from `pool`
+        """
+        if self.__client is None:
+            pool = self._configuration.pool
+            self.__client = MongoClient(
+                host=self.create_connection_string(),
+                maxIdleTimeMS=45_000,
+                maxPoolSize=pool.max_pool_size,
+                minPoolSize=pool.min_pool_size,
+                waitQueueTimeoutMS=pool.wait_queue_timeout_ms,
+                event_listeners=[self.__pool_listener],
+                appname='anime-meta'
+            )
+        return self.__client
+
+    def get_database(self) -> Optional[Database]:
+        """
+        Provides the default database from the connection string
+        :return: Default database or None if the connection string does not define one
+        """
+        try:
+            return self.get_client().get_database()
+        except ConfigurationError as e:
+            self._logger.debug(
+                f'Configuration error prevented database from connecting: {self.create_connection_string()}',
+                exc_info=e
+            )
+            return None
+
+    def get_pool_statistics(self) -> Dict[str, int]:
+        return self.__pool_listener.get_statistics()
+
+    def get_cache(self) -> Cache:
+        return self._configuration.cache
+
+    def get_freshness(self) -> Freshness:
+        return self._configuration.freshness
+
+    def should_provision_indexes(self) -> bool:
+        return self._configuration.indexes.provision
+
+    def get_write_batch_size(self) -> int:
+        return self._configuration.writes.batch_size
+
+    def get_read_batch_size(self) -> int:
+        return self._configuration.reads.batch_size
+
+    def should_read_lazily(self) -> bool:
+        return self._configuration.reads.lazy
+
+    def should_use_strict_codecs(self) -> bool:
+        return self._configuration.validation.strict_codecs
+
     def disconnect(self) -> None:
-        from data.source.local_sources import Dao
-        Dao.close_database(self._logger)
+        if self.__client is None:
+            return
+        self._logger.info(f'Database connection pool statistics: {self.get_pool_statistics()}')
+        try:
+            self.__client.close()
+            self.__client = None
+        except Exception as e:
+            self._logger.info(msg='Unable to disconnect from database', exc_info=e)
 
 
 class TimeUtil(BaseUtil):
@@ -108,7 +408,340 @@ class TimeUtil(BaseUtil):
         return current_time_stamp
 
 
+class RateLimitUtil(BaseUtil):
+    """
+    Token bucket shared by every endpoint, up to `rate_limit.calls` tokens are refilled every `rate_limit.period`
+    seconds. The refill rate is halved whenever the api responds with 429, down to `rate_limit.min_calls` per period,
+    and recovers gradually with every successful response. A `Retry-After` header pauses all requests until it lapses
+    """
+    __THROTTLED_STATUS: int = 429
+    # fraction of the configured rate which is recovered by every successful response
+    __RECOVERY_STEP: float = 0.1
+
+    def __init__(self) -> None:
+        super().__init__()
+        rate_limit = self._configuration.rate_limit
+        self.__lock = Lock()
+        self.__capacity = max(1, rate_limit.calls)
+        self.__max_rate = self.__capacity / rate_limit.period
+        self.__min_rate = min(self.__max_rate, max(1, rate_limit.min_calls) / rate_limit.period)
+        self.__rate = self.__max_rate
+        self.__tokens = float(self.__capacity)
+        self.__updated = monotonic()
+        self.__paused_until = 0.0
+        self.__queue_depth = 0
+
+    def __refill(self, now: float) -> None:
+        self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated) * self.__rate)
+        self.__updated = now
+
+    def reserve(self) -> float:
+        """
+        Takes a token if one is available
+        :return: 0 if a token was taken, otherwise the number of seconds to wait before trying again
+        """
+        with self.__lock:
+            now = monotonic()
+            if now < self.__paused_until:
+                return self.__paused_until - now
+            self.__refill(now)
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return 0
+            return (1 - self.__tokens) / self.__rate
+
+    def enter_queue(self) -> None:
+        with self.__lock:
+            self.__queue_depth += 1
+
+    def leave_queue(self) -> None:
+        with self.__lock:
+            self.__queue_depth -= 1
+
+    @staticmethod
+    def __parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(pytz.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def on_response(self, status_code: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Adapts the rate to a response
+        :param status_code: status code of the response
+        :param retry_after: value of the `Retry-After` header, either seconds or a http date
+        :return: seconds to wait before the request may be retried if the response was throttled, otherwise None
+        """
+        with self.__lock:
+            now = monotonic()
+            self.__refill(now)
+            if status_code != self.__THROTTLED_STATUS:
+                if status_code < 400 and self.__rate < self.__max_rate:
+                    self.__rate = min(self.__max_rate, self.__rate + self.__max_rate * self.__RECOVERY_STEP)
+                return None
+            self.__rate = max(self.__min_rate, self.__rate / 2)
+            self.__tokens = 0.0
+            delay = self.__parse_retry_after(retry_after)
+            if delay is None:
+                delay = 1 / self.__rate
+            self.__paused_until = max(self.__paused_until, now + delay)
+        self._logger.warning(f'Throttled by the api, reduced rate to {self.__rate * 60:.2f} calls per minute')
+        return delay
+
+    def get_rate(self) -> float:
+        """
+        :return: current number of calls allowed per second
+        """
+        return self.__rate
+
+    def get_queue_depth(self) -> int:
+        """
+        :return: number of requests waiting for a token
+        """
+        return self.__queue_depth
+
+
+class OAuth1Signer(object):
+    """
+    uplink authentication hook which signs each request with OAuth1, for clients that
+    cannot sign requests on their own e.g. aiohttp
+    """
+
+    def __init__(self, oauth: Oauth) -> None:
+        self._client = Client(
+            client_key=oauth.key,
+            client_secret=oauth.secret
+        )
+
+    def __call__(self, request_builder) -> None:
+        url = request_builder.url
+        params = request_builder.info.get('params')
+        if params:
+            url = f'{url}?{urlencode(params)}'
+        _, headers, _ = self._client.sign(url, http_method=request_builder.method)
+        request_builder.info['headers'].update(headers)
+
+
+class BufferedResponse(object):
+    """
+    aiohttp response whose body has already been read on the event loop, so synchronous callbacks such as
+    response body converters can use it without awaiting. `status_code` mirrors `requests.Response`, any other
+    attribute is taken from a `ThreadedResponse` of the aiohttp response
+    """
+
+    def __init__(self, response, body: bytes) -> None:
+        self.__response = ThreadedResponse(response)
+        self.body = body
+
+    @property
+    def status_code(self) -> int:
+        return self.__response.status
+
+    def __getattr__(self, item):
+        return getattr(self.__response, item)
+
+    def unwrap(self):
+        return self.__response.unwrap()
+
+
+def buffered_callback(callback):
+    """
+    Replaces uplink's `threaded_callback` for synchronous callbacks, the body is awaited on the running event
+    loop rather than read through a `ThreadedResponse`, which starts a new thread and event loop on every call of
+    a coroutine method
+
+    :param callback: synchronous callback which is given a `BufferedResponse`
+    :return: coroutine function which reads the body before calling `callback`
+    """
+    async def new_callback(response):
+        if aiohttp is not None and isinstance(response, aiohttp.ClientResponse):
+            response = BufferedResponse(response, await response.read())
+        response = callback(response)
+        if isinstance(response, BufferedResponse):
+            return response.unwrap()
+        return response
+
+    return new_callback
+
+
+class PooledAiohttpClient(AiohttpClient):
+    """
+    aiohttp client adapter that lazily creates a single pooled session inside the running event loop,
+    this allows all consumers to share one connection pool. Synchronous callbacks are given a `BufferedResponse`
+    """
+
+    def __init__(self, headers: Dict, pool_size: int) -> None:
+        super().__init__(session=self._create_session(headers=headers))
+        self._sync_callback_adapter = buffered_callback
+        self._pool_size = pool_size
+
+    async def session(self):
+        if aiohttp is not None and not isinstance(self._session, aiohttp.ClientSession):
+            args, kwargs = self._session
+            self._session = aiohttp.ClientSession(
+                *args,
+                connector=aiohttp.TCPConnector(limit=self._pool_size),
+                **kwargs
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if aiohttp is not None and isinstance(self._session, aiohttp.ClientSession):
+            await self._session.close()
+
+
+class JsonSchemaConverter(MarshmallowConverter):
+    """
+    Marshmallow converter which decodes response bodies with a pluggable json decoder, when `raw_body` is set
+    the decoder is given the body bytes instead of the text decoded by the http client. When `trusted` is set
+    responses are loaded without validation except for a `sample_rate` fraction of them, which are also validated
+    and logged if the results differ. Responses to conditional requests answered with 304 are not read at all
+    """
+
+    class JsonResponseBodyConverter(MarshmallowConverter.ResponseBodyConverter):
+        __NOT_MODIFIED_STATUS: int = 304
+
+        def __init__(
+                self,
+                extract_data,
+                schema,
+                loads: Callable[[Union[str, bytes]], Any],
+                raw_body: bool,
+                validation: Validation,
+                logger: Logger
+        ) -> None:
+            super().__init__(extract_data, schema)
+            self._loads = loads
+            self._raw_body = raw_body
+            self._validation = validation
+            self._logger = logger
+
+        def __read(self, response) -> Any:
+            if isinstance(response, Response):
+                return self._loads(response.content if self._raw_body else response.text)
+            # aiohttp responses are given to converters as a `BufferedResponse` by `PooledAiohttpClient`
+            if self._raw_body:
+                return self._loads(response.body)
+            return self._loads(response.body.decode(response.get_encoding()))
+
+        def __load(self, body: Any) -> Any:
+            if not self._validation.trusted:
+                return self._schema.load(body)
+            result = self._schema.load_trusted(body)
+            if random() < self._validation.sample_rate:
+                # trusted loading leaves the body untouched so it can still be validated
+                validated = self._schema.load(body)
+                if validated != result:
+                    self._logger.warning(
+                        f'Trusted load of {type(self._schema).__name__} differs from the validated result, '
+                        f'the response may have changed shape'
+                    )
+                    return validated
+            return result
+
+        def convert(self, response):
+            if response.status_code == self.__NOT_MODIFIED_STATUS:
+                return NOT_MODIFIED
+            return self._extract_data(self.__load(self.__read(response)))
+
+    def __init__(
+            self,
+            loads: Callable[[Union[str, bytes]], Any],
+            raw_body: bool,
+            validation: Validation,
+            logger: Logger
+    ) -> None:
+        """
+        :param loads: decodes a json document from `str` or `bytes`
+        :param raw_body: decode the body bytes rather than the decoded response text
+        :param validation: whether responses are trusted and how many of them are still validated
+        :param logger: logger used to report trusted results which differ from validated ones
+        """
+        super().__init__()
+        self._loads = loads
+        self._raw_body = raw_body
+        self._validation = validation
+        self._logger = logger
+
+    def create_response_body_converter(self, type_, *args, **kwargs):
+        try:
+            schema = self._get_schema(type_)
+        except ValueError:
+            return None
+        return self.JsonResponseBodyConverter(
+            self._extract_data, schema, self._loads, self._raw_body, self._validation, self._logger
+        )
+
+
 class NetworkUtil(BaseUtil):
+    __ASYNC_CLIENT: str = 'aiohttp'
+    __ORJSON_DECODER: str = 'orjson'
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__client: Optional[Union[OAuth1Session, PooledAiohttpClient]] = None
+
+    def is_async_client(self) -> bool:
+        return self._configuration.network.client == self.__ASYNC_CLIENT
+
+    def create_client(self) -> Union[OAuth1Session, PooledAiohttpClient]:
+        """
+        Creates the http client shared by all consumers, as configured by `network.client`
+        :return: an OAuth1 session for blocking requests or a pooled aiohttp client
+        """
+        if self.__client is None:
+            if self.is_async_client():
+                self.__client = PooledAiohttpClient(
+                    headers=self.__get_request_headers(self._configuration.headers),
+                    pool_size=self._configuration.network.pool_size
+                )
+            else:
+                self.__client = self.create_session()
+        return self.__client
+
+    def create_auth(self) -> Optional[Callable]:
+        """
+        Authentication for consumers, only required by the async client as the OAuth1 session signs its own requests
+        :return: an OAuth1 request signer or None
+        """
+        if self.is_async_client():
+            return OAuth1Signer(self._configuration.oauth)
+        return None
+
+    def create_converters(self) -> Tuple[JsonSchemaConverter, ...]:
+        """
+        Response converters for consumers, as configured by `network.json_decoder`, `network.raw_body`,
+        `network.conditional` and `validation`. The default `json` decoder without `raw_body`, conditional requests
+        or trusted loading keeps uplink's own converter
+        :return: converters which take precedence over the default converters
+        """
+        network = self._configuration.network
+        loads: Callable[[Union[str, bytes]], Any] = json.loads
+        if network.json_decoder == self.__ORJSON_DECODER:
+            if orjson is not None:
+                loads = orjson.loads
+            else:
+                self._logger.warning('orjson is not installed, falling back to the json module for responses')
+        validation = self._configuration.validation
+        if loads is json.loads and not network.raw_body and not network.conditional and not validation.trusted:
+            return ()
+        return JsonSchemaConverter(
+            loads=loads,
+            raw_body=network.raw_body,
+            validation=validation,
+            logger=self._logger
+        ),
+
+    async def close_client(self) -> None:
+        if isinstance(self.__client, PooledAiohttpClient):
+            self._logger.info("Closing shared network client session..")
+            await self.__client.close()
 
     def create_session(self) -> OAuth1Session:
         session = OAuth1Session(
@@ -135,3 +768,15 @@ class NetworkUtil(BaseUtil):
 
     def get_collection_url(self) -> str:
         return self._configuration.base_url + '/cms/v2/US/M2/-/'
+
+    def get_network(self) -> Network:
+        return self._configuration.network
+
+    def get_concurrency(self) -> Concurrency:
+        return self._configuration.concurrency
+
+    def get_crawl(self) -> Crawl:
+        return self._configuration.crawl
+
+    def get_paging(self) -> Paging:
+        return self._configuration.paging
@@ -1,23 +1,24 @@
 import dependency_injector.containers as containers
 import dependency_injector.providers as providers
 
-from data import NetworkUtil, DatabaseUtil, LoggingUtil, TimeUtil
+from data import NetworkUtil, DatabaseUtil, LoggingUtil, TimeUtil, RateLimitUtil
 from data.mapper import SigningPolicyMapper, IndexMapper, PanelMapper, SeasonMapper, \
     SeriesMapper, MovieMapper, EpisodeMapper
 from data.source import AuthenticationEndpoint, DiscoverEndpoint, CollectionEndpoint, DetailEndpoint
 from data.source.local_sources import IndexDao, PanelDao, SeriesDao, SeasonDao, EpisodeDao, \
-    MovieDao, AuthenticationDao, CacheLogDao
+    MovieDao, AuthenticationDao, CacheLogDao, IndexSnapshotDao, ValidatorDao
 
 from data.repository import AuthenticationRepository, EpisodeRepository, IndexRepository, \
     MovieRepository, PanelRepository, SeasonRepository, SeriesRepository
 from data.type_registry import CacheLogEntityCodec, SigningPolicyEntityCodec, IndexEntityCodec, PanelEntityCodec, \
     SeasonEntityCodec, SeriesEntityCodec, EpisodeEntityCodec, MovieEntityCodec, ImageEntityCodec, \
-    ImageContainerEntityCodec, SearchMetaEntityCodec, AdBreakEntityCodec, SeriesPanelEntityCodec, MoviePanelEntityCodec
+    ImageContainerEntityCodec, SearchMetaEntityCodec, AdBreakEntityCodec, SeriesPanelEntityCodec, \
+    MoviePanelEntityCodec, ValidatorEntityCodec
 
 from data.usecase import AuthenticationUseCase, EpisodeUseCase, IndexUseCase, \
     MovieUseCase, PanelUseCase, SeasonUseCase, SeriesUseCase
 
-from data.source import CacheLogUtil
+from data.source import CacheLogUtil, ValidatorUtil
 
 
 class UtilityClientScopeProvider(containers.DeclarativeContainer):
@@ -27,6 +28,7 @@ class UtilityClientScopeProvider(containers.DeclarativeContainer):
     time_zone_client = providers.Singleton(TimeUtil)
     logging_client = providers.Singleton(LoggingUtil)
     network_client = providers.Singleton(NetworkUtil)
+    rate_limit_client = providers.Singleton(RateLimitUtil)
 
 
 class MapperScopeProvider(containers.DeclarativeContainer):
@@ -64,6 +66,7 @@ class MapperScopeProvider(containers.DeclarativeContainer):
 
 class LocalSourceProvider:
     """Container of local sources providers."""
+    __strict_codecs = UtilityClientScopeProvider.database_client().should_use_strict_codecs()
 
     cache_collection = providers.Singleton(
         CacheLogDao,
@@ -71,7 +74,16 @@ class LocalSourceProvider:
         timezone_client=UtilityClientScopeProvider.time_zone_client(),
         database_client=UtilityClientScopeProvider.database_client(),
         type_codecs=[
-            CacheLogEntityCodec()
+            CacheLogEntityCodec(strict=__strict_codecs)
+        ]
+    )
+    validator_collection = providers.Singleton(
+        ValidatorDao,
+        logger_client=UtilityClientScopeProvider.logging_client(),
+        timezone_client=UtilityClientScopeProvider.time_zone_client(),
+        database_client=UtilityClientScopeProvider.database_client(),
+        type_codecs=[
+            ValidatorEntityCodec(strict=__strict_codecs)
         ]
     )
     auth_collection = providers.Singleton(
@@ -80,7 +92,7 @@ class LocalSourceProvider:
         timezone_client=UtilityClientScopeProvider.time_zone_client(),
         database_client=UtilityClientScopeProvider.database_client(),
         type_codecs=[
-            SigningPolicyEntityCodec()
+            SigningPolicyEntityCodec(strict=__strict_codecs)
         ],
         mapper=MapperScopeProvider.singing_policy_mapper()
     )
@@ -90,21 +102,30 @@ class LocalSourceProvider:
         timezone_client=UtilityClientScopeProvider.time_zone_client(),
         database_client=UtilityClientScopeProvider.database_client(),
         type_codecs=[
-            IndexEntityCodec()
+            IndexEntityCodec(strict=__strict_codecs)
         ],
         mapper=MapperScopeProvider.index_mapper()
     )
+    index_snapshot_collection = providers.Singleton(
+        IndexSnapshotDao,
+        logger_client=UtilityClientScopeProvider.logging_client(),
+        timezone_client=UtilityClientScopeProvider.time_zone_client(),
+        database_client=UtilityClientScopeProvider.database_client(),
+        type_codecs=[
+            IndexEntityCodec(strict=__strict_codecs)
+        ]
+    )
     panel_collection = providers.Singleton(
         PanelDao,
         logger_client=UtilityClientScopeProvider.logging_client(),
         timezone_client=UtilityClientScopeProvider.time_zone_client(),
         database_client=UtilityClientScopeProvider.database_client(),
         type_codecs=[
-            ImageContainerEntityCodec(),
-            ImageEntityCodec(),
-            MoviePanelEntityCodec(),
-            SeriesPanelEntityCodec(),
-            SearchMetaEntityCodec()
+            ImageContainerEntityCodec(strict=__strict_codecs),
+            ImageEntityCodec(strict=__strict_codecs),
+            MoviePanelEntityCodec(strict=__strict_codecs),
+            SeriesPanelEntityCodec(strict=__strict_codecs),
+            SearchMetaEntityCodec(strict=__strict_codecs)
         ],
         mapper=MapperScopeProvider.panel_mapper()
     )
@@ -114,8 +135,8 @@ class LocalSourceProvider:
         timezone_client=UtilityClientScopeProvider.time_zone_client(),
         database_client=UtilityClientScopeProvider.database_client(),
         type_codecs=[
-            ImageContainerEntityCodec(),
-            ImageEntityCodec()
+            ImageContainerEntityCodec(strict=__strict_codecs),
+            ImageEntityCodec(strict=__strict_codecs)
         ],
         mapper=MapperScopeProvider.series_mapper()
     )
@@ -125,8 +146,8 @@ class LocalSourceProvider:
         timezone_client=UtilityClientScopeProvider.time_zone_client(),
         database_client=UtilityClientScopeProvider.database_client(),
         type_codecs=[
-            ImageContainerEntityCodec(),
-            ImageEntityCodec()
+            ImageContainerEntityCodec(strict=__strict_codecs),
+            ImageEntityCodec(strict=__strict_codecs)
         ],
         mapper=MapperScopeProvider.seasons_mapper()
     )
@@ -136,9 +157,9 @@ class LocalSourceProvider:
         timezone_client=UtilityClientScopeProvider.time_zone_client(),
         database_client=UtilityClientScopeProvider.database_client(),
         type_codecs=[
-            ImageContainerEntityCodec(),
-            ImageEntityCodec(),
-            AdBreakEntityCodec()
+            ImageContainerEntityCodec(strict=__strict_codecs),
+            ImageEntityCodec(strict=__strict_codecs),
+            AdBreakEntityCodec(strict=__strict_codecs)
         ],
         mapper=MapperScopeProvider.episodes_mapper()
     )
@@ -148,8 +169,8 @@ class LocalSourceProvider:
         timezone_client=UtilityClientScopeProvider.time_zone_client(),
         database_client=UtilityClientScopeProvider.database_client(),
         type_codecs=[
-            ImageContainerEntityCodec(),
-            ImageEntityCodec()
+            ImageContainerEntityCodec(strict=__strict_codecs),
+            ImageEntityCodec(strict=__strict_codecs)
         ],
         mapper=MapperScopeProvider.movies_mapper()
     )
@@ -158,97 +179,132 @@ class LocalSourceProvider:
 class SourceUtilityProvider(containers.DeclarativeContainer):
     """IoC container for cache utility"""
 
-    cache_client = providers.Factory(
+    cache_client = providers.Singleton(
         CacheLogUtil,
         local_source=LocalSourceProvider.cache_collection(),
         logging_client=UtilityClientScopeProvider.logging_client(),
-        timezone_client=UtilityClientScopeProvider.time_zone_client()
+        timezone_client=UtilityClientScopeProvider.time_zone_client(),
+        cache=UtilityClientScopeProvider.database_client().get_cache(),
+        freshness=UtilityClientScopeProvider.database_client().get_freshness()
+    )
+    validator_client = providers.Singleton(
+        ValidatorUtil,
+        local_source=LocalSourceProvider.validator_collection(),
+        logging_client=UtilityClientScopeProvider.logging_client(),
+        enabled=UtilityClientScopeProvider.network_client().get_network().conditional
     )
 
 
 class RemoteSourceProvider(containers.DeclarativeContainer):
     """IoC container of remote sources providers."""
     __network_client = UtilityClientScopeProvider.network_client()
-    __session_client = __network_client.create_session()
+    __session_client = __network_client.create_client()
+    __session_auth = __network_client.create_auth()
+    __session_converters = __network_client.create_converters()
 
     authentication_endpoint = providers.Singleton(
         AuthenticationEndpoint,
         base_url=__network_client.get_authentication_url(),
-        client=__session_client
+        client=__session_client,
+        auth=__session_auth,
+        converters=__session_converters
     )
     discover_endpoint = providers.Singleton(
         DiscoverEndpoint,
         base_url=__network_client.get_discover_url(),
-        client=__session_client
+        client=__session_client,
+        auth=__session_auth,
+        converters=__session_converters
     )
     collection_endpoint = providers.Singleton(
         CollectionEndpoint,
         base_url=__network_client.get_collection_url(),
-        client=__session_client
+        client=__session_client,
+        auth=__session_auth,
+        converters=__session_converters
     )
     detail_endpoint = providers.Singleton(
         DetailEndpoint,
         base_url=__network_client.get_collection_url(),
-        client=__session_client
+        client=__session_client,
+        auth=__session_auth,
+        converters=__session_converters
     )
 
 
 class RepositoryProvider(containers.DeclarativeContainer):
     """IoC container of repository providers."""
 
-    authentication_repository = providers.Factory(
+    # shared by every repository so that signing policies are cached and refreshed once per process
+    authentication_repository = providers.Singleton(
         AuthenticationRepository,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        non_blocking=UtilityClientScopeProvider.network_client().is_async_client(),
         remote_source=RemoteSourceProvider.authentication_endpoint,
         local_source=LocalSourceProvider.auth_collection()
     )
     episodes_repository = providers.Factory(
         EpisodeRepository,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        non_blocking=UtilityClientScopeProvider.network_client().is_async_client(),
         remote_source=RemoteSourceProvider.collection_endpoint,
         local_source=LocalSourceProvider.episode_collection(),
         cache_log_client=SourceUtilityProvider.cache_client,
-        authentication_repository=authentication_repository()
+        authentication_repository=authentication_repository,
+        validator_client=SourceUtilityProvider.validator_client
     )
     index_repository = providers.Factory(
         IndexRepository,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        non_blocking=UtilityClientScopeProvider.network_client().is_async_client(),
         remote_source=RemoteSourceProvider.discover_endpoint,
         local_source=LocalSourceProvider.index_collection(),
         cache_log_client=SourceUtilityProvider.cache_client,
-        authentication_repository=authentication_repository()
+        authentication_repository=authentication_repository,
+        validator_client=SourceUtilityProvider.validator_client
     )
     movie_repository = providers.Factory(
         MovieRepository,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        non_blocking=UtilityClientScopeProvider.network_client().is_async_client(),
         remote_source=RemoteSourceProvider.detail_endpoint,
         local_source=LocalSourceProvider.movie_collection(),
         cache_log_client=SourceUtilityProvider.cache_client,
-        authentication_repository=authentication_repository()
+        authentication_repository=authentication_repository,
+        validator_client=SourceUtilityProvider.validator_client
     )
     panel_repository = providers.Factory(
         PanelRepository,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        non_blocking=UtilityClientScopeProvider.network_client().is_async_client(),
         remote_source=RemoteSourceProvider.discover_endpoint,
         local_source=LocalSourceProvider.panel_collection(),
         cache_log_client=SourceUtilityProvider.cache_client,
-        authentication_repository=authentication_repository()
+        authentication_repository=authentication_repository,
+        paging=UtilityClientScopeProvider.network_client().get_paging(),
+        snapshot_source=LocalSourceProvider.index_snapshot_collection(),
+        freshness=UtilityClientScopeProvider.database_client().get_freshness(),
+        validator_client=SourceUtilityProvider.validator_client
     )
     seasons_repository = providers.Factory(
         SeasonRepository,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        non_blocking=UtilityClientScopeProvider.network_client().is_async_client(),
         remote_source=RemoteSourceProvider.collection_endpoint,
         local_source=LocalSourceProvider.season_collection(),
         cache_log_client=SourceUtilityProvider.cache_client,
-        authentication_repository=authentication_repository()
+        authentication_repository=authentication_repository,
+        validator_client=SourceUtilityProvider.validator_client
     )
     series_repository = providers.Factory(
         SeriesRepository,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        non_blocking=UtilityClientScopeProvider.network_client().is_async_client(),
         remote_source=RemoteSourceProvider.detail_endpoint,
         local_source=LocalSourceProvider.series_collection(),
         cache_log_client=SourceUtilityProvider.cache_client,
-        authentication_repository=authentication_repository()
+        authentication_repository=authentication_repository,
+        validator_client=SourceUtilityProvider.validator_client
     )
 
 
@@ -263,6 +319,7 @@ class UseCaseProvider(containers.DeclarativeContainer):
     episodes_use_case = providers.Factory(
         EpisodeUseCase,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        concurrency_limit=UtilityClientScopeProvider.network_client().get_concurrency().episodes,
         repository=RepositoryProvider.episodes_repository
     )
     index_use_case = providers.Factory(
@@ -273,6 +330,7 @@ class UseCaseProvider(containers.DeclarativeContainer):
     movie_use_case = providers.Factory(
         MovieUseCase,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        concurrency_limit=UtilityClientScopeProvider.network_client().get_concurrency().movies,
         repository=RepositoryProvider.movie_repository
     )
     panel_use_case = providers.Factory(
@@ -283,10 +341,12 @@ class UseCaseProvider(containers.DeclarativeContainer):
     seasons_use_case = providers.Factory(
         SeasonUseCase,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        concurrency_limit=UtilityClientScopeProvider.network_client().get_concurrency().seasons,
         repository=RepositoryProvider.seasons_repository
     )
     series_use_case = providers.Factory(
         SeriesUseCase,
         logging_client=UtilityClientScopeProvider.logging_client(),
+        concurrency_limit=UtilityClientScopeProvider.network_client().get_concurrency().series,
         repository=RepositoryProvider.series_repository
     )
@@ -3,11 +3,12 @@ from typing import List, Optional, Union
 
 
 class Item:
-    pass
+    __slots__ = ()
 
 
 @dataclass
 class Index(Item):
+    __slots__ = ('prefix', 'offset', 'count')
     prefix: str
     offset: int
     count: int
@@ -15,6 +16,7 @@ class Index(Item):
 
 @dataclass
 class EntityItem(Item):
+    __slots__ = ('id', 'channel_id', 'title')
     id: str
     channel_id: str
     title: str
@@ -22,24 +24,39 @@ class EntityItem(Item):
 
 @dataclass
 class Panel(EntityItem):
+    __slots__ = (
+        'external_id', 'type', 'locale', 'last_public', 'new', 'is_simulcast', 'episode_count', 'season_count',
+        'last_public_season_number', 'last_public_episode_number'
+    )
     external_id: str
     type: str
     locale: str
     last_public: Optional[str]
     new: bool
+    is_simulcast: bool
+    episode_count: Optional[int]
+    season_count: Optional[int]
+    last_public_season_number: Optional[int]
+    last_public_episode_number: Optional[int]
 
 
 @dataclass
 class Season(EntityItem):
+    __slots__ = ('series_id', 'season_number', 'is_mature', 'is_subbed', 'is_dubbed', 'is_simulcast')
     series_id: str
     season_number: int
     is_mature: bool
     is_subbed: bool
     is_dubbed: bool
+    is_simulcast: bool
 
 
 @dataclass
 class Series(EntityItem):
+    __slots__ = (
+        'slug', 'maturity_ratings', 'episode_count', 'season_count', 'media_count', 'content_provider', 'is_mature',
+        'is_subbed', 'is_dubbed', 'is_simulcast'
+    )
     slug: Optional[str]
     maturity_ratings: List[str]
     episode_count: int
@@ -49,10 +66,14 @@ class Series(EntityItem):
     is_mature: bool
     is_subbed: bool
     is_dubbed: bool
+    is_simulcast: bool
 
 
 @dataclass
 class Movie(EntityItem):
+    __slots__ = (
+        'slug', 'maturity_ratings', 'movie_release_year', 'content_provider', 'is_mature', 'is_subbed', 'is_dubbed'
+    )
     slug: Optional[str]
     maturity_ratings: List[str]
     movie_release_year: int
@@ -64,6 +85,10 @@ class Movie(EntityItem):
 
 @dataclass
 class Episode(EntityItem):
+    __slots__ = (
+        'series_id', 'season_id', 'season_number', 'episode', 'episode_number', 'is_mature', 'episode_air_date',
+        'is_subbed', 'is_dubbed', 'media_type', 'duration_ms'
+    )
     series_id: str
     season_id: str
     season_number: int
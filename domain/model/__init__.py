@@ -1 +1 @@
-from .models import LoginQuery, Configuration, Oauth, Header, Parameters
+from .models import LoginQuery, Configuration, Oauth, Header, Parameters, Concurrency, Network, Cache, Pool, Indexes, Writes, Reads, Freshness, Validation, Paging, RateLimit, Crawl
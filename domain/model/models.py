@@ -16,6 +16,91 @@ class Header:
     accept_language: str
 
 
+@dataclass()
+class Concurrency:
+    series: int
+    seasons: int
+    movies: int
+    episodes: int
+    queue_size: int
+    streaming: bool
+
+
+@dataclass()
+class Network:
+    client: str
+    pool_size: int
+    json_decoder: str
+    raw_body: bool
+    conditional: bool
+
+
+@dataclass()
+class Cache:
+    preload: bool
+    buffer_size: int
+    flush_interval: int
+
+
+@dataclass()
+class Freshness:
+    default: int
+    simulcast: int
+    recent: int
+    recent_days: int
+    archived: int
+    archived_days: int
+    unchanged_prefix: int
+
+
+@dataclass()
+class Pool:
+    max_pool_size: int
+    min_pool_size: int
+    wait_queue_timeout_ms: Optional[int]
+
+
+@dataclass()
+class Indexes:
+    provision: bool
+
+
+@dataclass()
+class Writes:
+    batch_size: int
+
+
+@dataclass()
+class Reads:
+    batch_size: int
+    lazy: bool
+
+
+@dataclass()
+class RateLimit:
+    calls: int
+    period: int
+    min_calls: int
+
+
+@dataclass()
+class Paging:
+    page_size: int
+    concurrency: int
+
+
+@dataclass()
+class Crawl:
+    incremental: bool
+
+
+@dataclass()
+class Validation:
+    trusted: bool
+    sample_rate: float
+    strict_codecs: bool
+
+
 @dataclass()
 class Configuration:
     client: str
@@ -27,6 +112,18 @@ class Configuration:
     time_zone: str
     log_level: str
     headers: Header
+    concurrency: Concurrency
+    network: Network
+    cache: Cache
+    freshness: Freshness
+    pool: Pool
+    indexes: Indexes
+    writes: Writes
+    reads: Reads
+    validation: Validation
+    paging: Paging
+    rate_limit: RateLimit
+    crawl: Crawl
 
 
 @dataclass()
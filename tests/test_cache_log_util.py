@@ -0,0 +1,153 @@
+from asyncio import run, sleep
+from datetime import datetime
+from typing import Dict, List, Optional
+from unittest import TestCase
+
+import pytz
+from pymongo.results import BulkWriteResult
+
+from data.entity import CacheLogEntity
+from data.model import AttributeDict
+from data.source import CacheLogUtil
+from di import UtilityClientScopeProvider
+from domain.entity import Panel, Season
+from domain.model import Cache, Freshness
+
+
+class InMemoryCacheLogDao:
+
+    def __init__(self, entries: List[AttributeDict]) -> None:
+        self.entries = entries
+        self.bulk_queries = 0
+        self.single_queries = 0
+        self.bulk_writes: List[List[CacheLogEntity]] = []
+
+    def get_cache_log_entries(self, collection: str) -> List[AttributeDict]:
+        self.bulk_queries += 1
+        return [entry for entry in self.entries if entry.collection == collection]
+
+    def get_cache_log_entry(self, search_filter: Dict) -> Optional[AttributeDict]:
+        self.single_queries += 1
+        return None
+
+    def save_or_update_cache_entries(self, cache_logs: List[CacheLogEntity]) -> BulkWriteResult:
+        self.bulk_writes.append(cache_logs)
+        return BulkWriteResult(bulk_api_result={}, acknowledged=True)
+
+
+class TestCacheLogUtil(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.time_util = UtilityClientScopeProvider.time_zone_client()
+        self.local_source = InMemoryCacheLogDao([
+            AttributeDict(collection='series', item_id='A', time_stamp=self.time_util.get_current_timestamp()),
+            AttributeDict(collection='series', item_id='B', time_stamp=0)
+        ])
+        self.cache_log_util = self.create_cache_log_util(buffer_size=1)
+
+    def create_cache_log_util(self, buffer_size: int, flush_interval: int = 60) -> CacheLogUtil:
+        return CacheLogUtil(
+            local_source=self.local_source,
+            logging_client=UtilityClientScopeProvider.logging_client(),
+            timezone_client=self.time_util,
+            cache=Cache(preload=True, buffer_size=buffer_size, flush_interval=flush_interval),
+            freshness=Freshness(
+                default=60 * 60 * 24 * 2,
+                simulcast=60 * 60,
+                recent=60 * 60 * 6,
+                recent_days=14,
+                archived=60 * 60 * 24 * 30,
+                archived_days=365,
+                unchanged_prefix=60 * 60 * 24 * 7
+            )
+        )
+
+    def create_panel(self, last_public: str, new: bool = False, is_simulcast: bool = False) -> Panel:
+        return Panel(
+            id='A', channel_id='channel', title='title', external_id='SRZ.A', type='series', locale='en-US',
+            last_public=last_public, new=new, is_simulcast=is_simulcast, episode_count=12, season_count=1,
+            last_public_season_number=1, last_public_episode_number=12
+        )
+
+    def format_days_ago(self, days: int) -> str:
+        time_stamp = self.time_util.get_current_timestamp() - days * 60 * 60 * 24
+        return datetime.fromtimestamp(time_stamp, pytz.utc).strftime(self.time_util.TIME_FORMAT_TEMPLATE)
+
+    def test_is_cache_expired_uses_snapshot(self):
+        self.assertFalse(self.cache_log_util.is_cache_expired('series', 'A'))
+        self.assertTrue(self.cache_log_util.is_cache_expired('series', 'B'))
+        self.assertTrue(self.cache_log_util.is_cache_expired('series', 'C'))
+        self.assertEqual(1, self.local_source.bulk_queries)
+        self.assertEqual(0, self.local_source.single_queries)
+
+    def test_save_or_update_writes_through(self):
+        self.assertTrue(self.cache_log_util.is_cache_expired('series', 'B'))
+        self.assertTrue(self.cache_log_util.save_or_update('series', 'B'))
+        self.assertFalse(self.cache_log_util.is_cache_expired('series', 'B'))
+        self.assertEqual(1, self.local_source.bulk_queries)
+
+    def test_save_or_update_buffers_until_full(self):
+        cache_log_util = self.create_cache_log_util(buffer_size=3)
+        cache_log_util.save_or_update('series', 'A')
+        cache_log_util.save_or_update('series', 'B')
+        self.assertEqual(0, len(self.local_source.bulk_writes))
+        cache_log_util.save_or_update('series', 'C')
+        self.assertEqual(1, len(self.local_source.bulk_writes))
+        self.assertEqual(3, len(self.local_source.bulk_writes[0]))
+
+    def test_flush_writes_remaining_entries(self):
+        cache_log_util = self.create_cache_log_util(buffer_size=10)
+        cache_log_util.save_or_update('series', 'A')
+        cache_log_util.save_or_update('series', 'A')
+        self.assertTrue(cache_log_util.flush())
+        self.assertEqual(1, len(self.local_source.bulk_writes))
+        self.assertEqual(1, len(self.local_source.bulk_writes[0]))
+        self.assertTrue(cache_log_util.flush())
+        self.assertEqual(1, len(self.local_source.bulk_writes))
+
+    def test_buffered_entries_are_flushed_while_idle(self):
+        cache_log_util = self.create_cache_log_util(buffer_size=10, flush_interval=1)
+
+        async def save_then_idle() -> None:
+            cache_log_util.save_or_update('series', 'A')
+            cache_log_util.save_or_update('series', 'B')
+            self.assertEqual(0, len(self.local_source.bulk_writes))
+            await sleep(1.1)
+
+        run(save_then_idle())
+        self.assertEqual(1, len(self.local_source.bulk_writes))
+        self.assertEqual(2, len(self.local_source.bulk_writes[0]))
+
+    def test_get_cache_duration_defaults_without_item(self):
+        self.assertEqual(60 * 60 * 24 * 2, self.cache_log_util.get_cache_duration())
+
+    def test_get_cache_duration_for_simulcast(self):
+        panel = self.create_panel(self.format_days_ago(400), is_simulcast=True)
+        self.assertEqual(60 * 60, self.cache_log_util.get_cache_duration(panel))
+        season = Season(
+            id='B', channel_id='channel', title='title', series_id='A', season_number=1, is_mature=False,
+            is_subbed=True, is_dubbed=False, is_simulcast=True
+        )
+        self.assertEqual(60 * 60, self.cache_log_util.get_cache_duration(season))
+
+    def test_get_cache_duration_for_recently_published(self):
+        panel = self.create_panel(self.format_days_ago(3))
+        self.assertEqual(60 * 60 * 6, self.cache_log_util.get_cache_duration(panel))
+        self.assertEqual(60 * 60 * 6, self.cache_log_util.get_cache_duration(self.create_panel(None, new=True)))
+
+    def test_get_cache_duration_for_archived(self):
+        panel = self.create_panel(self.format_days_ago(400))
+        self.assertEqual(60 * 60 * 24 * 30, self.cache_log_util.get_cache_duration(panel))
+
+    def test_get_cache_duration_falls_back_to_default(self):
+        panel = self.create_panel(self.format_days_ago(60))
+        self.assertEqual(60 * 60 * 24 * 2, self.cache_log_util.get_cache_duration(panel))
+        self.assertEqual(60 * 60 * 24 * 2, self.cache_log_util.get_cache_duration(self.create_panel('not a date')))
+
+    def test_is_cache_expired_uses_item_policy(self):
+        time_stamp = self.time_util.get_current_timestamp() - 60 * 60 * 2
+        self.local_source.entries.append(AttributeDict(collection='series', item_id='C', time_stamp=time_stamp))
+        self.assertFalse(self.cache_log_util.is_cache_expired('series', 'C'))
+        panel = self.create_panel(self.format_days_ago(1), is_simulcast=True)
+        self.assertTrue(self.cache_log_util.is_cache_expired('series', 'C', panel))
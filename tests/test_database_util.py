@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+from data import DatabaseUtil
+from di import UtilityClientScopeProvider, LocalSourceProvider
+
+
+class TestDatabaseUtil(TestCase):
+    __database_util: DatabaseUtil
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.__database_util = UtilityClientScopeProvider.database_client()
+
+    def test_get_client(self):
+        result = self.__database_util.get_client()
+        self.assertIsNotNone(result)
+        self.assertIs(result, self.__database_util.get_client())
+
+    def test_daos_share_client(self):
+        client = self.__database_util.get_client()
+        self.assertIs(client, LocalSourceProvider.series_collection().get_client())
+        self.assertIs(client, LocalSourceProvider.cache_collection().get_client())
+
+    def test_compiled_codecs_are_used_by_default(self):
+        self.assertFalse(self.__database_util.should_use_strict_codecs())
+
+    def test_get_pool_statistics(self):
+        result = self.__database_util.get_pool_statistics()
+        self.assertIn('connections_in_use', result)
+        self.assertIn('peak_connections_in_use', result)
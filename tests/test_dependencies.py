@@ -93,3 +93,18 @@ class Test(TestCase):
     def test_cache_util_provider(self):
         cache_client = SourceUtilityProvider.cache_client()
         self.assertIsNotNone(cache_client)
+
+    def test_authentication_repository_is_shared(self):
+        authentication_repository = RepositoryProvider.authentication_repository()
+        # noinspection PyProtectedMember
+        shared = [
+            RepositoryProvider.episodes_repository()._authentication,
+            RepositoryProvider.index_repository()._authentication,
+            RepositoryProvider.movie_repository()._authentication,
+            RepositoryProvider.panel_repository()._authentication,
+            RepositoryProvider.seasons_repository()._authentication,
+            RepositoryProvider.series_repository()._authentication,
+            UseCaseProvider.authentication_use_case()._repository
+        ]
+        for repository in shared:
+            self.assertIs(authentication_repository, repository)
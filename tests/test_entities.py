@@ -0,0 +1,71 @@
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from inspect import getmembers, isclass
+from typing import Any, List, Union, get_type_hints, get_origin, get_args
+from unittest import TestCase
+
+from dacite import from_dict
+
+import data.entity.entities
+import domain.entity.entities
+from data.mapper.compilers import compile_encoder, compile_decoder
+
+
+def create_value(name: str, annotation: Any) -> Any:
+    """
+    Builds a value of `annotation`, nested dataclasses are built with every field set
+    :param name: name of the field the value is created for
+    :param annotation: type annotation of the field
+    :return: value of the annotated type
+    """
+    if get_origin(annotation) is Union:
+        return create_value(name, get_args(annotation)[0])
+    if get_origin(annotation) in (list, List):
+        return [create_value(name, get_args(annotation)[0])]
+    if is_dataclass(annotation):
+        return create_entity(annotation)
+    if annotation is bool:
+        return True
+    if annotation in (int, float):
+        return 7
+    if annotation is datetime:
+        return datetime(2020, 11, 10, 12, 30)
+    return f'{name} value'
+
+
+def create_entity(entity_type: type) -> Any:
+    hints = get_type_hints(entity_type)
+    return entity_type(**{field.name: create_value(field.name, hints[field.name]) for field in fields(entity_type)})
+
+
+class TestEntities(TestCase):
+
+    @staticmethod
+    def entity_types(module) -> List[type]:
+        return [
+            member for _, member in getmembers(module, isclass)
+            if is_dataclass(member) and member.__module__ == module.__name__
+        ]
+
+    def assert_round_trip(self, entity_type: type) -> None:
+        entity = create_entity(entity_type)
+        slots = {slot for cls in entity_type.__mro__ for slot in getattr(cls, '__slots__', ())}
+        self.assertEqual({field.name for field in fields(entity_type)}, slots)
+        self.assertFalse(hasattr(entity, '__dict__'))
+        document = compile_encoder(entity_type)(entity)
+        self.assertEqual(entity, from_dict(entity_type, document))
+        self.assertEqual(entity, compile_decoder(entity_type)(document))
+
+    def test_data_entities_round_trip(self):
+        entity_types = self.entity_types(data.entity.entities)
+        self.assertTrue(entity_types)
+        for entity_type in entity_types:
+            with self.subTest(entity_type.__name__):
+                self.assert_round_trip(entity_type)
+
+    def test_domain_entities_round_trip(self):
+        entity_types = self.entity_types(domain.entity.entities)
+        self.assertTrue(entity_types)
+        for entity_type in entity_types:
+            with self.subTest(entity_type.__name__):
+                self.assert_round_trip(entity_type)
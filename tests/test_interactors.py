@@ -0,0 +1,218 @@
+from asyncio import sleep
+from functools import partial
+from typing import List, Optional, AsyncIterator, Iterable, Set, Union, AsyncIterable
+from unittest import TestCase
+
+from app.usecase import ServiceInteractor
+from data.usecase.use_cases import ConcurrentUseCase
+from di import UtilityClientScopeProvider
+from domain.entity import Panel, Season
+from domain.model import Parameters, Concurrency, Crawl
+
+
+class InMemoryNetworkUtil:
+
+    def __init__(self, streaming: bool = True, incremental: bool = False) -> None:
+        self.streaming = streaming
+        self.incremental = incremental
+        self.closed = False
+
+    def get_concurrency(self) -> Concurrency:
+        return Concurrency(series=2, seasons=2, movies=2, episodes=2, queue_size=1, streaming=self.streaming)
+
+    def get_crawl(self) -> Crawl:
+        return Crawl(incremental=self.incremental)
+
+    async def close_client(self) -> None:
+        self.closed = True
+
+
+class InMemoryIndexUseCase:
+
+    @staticmethod
+    async def index_panel(service: str) -> List:
+        return []
+
+
+class InMemoryPanelUseCase:
+
+    def __init__(self, panels: List[Panel]) -> None:
+        self.stored = panels
+
+    async def __stream(self) -> AsyncIterator[Panel]:
+        for panel in self.stored:
+            yield panel
+
+    async def panels(self, service: str, index_collection: Iterable) -> AsyncIterator[Panel]:
+        return self.__stream()
+
+    def stream_panels(self) -> AsyncIterator[Panel]:
+        return self.__stream()
+
+
+class InMemoryStageUseCase(ConcurrentUseCase):
+
+    def __init__(
+            self,
+            supported_type: Optional[str] = None,
+            failing_id: Optional[str] = None,
+            unreadable_id: Optional[str] = None,
+            changed_ids: Iterable[str] = ()
+    ) -> None:
+        super().__init__(None, UtilityClientScopeProvider.logging_client(), concurrency_limit=2)
+        self.supported_type = supported_type
+        self.failing_id = failing_id
+        self.unreadable_id = unreadable_id
+        self.changed_ids: Set[str] = set(changed_ids)
+        self.fetched: List[str] = []
+        self.forced: List[str] = []
+        self.flushes = 0
+
+    def is_supported(self, panel: Panel) -> bool:
+        if panel.id == self.unreadable_id:
+            raise ValueError(panel.id)
+        return panel.type == self.supported_type
+
+    async def has_changed(self, item, panel: Optional[Panel] = None) -> bool:
+        await sleep(0)
+        return item.id in self.changed_ids
+
+    async def fetch(self, item, force: bool = False) -> None:
+        await sleep(0)
+        if item.id == self.failing_id:
+            raise TimeoutError(item.id)
+        self.fetched.append(item.id)
+        if force:
+            self.forced.append(item.id)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+    async def series(self, panels: Union[Iterable[Panel], AsyncIterable[Panel]], force: bool = False) -> List[Panel]:
+        supported = [panel async for panel in self._filter(self.is_supported, panels)]
+        try:
+            await self.fan_out(supported, partial(self.fetch, force=force))
+        finally:
+            self.flush()
+        return [panel for panel in supported if panel.id in self.fetched]
+
+    async def movies(self, panels: AsyncIterable[Panel]) -> None:
+        try:
+            await self.fan_out(self._filter(self.is_supported, panels), self.fetch)
+        finally:
+            self.flush()
+
+    async def episodes(self, seasons: Iterable[Season], force: bool = False) -> None:
+        await self.fan_out(seasons, partial(self.fetch, force=force))
+
+
+class InMemorySeasonUseCase(InMemoryStageUseCase):
+
+    async def fetch(self, item: Panel, force: bool = False) -> Iterable[Season]:
+        await super().fetch(item, force)
+        return [
+            Season(
+                id=f'{item.id}{season_number}', channel_id='channel', title='title', series_id=item.id,
+                season_number=season_number, is_mature=False, is_subbed=True, is_dubbed=False, is_simulcast=False
+            )
+            for season_number in (1, 2)
+        ]
+
+    async def seasons(self, series: Iterable[Panel], force: bool = False) -> List[Season]:
+        seasons: List[Season] = []
+
+        async def fetch(item: Panel) -> None:
+            seasons.extend(await self.fetch(item, force))
+
+        await self.fan_out(series, fetch)
+        return seasons
+
+
+class InMemoryServiceInteractor(ServiceInteractor):
+
+    def __init__(
+            self,
+            panels: List[Panel],
+            failing_series: Optional[str] = None,
+            unreadable_panel: Optional[str] = None,
+            streaming: bool = True,
+            incremental: bool = False,
+            changed_ids: Iterable[str] = ()
+    ) -> None:
+        self._parameters = Parameters(service='crunchyroll', credentials=None)
+        self._logger = UtilityClientScopeProvider.logging_client().get_default_logger(__name__)
+        self._network_client = InMemoryNetworkUtil(streaming, incremental)
+        self._index_use_case = InMemoryIndexUseCase()
+        self._panel_use_case = InMemoryPanelUseCase(panels)
+        self._series_use_case = InMemoryStageUseCase('series', failing_series, unreadable_panel, changed_ids)
+        self._season_use_case = InMemorySeasonUseCase(changed_ids=changed_ids)
+        self._episode_use_case = InMemoryStageUseCase(changed_ids=changed_ids)
+        self._movie_use_case = InMemoryStageUseCase('movie_listing')
+
+
+class TestServiceInteractor(TestCase):
+
+    @staticmethod
+    def create_panel(panel_id: str, panel_type: str = 'series') -> Panel:
+        return Panel(
+            id=panel_id, channel_id='channel', title='title', external_id='SRZ', type=panel_type, locale='en-US',
+            last_public=None, new=False, is_simulcast=False, episode_count=24, season_count=2,
+            last_public_season_number=2, last_public_episode_number=12
+        )
+
+    def create_panels(self) -> List[Panel]:
+        return [
+            self.create_panel('A'), self.create_panel('M', 'movie_listing'), self.create_panel('B'),
+            self.create_panel('C'), self.create_panel('N', 'movie_listing')
+        ]
+
+    def test_streaming_passes_items_through_every_stage(self):
+        interactor = InMemoryServiceInteractor(self.create_panels())
+        interactor.start_service()
+        self.assertCountEqual(['A', 'B', 'C'], interactor._series_use_case.fetched)
+        self.assertCountEqual(['A', 'B', 'C'], interactor._season_use_case.fetched)
+        self.assertCountEqual(['A1', 'A2', 'B1', 'B2', 'C1', 'C2'], interactor._episode_use_case.fetched)
+        self.assertCountEqual(['M', 'N'], interactor._movie_use_case.fetched)
+        self.assertTrue(interactor._network_client.closed)
+
+    def test_streaming_continues_after_worker_failure(self):
+        interactor = InMemoryServiceInteractor(self.create_panels(), failing_series='B')
+        interactor.start_service()
+        self.assertCountEqual(['A', 'C'], interactor._series_use_case.fetched)
+        self.assertCountEqual(['A', 'C'], interactor._season_use_case.fetched)
+        self.assertCountEqual(['A1', 'A2', 'C1', 'C2'], interactor._episode_use_case.fetched)
+        self.assertCountEqual(['M', 'N'], interactor._movie_use_case.fetched)
+
+    def test_streaming_flushes_after_failure(self):
+        interactor = InMemoryServiceInteractor(self.create_panels(), unreadable_panel='C')
+        with self.assertRaises(ValueError):
+            interactor.start_service()
+        self.assertEqual(1, interactor._series_use_case.flushes)
+        self.assertEqual(1, interactor._movie_use_case.flushes)
+        self.assertTrue(interactor._network_client.closed)
+
+    def test_staged_passes_items_through_every_stage(self):
+        interactor = InMemoryServiceInteractor(self.create_panels(), streaming=False)
+        interactor.start_service()
+        self.assertCountEqual(['A', 'B', 'C'], interactor._series_use_case.fetched)
+        self.assertCountEqual(['A', 'B', 'C'], interactor._season_use_case.fetched)
+        self.assertCountEqual(['A1', 'A2', 'B1', 'B2', 'C1', 'C2'], interactor._episode_use_case.fetched)
+        self.assertCountEqual(['M', 'N'], interactor._movie_use_case.fetched)
+        self.assertEqual([], interactor._series_use_case.forced)
+        self.assertTrue(interactor._network_client.closed)
+
+    def test_incremental_crawl_only_refreshes_changed_items(self):
+        for streaming in (True, False):
+            with self.subTest(streaming=streaming):
+                interactor = InMemoryServiceInteractor(
+                    self.create_panels(), streaming=streaming, incremental=True, changed_ids=('B', 'B2')
+                )
+                interactor.start_service()
+                for use_case, expected in (
+                        (interactor._series_use_case, ['B']),
+                        (interactor._season_use_case, ['B']),
+                        (interactor._episode_use_case, ['B2'])
+                ):
+                    self.assertEqual(expected, use_case.fetched)
+                    self.assertEqual(expected, use_case.forced)
+                self.assertCountEqual(['M', 'N'], interactor._movie_use_case.fetched)
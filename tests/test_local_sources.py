@@ -0,0 +1,301 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Set, Union
+from unittest import TestCase
+
+import pytz
+from bson import encode, decode
+from bson.raw_bson import RawBSONDocument
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError, AutoReconnect
+from pymongo.results import BulkWriteResult, DeleteResult
+
+from data import DatabaseUtil
+from data.model import SigningPolicyModel, SeriesModel, AttributeDict
+from data.source import AuthenticationDao, SeriesDao, PanelDao
+from data.type_registry import SigningPolicyEntityCodec, ImageContainerEntityCodec, ImageEntityCodec
+from di import UtilityClientScopeProvider, MapperScopeProvider
+
+
+class InMemoryCursor(list):
+
+    def sort(self, key: str, direction: int) -> 'InMemoryCursor':
+        return InMemoryCursor(sorted(self, key=lambda document: document[key], reverse=direction == DESCENDING))
+
+    def limit(self, count: int) -> 'InMemoryCursor':
+        return InMemoryCursor(self[:count])
+
+
+class InMemoryCollection:
+
+    def __init__(self) -> None:
+        self.indexes: List[Tuple[List, Dict]] = []
+        self.documents: List[Dict] = []
+        self.writes: List[List] = []
+        self.failing_ids: Set[str] = set()
+        self.queries: List[Dict] = []
+        self.available = True
+
+    def create_index(self, keys: List, **kwargs) -> None:
+        self.indexes.append((keys, kwargs))
+
+    def find(self, filter: Optional[Dict] = None, projection: Optional[Dict] = None) -> 'InMemoryCursor':
+        self.queries.append(dict(filter or {}))
+        after = (filter or {}).get('id', {}).get('$gt')
+        fields = [field for field, included in (projection or {}).items() if included]
+        return InMemoryCursor(
+            AttributeDict((field, document[field]) for field in fields if field in document)
+            for document in self.documents
+            if after is None or document['id'] > after
+        )
+
+    @staticmethod
+    def delete_many(filter: Dict) -> DeleteResult:
+        return DeleteResult({'n': 0}, acknowledged=True)
+
+    def bulk_write(self, requests: List, ordered: bool = True) -> BulkWriteResult:
+        if not self.available:
+            raise AutoReconnect('connection closed')
+        self.writes.append(requests)
+        write_errors = []
+        for index, request in enumerate(requests):
+            document = request._doc
+            if document.get('id') in self.failing_ids:
+                write_errors.append({'index': index, 'code': 121, 'errmsg': 'Document failed validation'})
+            else:
+                self.documents.append(document)
+        result = {
+            'nInserted': len(requests) - len(write_errors), 'nUpserted': 0, 'nMatched': 0, 'nModified': 0,
+            'nRemoved': 0, 'upserted': [], 'writeErrors': write_errors
+        }
+        if write_errors:
+            raise BulkWriteError(result)
+        return BulkWriteResult(result, acknowledged=True)
+
+
+class InMemoryRawCollection:
+    """
+    Returns the documents of a collection as `RawBSONDocument`, as a collection with that `document_class` would
+    """
+
+    def __init__(self, collection: InMemoryCollection) -> None:
+        self.collection = collection
+
+    def find(self, filter: Optional[Dict] = None, projection: Optional[Dict] = None) -> List[RawBSONDocument]:
+        return [RawBSONDocument(encode(document)) for document in self.collection.find(filter, projection)]
+
+
+class InMemoryDatabase:
+
+    def __init__(self) -> None:
+        self.collections: Dict[str, InMemoryCollection] = {}
+
+    def get_collection(self, name: str, codec_options=None) -> Union[InMemoryCollection, InMemoryRawCollection]:
+        collection = self.collections.setdefault(name, InMemoryCollection())
+        if codec_options is not None and codec_options.document_class is RawBSONDocument:
+            return InMemoryRawCollection(collection)
+        return collection
+
+
+class InMemoryDatabaseUtil(DatabaseUtil):
+
+    def __init__(
+            self,
+            provision_indexes: bool = True,
+            write_batch_size: int = 1,
+            lazy: bool = False,
+            read_batch_size: int = 100
+    ) -> None:
+        super().__init__()
+        self.provision_indexes = provision_indexes
+        self.write_batch_size = write_batch_size
+        self.read_batch_size = read_batch_size
+        self.lazy = lazy
+        self.database = InMemoryDatabase()
+
+    def get_client(self) -> object:
+        return self
+
+    def get_database(self) -> Optional[InMemoryDatabase]:
+        return self.database
+
+    def should_provision_indexes(self) -> bool:
+        return self.provision_indexes
+
+    def get_write_batch_size(self) -> int:
+        return self.write_batch_size
+
+    def should_read_lazily(self) -> bool:
+        return self.lazy
+
+    def get_read_batch_size(self) -> int:
+        return self.read_batch_size
+
+
+class InMemoryAuthenticationDao(AuthenticationDao):
+    """
+    Keeps the in memory database on this subclass, leaving the connection of `AuthenticationDao` untouched
+    """
+
+
+class InMemoryPanelDao(PanelDao):
+    """
+    Keeps the in memory database on this subclass, leaving the connection of `PanelDao` untouched
+    """
+
+
+class InMemorySeriesDao(SeriesDao):
+    """
+    Keeps the in memory database on this subclass, leaving the connection of `SeriesDao` untouched
+    """
+
+
+class TestAuthenticationDao(TestCase):
+
+    @staticmethod
+    def create_dao(database_client: InMemoryDatabaseUtil) -> InMemoryAuthenticationDao:
+        return InMemoryAuthenticationDao(
+            logger_client=UtilityClientScopeProvider.logging_client(),
+            timezone_client=UtilityClientScopeProvider.time_zone_client(),
+            database_client=database_client,
+            type_codecs=[SigningPolicyEntityCodec()],
+            mapper=MapperScopeProvider.singing_policy_mapper()
+        )
+
+    def test_indexes_are_provisioned(self):
+        database_client = InMemoryDatabaseUtil()
+        dao = self.create_dao(database_client)
+        collection = database_client.database.get_collection('authentication')
+        self.assertEqual([], collection.indexes)
+        dao.provision_indexes()
+        self.assertEqual([
+            ([('expires', ASCENDING)], {'background': True}),
+            ([('expires_at', ASCENDING)], {'background': True, 'expireAfterSeconds': 0})
+        ], collection.indexes)
+
+    def test_indexes_are_not_provisioned_when_disabled(self):
+        database_client = InMemoryDatabaseUtil(provision_indexes=False)
+        self.create_dao(database_client).provision_indexes()
+        self.assertEqual([], database_client.database.get_collection('authentication').indexes)
+
+    def test_expires_at_is_stored_as_date(self):
+        database_client = InMemoryDatabaseUtil(provision_indexes=False)
+        dao = self.create_dao(database_client)
+        expires = (datetime.now(pytz.utc) + timedelta(hours=1)).strftime('%Y-%m-%dT%H:%M:%S%z')
+        dao.save_or_update({
+            'signing_policies': [
+                SigningPolicyModel(name='Policy', path='https://localhost/cms/', value='value', expires=expires)
+            ]
+        })
+        document, = database_client.database.get_collection('authentication').documents
+        # the TTL index only removes documents whose indexed field is a BSON date
+        self.assertIsInstance(decode(encode(document))['expires_at'], datetime)
+        self.assertIsInstance(document['expires'], int)
+
+
+class TestPanelDao(TestCase):
+
+    def test_projection_reports_missing_fields_as_attributes(self):
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                database_client = InMemoryDatabaseUtil(provision_indexes=False, lazy=lazy)
+                database_client.database.get_collection('catalogue').documents.append(
+                    {'_id': 1, 'id': 'A', 'title': 'title', 'type': 'movie_listing', 'description': 'description'}
+                )
+                dao = InMemoryPanelDao(
+                    logger_client=UtilityClientScopeProvider.logging_client(),
+                    timezone_client=UtilityClientScopeProvider.time_zone_client(),
+                    database_client=database_client,
+                    type_codecs=[],
+                    mapper=MapperScopeProvider.panel_mapper()
+                )
+                panel, = dao.fetch_catalogue_list(fields=('id', 'title', 'type', 'series_metadata'))
+                self.assertEqual('A', panel.id)
+                self.assertFalse(hasattr(panel, 'description'))
+                self.assertIsNone(getattr(panel, 'series_metadata', None))
+                with self.assertRaises(AttributeError):
+                    _ = panel.description
+
+
+class TestPagedStreams(TestCase):
+
+    def test_streams_are_read_in_pages_of_separate_queries(self):
+        database_client = InMemoryDatabaseUtil(provision_indexes=False, read_batch_size=2)
+        collection = database_client.database.get_collection('series')
+        collection.documents.extend({'id': series_id, 'title': 'title'} for series_id in ('E', 'A', 'C', 'D', 'B'))
+        dao = InMemorySeriesDao(
+            logger_client=UtilityClientScopeProvider.logging_client(),
+            timezone_client=UtilityClientScopeProvider.time_zone_client(),
+            database_client=database_client,
+            type_codecs=[],
+            mapper=MapperScopeProvider.series_mapper()
+        )
+        series = dao.stream_series_list(fields=('id', 'title'))
+        self.assertEqual(['A', 'B'], [next(series).id, next(series).id])
+        self.assertEqual([{}], collection.queries)
+        self.assertEqual(['C', 'D', 'E'], [entity.id for entity in series])
+        self.assertEqual([{}, {'id': {'$gt': 'B'}}, {'id': {'$gt': 'D'}}], collection.queries)
+
+
+class TestBatchedWrites(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.stored: List[str] = []
+
+    def create_dao(self, write_batch_size: int) -> InMemorySeriesDao:
+        self.database_client = InMemoryDatabaseUtil(provision_indexes=False, write_batch_size=write_batch_size)
+        self.collection = self.database_client.database.get_collection('series')
+        return InMemorySeriesDao(
+            logger_client=UtilityClientScopeProvider.logging_client(),
+            timezone_client=UtilityClientScopeProvider.time_zone_client(),
+            database_client=self.database_client,
+            type_codecs=[ImageContainerEntityCodec(), ImageEntityCodec()],
+            mapper=MapperScopeProvider.series_mapper()
+        )
+
+    @staticmethod
+    def create_series(series_id: str) -> SeriesModel:
+        return SeriesModel(
+            id=series_id, channel_id='channel', title='title', slug='slug', description='description', keywords=[],
+            season_tags=[], images=None, maturity_ratings=[], episode_count=24, season_count=2, media_count=24,
+            content_provider='provider', is_mature=False, mature_blocked=False, is_subbed=True, is_dubbed=False,
+            is_simulcast=False
+        )
+
+    def save(self, dao: InMemorySeriesDao, *series_ids: str) -> None:
+        for series_id in series_ids:
+            # stands in for the repository recording the cache entry and validators of the series
+            dao.save_or_update(self.create_series(series_id), lambda stored_id=series_id: self.stored.append(stored_id))
+
+    def test_writes_are_flushed_once_batch_size_is_reached(self):
+        dao = self.create_dao(write_batch_size=3)
+        self.save(dao, 'A', 'B')
+        self.assertEqual([], self.collection.writes)
+        self.assertEqual([], self.stored)
+        self.save(dao, 'C')
+        self.assertEqual(1, len(self.collection.writes))
+        self.assertEqual(3, len(self.collection.writes[0]))
+        self.assertEqual(['A', 'B', 'C'], self.stored)
+
+    def test_failed_items_are_not_acknowledged(self):
+        dao = self.create_dao(write_batch_size=3)
+        self.collection.failing_ids.add('B')
+        self.save(dao, 'A', 'B', 'C')
+        self.assertEqual(['A', 'C'], self.stored)
+        self.assertEqual(['A', 'C'], [document['id'] for document in self.collection.documents])
+
+    def test_nothing_is_acknowledged_when_the_write_fails(self):
+        dao = self.create_dao(write_batch_size=2)
+        self.collection.available = False
+        self.save(dao, 'A', 'B')
+        self.assertEqual([], self.stored)
+        self.assertIsNone(dao.flush())
+
+    def test_flush_writes_remaining_items_on_shutdown(self):
+        dao = self.create_dao(write_batch_size=10)
+        self.save(dao, 'A', 'B')
+        self.assertEqual([], self.collection.writes)
+        self.assertIsNotNone(dao.flush())
+        self.assertEqual(['A', 'B'], self.stored)
+        self.assertIsNone(dao.flush())
+        self.assertEqual(1, len(self.collection.writes))
@@ -0,0 +1,54 @@
+from typing import List
+from unittest import TestCase
+
+from dacite import from_dict
+from marshmallow import EXCLUDE
+
+from benchmarks.payloads import build_collection_payload, build_images
+from data.entity import PanelEntity, SeriesEntity
+from data.mapper import PanelMapper, SeriesMapper
+from data.model import CollectionContainerSchema, PanelSchema, PanelModel, SeriesSchema, SeriesModel
+from di import UtilityClientScopeProvider
+
+
+class TestMappers(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.logging_client = UtilityClientScopeProvider.logging_client()
+
+    def test_panel_mapper_matches_schema_round_trip(self):
+        payload = build_collection_payload(8)
+        models: List[PanelModel] = CollectionContainerSchema().load(payload, unknown=EXCLUDE)['items']
+        mapper = PanelMapper(self.logging_client)
+        result = mapper.to_entity(models)
+        expected = [from_dict(PanelEntity, PanelSchema().dump(model)) for model in models]
+        self.assertEqual(expected, result)
+        self.assertIsNone(result[0].series_metadata)
+        self.assertIsNone(result[1].movie_listing_metadata)
+
+    def test_series_mapper_does_not_share_lists(self):
+        model: SeriesModel = SeriesSchema().load({
+            'id': 'G123',
+            'channel_id': 'crunchyroll',
+            'title': 'Title',
+            'slug': 'title',
+            'description': 'Description',
+            'keywords': ['action'],
+            'season_tags': [],
+            'images': build_images(2),
+            'maturity_ratings': ['TV-14'],
+            'episode_count': 12,
+            'season_count': 1,
+            'media_count': 12,
+            'content_provider': 'Provider',
+            'is_mature': False,
+            'mature_blocked': False,
+            'is_subbed': True,
+            'is_dubbed': False,
+            'is_simulcast': True
+        }, unknown=EXCLUDE)
+        result: SeriesEntity = SeriesMapper(self.logging_client).to_entity(model)
+        self.assertEqual(from_dict(SeriesEntity, SeriesSchema().dump(model)), result)
+        self.assertIsNot(model.keywords, result.keywords)
+        self.assertEqual(2, len(result.images.poster_tall))
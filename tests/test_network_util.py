@@ -1,6 +1,59 @@
-from unittest import TestCase
+import json
+from asyncio import run
+from dataclasses import replace
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from marshmallow import EXCLUDE
+from requests import Request, Response
+from requests_oauthlib import OAuth1Session
+from uplink import Consumer, get
+
+from benchmarks.payloads import build_collection_payload
 from data import NetworkUtil
+from data.model import CollectionContainerSchema, NOT_MODIFIED
+from data.util import JsonSchemaConverter
+from data.util.data_utils import OAuth1Signer, PooledAiohttpClient, aiohttp
 from di import UtilityClientScopeProvider
+from domain.model import Validation, Oauth, Header, Network
+
+
+class PinnedNetworkUtil(NetworkUtil):
+    """
+    Pins the headers and network settings instead of reading them from the local configuration
+    """
+
+    def __init__(self, client: str = 'requests') -> None:
+        super().__init__()
+        self._configuration = replace(
+            self._configuration,
+            headers=Header(
+                user_agent='anime-meta', accept_encoding='gzip, deflate', accept='application/json',
+                accept_language='en-US'
+            ),
+            network=Network(client=client, pool_size=4, json_decoder='json', raw_body=False, conditional=False)
+        )
+
+
+class AsyncNetworkUtil(PinnedNetworkUtil):
+
+    def __init__(self) -> None:
+        super().__init__(client='aiohttp')
+
+
+class InMemoryRequestBuilder:
+
+    def __init__(self, method: str, url: str, params: dict) -> None:
+        self.method = method
+        self.url = url
+        self.info = {'params': params, 'headers': {}}
+
+
+class InMemoryCollectionEndpoint(Consumer):
+
+    @get('browse')
+    def get_catalogue(self) -> CollectionContainerSchema(unknown=EXCLUDE):
+        pass
 
 
 class TestNetworkUtil(TestCase):
@@ -9,11 +62,107 @@ class TestNetworkUtil(TestCase):
     def setUp(self) -> None:
         super().setUp()
         self.__network_util = UtilityClientScopeProvider.network_client()
+        self.__logger = UtilityClientScopeProvider.logging_client().get_default_logger(__name__)
+
+    @staticmethod
+    def __create_response(payload) -> Response:
+        response = Response()
+        response._content = json.dumps(payload).encode('utf-8')
+        response.encoding = 'utf-8'
+        return response
 
     def test_create_session(self):
         result = self.__network_util.create_session()
         self.assertIsNotNone(result)
 
+    def test_create_client(self):
+        result = self.__network_util.create_client()
+        self.assertIsNotNone(result)
+        self.assertIs(result, self.__network_util.create_client())
+
+    def test_create_client_without_auth(self):
+        network_util = PinnedNetworkUtil(client='requests')
+        self.assertIsInstance(network_util.create_client(), OAuth1Session)
+        self.assertIsNone(network_util.create_auth())
+
+    def test_create_async_client(self):
+        network_util = AsyncNetworkUtil()
+        result = network_util.create_client()
+        self.assertIsInstance(result, PooledAiohttpClient)
+        self.assertIs(result, network_util.create_client())
+        self.assertIsInstance(network_util.create_auth(), OAuth1Signer)
+
+    @skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_pooled_client_shares_one_session(self):
+        async def create_sessions():
+            client = AsyncNetworkUtil().create_client()
+            session = await client.session()
+            try:
+                return session, await client.session(), session.connector.limit
+            finally:
+                await client.close()
+
+        session, reused, limit = run(create_sessions())
+        self.assertIsInstance(session, aiohttp.ClientSession)
+        self.assertIs(session, reused)
+        self.assertEqual(4, limit)
+        self.assertEqual('application/json', session.headers['Accept'])
+        self.assertTrue(session.closed)
+
+    @skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_json_schema_converter_reads_async_body_on_event_loop(self):
+        from aiohttp import web
+
+        payload = build_collection_payload(4)
+
+        async def browse(request):
+            return web.json_response(payload)
+
+        async def fetch_catalogue(raw_body: bool):
+            application = web.Application()
+            application.router.add_get('/browse', browse)
+            runner = web.AppRunner(application)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            client = AsyncNetworkUtil().create_client()
+            converter = JsonSchemaConverter(
+                loads=json.loads,
+                raw_body=raw_body,
+                validation=Validation(trusted=False, sample_rate=0.0, strict_codecs=False),
+                logger=self.__logger
+            )
+            try:
+                endpoint = InMemoryCollectionEndpoint(
+                    base_url=f'http://127.0.0.1:{port}/', client=client, converter=(converter,)
+                )
+                return await endpoint.get_catalogue()
+            finally:
+                await client.close()
+                await runner.cleanup()
+
+        expected = CollectionContainerSchema(unknown=EXCLUDE).load(payload)
+        # any coroutine called through a `ThreadedResponse` would run on a new thread and event loop
+        with patch('uplink.clients.aiohttp_.ThreadedCoroutine', side_effect=AssertionError):
+            for raw_body in (False, True):
+                self.assertEqual(expected, run(fetch_catalogue(raw_body)))
+
+    def test_oauth1_signer_matches_session(self):
+        oauth = Oauth(key='key', secret='secret')
+        url = 'https://localhost/disc/public/v1/US/M2/-/-/browse'
+        params = {'q': 'a b', 'n': 100, 'start': 0}
+        with patch('oauthlib.oauth1.rfc5849.generate_nonce', return_value='nonce'), \
+                patch('oauthlib.oauth1.rfc5849.generate_timestamp', return_value='1605000000'):
+            request_builder = InMemoryRequestBuilder('GET', url, params)
+            OAuth1Signer(oauth)(request_builder)
+            session = OAuth1Session(client_key=oauth.key, client_secret=oauth.secret)
+            prepared = session.prepare_request(Request('GET', url, params=params))
+        expected = prepared.headers['Authorization']
+        if isinstance(expected, bytes):
+            expected = expected.decode('utf-8')
+        self.assertEqual(expected, request_builder.info['headers']['Authorization'])
+
     def test_get_authentication_url(self):
         result = self.__network_util.get_authentication_url()
         self.assertIsNotNone(result)
@@ -25,3 +174,52 @@ class TestNetworkUtil(TestCase):
     def test_get_collection_url(self):
         result = self.__network_util.get_collection_url()
         self.assertIsNotNone(result)
+
+    def test_create_converters_keeps_default_converter(self):
+        network_util = PinnedNetworkUtil()
+        # noinspection PyProtectedMember
+        network_util._configuration = replace(
+            network_util._configuration, validation=Validation(trusted=False, sample_rate=0.01, strict_codecs=False)
+        )
+        self.assertEqual((), network_util.create_converters())
+
+    def test_json_schema_converter(self):
+        payload = build_collection_payload(4)
+        response = self.__create_response(payload)
+        expected = CollectionContainerSchema(unknown=EXCLUDE).load(payload)
+        for raw_body in (False, True):
+            for trusted in (False, True):
+                converter = JsonSchemaConverter(
+                    loads=json.loads,
+                    raw_body=raw_body,
+                    validation=Validation(trusted=trusted, sample_rate=0.5, strict_codecs=False),
+                    logger=self.__logger
+                )
+                body_converter = converter.create_response_body_converter(CollectionContainerSchema(unknown=EXCLUDE))
+                self.assertEqual(expected, body_converter.convert(response))
+
+    def test_json_schema_converter_reports_drift(self):
+        payload = build_collection_payload(2)
+        payload['items'][0]['search_metadata']['score'] = '7'
+        converter = JsonSchemaConverter(
+            loads=json.loads,
+            raw_body=True,
+            validation=Validation(trusted=True, sample_rate=1.0, strict_codecs=False),
+            logger=self.__logger
+        )
+        body_converter = converter.create_response_body_converter(CollectionContainerSchema(unknown=EXCLUDE))
+        with self.assertLogs(self.__logger, level='WARNING'):
+            result = body_converter.convert(self.__create_response(payload))
+        self.assertEqual(7, result['items'][0].search_metadata.score)
+
+    def test_json_schema_converter_not_modified(self):
+        response = Response()
+        response.status_code = 304
+        converter = JsonSchemaConverter(
+            loads=json.loads,
+            raw_body=True,
+            validation=Validation(trusted=True, sample_rate=1.0, strict_codecs=False),
+            logger=self.__logger
+        )
+        body_converter = converter.create_response_body_converter(CollectionContainerSchema(unknown=EXCLUDE))
+        self.assertIs(NOT_MODIFIED, body_converter.convert(response))
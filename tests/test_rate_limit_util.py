@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+from data import RateLimitUtil
+from data.source.remote_sources import RateLimitTemplate
+
+
+class TestRateLimitUtil(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.rate_limit_util = RateLimitUtil()
+
+    def test_reserve_allows_burst_of_configured_calls(self):
+        delays = [self.rate_limit_util.reserve() for _ in range(5)]
+        self.assertEqual([0, 0, 0, 0, 0], delays)
+        self.assertGreater(self.rate_limit_util.reserve(), 0)
+
+    def test_throttled_response_halves_rate(self):
+        rate = self.rate_limit_util.get_rate()
+        delay = self.rate_limit_util.on_response(429)
+        self.assertIsNotNone(delay)
+        self.assertAlmostEqual(rate / 2, self.rate_limit_util.get_rate())
+
+    def test_throttled_response_honours_retry_after(self):
+        delay = self.rate_limit_util.on_response(429, '3')
+        self.assertEqual(3.0, delay)
+        self.assertGreater(self.rate_limit_util.reserve(), 2)
+
+    def test_rate_never_drops_below_minimum(self):
+        for _ in range(10):
+            self.rate_limit_util.on_response(429, '0')
+        self.assertAlmostEqual(1 / 10, self.rate_limit_util.get_rate())
+
+    def test_successful_response_recovers_rate(self):
+        rate = self.rate_limit_util.get_rate()
+        self.rate_limit_util.on_response(429, '0')
+        self.assertIsNone(self.rate_limit_util.on_response(200))
+        self.assertGreater(self.rate_limit_util.get_rate(), rate / 2)
+        for _ in range(10):
+            self.rate_limit_util.on_response(200)
+        self.assertAlmostEqual(rate, self.rate_limit_util.get_rate())
+
+    def test_template_queues_request_until_token_is_available(self):
+        for _ in range(5):
+            self.rate_limit_util.reserve()
+        template = RateLimitTemplate(self.rate_limit_util)
+        self.assertIsNotNone(template.before_request(None))
+        self.assertEqual(1, self.rate_limit_util.get_queue_depth())
+        template.after_exception(None, None, None, None)
+        self.assertEqual(0, self.rate_limit_util.get_queue_depth())
@@ -0,0 +1,385 @@
+from asyncio import run, gather, sleep
+from threading import get_ident
+from time import time
+from typing import List, Dict, Optional
+from unittest import TestCase
+
+from data.entity import ValidatorEntity
+from data.model import AttributeDict, NOT_MODIFIED
+from data.repository import AuthenticationRepository, PanelRepository, SeriesRepository
+from data.source import ValidatorUtil, ConditionalRequestTemplate
+from di import UtilityClientScopeProvider
+from domain.entity import Index
+from domain.model import Paging, Freshness
+
+
+class InMemoryAuthenticationEndpoint:
+    exceptions = None
+
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def get_authorization_token(self) -> Dict:
+        self.requests += 1
+        return {}
+
+
+class InMemoryAsyncAuthenticationEndpoint(InMemoryAuthenticationEndpoint):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: List[int] = []
+
+    async def get_authorization_token(self) -> Dict:
+        self.threads.append(get_ident())
+        await sleep(0)
+        return super().get_authorization_token()
+
+
+class InMemoryAuthenticationDao:
+
+    def __init__(self, time_to_live: int) -> None:
+        self.time_to_live = time_to_live
+        self.policies: List[AttributeDict] = []
+        self.queries = 0
+
+    def contains_valid_sessions(self, path_type: str, min_time_to_live: int = 0) -> bool:
+        self.queries += 1
+        return any(policy.expires > time() + min_time_to_live for policy in self.policies)
+
+    def save_or_update(self, response: Dict) -> Optional[Dict]:
+        expires = int(time()) + self.time_to_live
+        self.policies = [
+            AttributeDict(name=name, path='/cms/', value=f'{name}-{expires}', expires=expires)
+            for name in ('Policy', 'Signature', 'Key-Pair-Id')
+        ]
+        return response
+
+    def fetch_policy_matching(self, path_type: str) -> List[AttributeDict]:
+        self.queries += 1
+        return [policy for policy in self.policies if policy.expires > time()]
+
+
+class TestAuthenticationRepository(TestCase):
+
+    def create_repository(self, time_to_live: int, non_blocking: bool = False) -> AuthenticationRepository:
+        if non_blocking:
+            self.remote_source = InMemoryAsyncAuthenticationEndpoint()
+        else:
+            self.remote_source = InMemoryAuthenticationEndpoint()
+        self.local_source = InMemoryAuthenticationDao(time_to_live)
+        return AuthenticationRepository(
+            remote_source=self.remote_source,
+            local_source=self.local_source,
+            logging_client=UtilityClientScopeProvider.logging_client(),
+            non_blocking=non_blocking
+        )
+
+    def test_signing_policies_are_served_from_memory(self):
+        repository = self.create_repository(time_to_live=60 * 60)
+
+        async def request() -> List[List[AttributeDict]]:
+            return await gather(*[repository.signing_policies() for _ in range(5)])
+
+        results = run(request())
+        self.assertEqual(1, self.remote_source.requests)
+        self.assertEqual(2, self.local_source.queries)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(3, len(results[0]))
+
+    def test_signing_policies_refresh_before_expiry(self):
+        repository = self.create_repository(time_to_live=60)
+
+        async def request() -> List[AttributeDict]:
+            expiring = await repository.signing_policies()
+            self.local_source.time_to_live = 60 * 60
+            # within the refresh margin the cached policies are returned while a refresh runs in the background
+            self.assertEqual(expiring, await repository.signing_policies())
+            self.assertEqual(expiring, await repository.signing_policies())
+            await sleep(0.1)
+            return await repository.signing_policies()
+
+        result = run(request())
+        self.assertEqual(2, self.remote_source.requests)
+        self.assertEqual(self.local_source.policies, result)
+
+    def test_non_blocking_requests_are_awaited_on_the_event_loop(self):
+        repository = self.create_repository(time_to_live=60 * 60, non_blocking=True)
+
+        async def request() -> List[AttributeDict]:
+            return await repository.signing_policies()
+
+        result = run(request())
+        self.assertEqual(1, self.remote_source.requests)
+        self.assertEqual([get_ident()], self.remote_source.threads)
+        self.assertEqual(self.local_source.policies, result)
+
+
+class InMemoryDiscoverEndpoint:
+    exceptions = None
+
+    def __init__(self, failing_start: Optional[int] = None, validator_client: Optional[ValidatorUtil] = None) -> None:
+        self.failing_start = failing_start
+        self.validator_client = validator_client
+        self.not_modified = False
+        self.requests: List[tuple] = []
+
+    def get_catalogue_by_prefix(self, start: int, count: int, query: str, **kwargs) -> Dict:
+        self.requests.append((start, count))
+        if start == self.failing_start:
+            raise TimeoutError()
+        if self.not_modified:
+            return NOT_MODIFIED
+        # stands in for `ConditionalRequestTemplate` capturing the validator of the response
+        self.validator_client.capture(ValidatorEntity(f'browse?q={query}&start={start}', f'"{start}"', None))
+        return {'items': list(range(start, start + count))}
+
+
+class InMemoryValidatorDao:
+
+    def __init__(self) -> None:
+        self.validators: List[ValidatorEntity] = []
+
+    @staticmethod
+    def fetch_validators() -> List[AttributeDict]:
+        return []
+
+    def save_or_update_validators(self, validators: List[ValidatorEntity]) -> None:
+        self.validators.extend(validators)
+
+
+class InMemoryPanelDao:
+
+    def __init__(self) -> None:
+        self.pages: List[Dict] = []
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return 'catalogue'
+
+    def save_or_update(self, response: Dict) -> AttributeDict:
+        self.pages.append(response)
+        return AttributeDict(acknowledged=True)
+
+
+class InMemoryIndexSnapshotDao:
+
+    def __init__(self, snapshot: Dict[str, int]) -> None:
+        self.snapshot = snapshot
+        self.queries = 0
+
+    def save_or_update(self, entity) -> None:
+        self.snapshot[entity.prefix] = entity.count
+
+    def fetch_snapshot(self) -> Dict[str, int]:
+        self.queries += 1
+        return dict(self.snapshot)
+
+
+class InMemoryCacheLogUtil:
+
+    def __init__(self, is_expired: bool = True) -> None:
+        self.entries: List[tuple] = []
+        self.is_expired = is_expired
+        self.durations: List[Optional[int]] = []
+
+    def is_cache_expired(
+            self,
+            collection: str,
+            identifier: Optional[str] = None,
+            item: Optional[object] = None,
+            duration: Optional[int] = None
+    ) -> bool:
+        self.durations.append(duration)
+        return self.is_expired
+
+    def save_or_update(self, collection: str, identifier: Optional[str] = None) -> bool:
+        self.entries.append((collection, identifier))
+        return True
+
+
+class InMemoryAuthenticationRepository:
+
+    @staticmethod
+    async def signing_policies(path_type: str = 'cms') -> List[AttributeDict]:
+        return [AttributeDict(value=name) for name in ('Policy', 'Signature', 'Key-Pair-Id')]
+
+
+class TestPanelRepository(TestCase):
+
+    def create_repository(
+            self,
+            paging: Paging,
+            failing_start: Optional[int] = None,
+            snapshot: Optional[Dict[str, int]] = None,
+            is_expired: bool = True
+    ) -> PanelRepository:
+        self.validator_source = InMemoryValidatorDao()
+        self.validator_client = ValidatorUtil(
+            self.validator_source, UtilityClientScopeProvider.logging_client(), enabled=True
+        )
+        self.remote_source = InMemoryDiscoverEndpoint(failing_start, self.validator_client)
+        self.local_source = InMemoryPanelDao()
+        self.cache_log_client = InMemoryCacheLogUtil(is_expired)
+        self.snapshot_source = InMemoryIndexSnapshotDao(snapshot or {})
+        return PanelRepository(
+            remote_source=self.remote_source,
+            local_source=self.local_source,
+            logging_client=UtilityClientScopeProvider.logging_client(),
+            cache_log_client=self.cache_log_client,
+            authentication_repository=InMemoryAuthenticationRepository(),
+            paging=paging,
+            snapshot_source=self.snapshot_source,
+            freshness=Freshness(
+                default=60 * 60 * 24 * 2,
+                simulcast=60 * 60,
+                recent=60 * 60 * 6,
+                recent_days=14,
+                archived=60 * 60 * 24 * 30,
+                archived_days=365,
+                unchanged_prefix=60 * 60 * 24 * 7
+            ),
+            validator_client=self.validator_client
+        )
+
+    def test_panel_requests_whole_prefix_without_paging(self):
+        repository = self.create_repository(Paging(page_size=0, concurrency=2))
+        run(repository.panel('crunchyroll', Index(prefix='a', offset=0, count=250)))
+        self.assertEqual([(0, 250)], self.remote_source.requests)
+        self.assertEqual([('catalogue', 'a')], self.cache_log_client.entries)
+
+    def test_panel_requests_prefix_in_pages(self):
+        repository = self.create_repository(Paging(page_size=100, concurrency=2))
+        run(repository.panel('crunchyroll', Index(prefix='a', offset=0, count=250)))
+        self.assertEqual([(0, 100), (100, 100), (200, 50)], sorted(self.remote_source.requests))
+        self.assertEqual(3, len(self.local_source.pages))
+        self.assertEqual([('catalogue', 'a')], self.cache_log_client.entries)
+
+    def test_failed_page_keeps_other_pages(self):
+        repository = self.create_repository(Paging(page_size=100, concurrency=2), failing_start=100)
+        run(repository.panel('crunchyroll', Index(prefix='a', offset=0, count=250)))
+        self.assertEqual(2, len(self.local_source.pages))
+        self.assertEqual([], self.cache_log_client.entries)
+
+    def test_prioritise_orders_changed_prefixes_first(self):
+        repository = self.create_repository(Paging(page_size=0, concurrency=2), snapshot={'a': 10, 'b': 20, 'c': 30})
+        indexes = [
+            Index(prefix='a', offset=0, count=10),
+            Index(prefix='b', offset=10, count=25),
+            Index(prefix='c', offset=35, count=30),
+            Index(prefix='d', offset=65, count=5)
+        ]
+        self.assertEqual(['b', 'd', 'a', 'c'], [index.prefix for index in repository.prioritise(indexes)])
+        self.assertEqual(1, self.snapshot_source.queries)
+
+    def test_changed_prefix_is_requested_regardless_of_cache(self):
+        repository = self.create_repository(Paging(page_size=0, concurrency=2), snapshot={'a': 200}, is_expired=False)
+        run(repository.panel('crunchyroll', Index(prefix='a', offset=0, count=250)))
+        self.assertEqual([(0, 250)], self.remote_source.requests)
+        self.assertEqual([], self.cache_log_client.durations)
+        self.assertEqual({'a': 250}, self.snapshot_source.snapshot)
+
+    def test_unchanged_prefix_uses_longer_cache_duration(self):
+        repository = self.create_repository(Paging(page_size=0, concurrency=2), snapshot={'a': 250}, is_expired=False)
+        run(repository.panel('crunchyroll', Index(prefix='a', offset=0, count=250)))
+        self.assertEqual([], self.remote_source.requests)
+        self.assertEqual([60 * 60 * 24 * 7], self.cache_log_client.durations)
+
+    def test_prefix_without_snapshot_uses_default_cache_duration(self):
+        repository = self.create_repository(Paging(page_size=0, concurrency=2))
+        run(repository.panel('crunchyroll', Index(prefix='a', offset=0, count=250)))
+        self.assertEqual([None], self.cache_log_client.durations)
+        self.assertEqual({'a': 250}, self.snapshot_source.snapshot)
+
+    def test_validators_are_kept_once_pages_are_stored(self):
+        repository = self.create_repository(Paging(page_size=100, concurrency=2), failing_start=100)
+        run(repository.panel('crunchyroll', Index(prefix='a', offset=0, count=250)))
+        self.assertCountEqual(['"0"', '"200"'], [validator.etag for validator in self.validator_source.validators])
+        self.assertIsNotNone(self.validator_client.get_validator('browse?q=a&start=0'))
+        self.assertIsNone(self.validator_client.get_validator('browse?q=a&start=100'))
+
+    def test_not_modified_prefix_only_records_cache_entry(self):
+        repository = self.create_repository(Paging(page_size=0, concurrency=2))
+        self.remote_source.not_modified = True
+        run(repository.panel('crunchyroll', Index(prefix='a', offset=0, count=250)))
+        self.assertEqual([], self.local_source.pages)
+        self.assertEqual([], self.validator_source.validators)
+        self.assertEqual([('catalogue', 'a')], self.cache_log_client.entries)
+
+
+class InMemorySeriesDao:
+
+    def __init__(self) -> None:
+        self.threads: List[int] = []
+
+    def fetch_series(self, series_id: str, fields=None) -> None:
+        self.threads.append(get_ident())
+        return None
+
+
+class TestSeriesRepository(TestCase):
+
+    def test_stored_series_is_read_off_the_event_loop(self):
+        local_source = InMemorySeriesDao()
+        repository = SeriesRepository(
+            remote_source=None,
+            local_source=local_source,
+            logging_client=UtilityClientScopeProvider.logging_client(),
+            cache_log_client=InMemoryCacheLogUtil(),
+            authentication_repository=InMemoryAuthenticationRepository(),
+            validator_client=None
+        )
+        self.assertIsNone(run(repository.stored_series('A')))
+        self.assertEqual(1, len(local_source.threads))
+        self.assertNotEqual(get_ident(), local_source.threads[0])
+
+
+class InMemoryResponse:
+
+    def __init__(self, status_code: int, headers: Dict[str, str]) -> None:
+        self.status_code = status_code
+        self.headers = headers
+
+
+class TestConditionalRequestTemplate(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.validator_source = InMemoryValidatorDao()
+        self.validator_client = ValidatorUtil(
+            self.validator_source, UtilityClientScopeProvider.logging_client(), enabled=True
+        )
+        self.template = ConditionalRequestTemplate(self.validator_client)
+
+    @staticmethod
+    def create_request(signature: str) -> tuple:
+        params = {'q': 'a', 'start': 0, 'Policy': signature, 'Signature': signature, 'Key-Pair-Id': signature}
+        return 'GET', 'https://localhost/browse', {'params': params}
+
+    def test_create_key_ignores_signing_parameters(self):
+        _, url, first = self.create_request('first')
+        _, _, second = self.create_request('second')
+        key = self.validator_client.create_key(url, first['params'])
+        self.assertEqual('https://localhost/browse?q=a&start=0', key)
+        self.assertEqual(key, self.validator_client.create_key(url, second['params']))
+
+    def test_validators_are_sent_with_later_requests(self):
+        response = InMemoryResponse(200, {'ETag': '"v1"', 'Last-Modified': 'Sun, 08 Nov 2020 19:32:09 GMT'})
+        self.template.after_response(self.create_request('first'), response)
+        request = self.create_request('second')
+        self.assertIsNone(self.template.before_request(request))
+        self.assertEqual(
+            {'If-None-Match': '"v1"', 'If-Modified-Since': 'Sun, 08 Nov 2020 19:32:09 GMT'},
+            request[2]['headers']
+        )
+
+    def test_pending_validators_are_only_kept_when_committed(self):
+        with self.validator_client.pending() as validators:
+            self.template.after_response(self.create_request('first'), InMemoryResponse(200, {'ETag': '"v1"'}))
+        self.assertEqual(1, len(validators))
+        request = self.create_request('second')
+        self.template.before_request(request)
+        self.assertNotIn('headers', request[2])
+        self.validator_client.commit(validators)
+        self.template.before_request(request)
+        self.assertEqual({'If-None-Match': '"v1"'}, request[2]['headers'])
@@ -1,14 +1,19 @@
+import copy
 from typing import Dict
 from unittest import TestCase
 
-from marshmallow import EXCLUDE
+from dacite import MissingValueError
+
+from marshmallow import EXCLUDE, ValidationError
 
 from data.model.schemas import SigningPolicyContainerSchema, \
     IndexContainerSchema, CollectionContainerSchema, EpisodeContainerSchema, \
-    SeasonContainerSchema, SeriesSchema, MovieSchema
+    SeasonContainerSchema, SeriesSchema, MovieSchema, ImageContainerSchema
 
 from data.model.models import SigningPolicyModel, EpisodeModel, \
-    SeasonModel, SeriesModel, IndexModel, PanelModel, MovieModel
+    SeasonModel, SeriesModel, IndexModel, PanelModel, MovieModel, ImageModel
+
+from benchmarks.payloads import build_collection_payload, build_images
 
 
 def __load_sample_file__(file_name: str) -> dict:
@@ -79,3 +84,54 @@ class Test(TestCase):
         schema = MovieSchema()
         result: MovieModel = schema.load(json, unknown=EXCLUDE)
         self.assertIsInstance(result, MovieModel)
+
+
+class TestTrustedLoad(TestCase):
+
+    def test_trusted_load_matches_load(self):
+        payload = build_collection_payload(12)
+        schema = CollectionContainerSchema(unknown=EXCLUDE)
+        result = schema.load_trusted(payload)
+        self.assertEqual(schema.load(copy.deepcopy(payload)), result)
+        self.assertIsInstance(result['items'][0], PanelModel)
+
+    def test_trusted_load_does_not_modify_payload(self):
+        payload = build_collection_payload(2)
+        expected = copy.deepcopy(payload)
+        CollectionContainerSchema(unknown=EXCLUDE).load_trusted(payload)
+        self.assertEqual(expected, payload)
+
+    def test_trusted_load_falls_back_to_load(self):
+        payload = build_collection_payload(2)
+        del payload['items'][0]['id']
+        with self.assertRaises(MissingValueError):
+            CollectionContainerSchema(unknown=EXCLUDE).load_trusted(payload)
+
+
+class TestFlattenedList(TestCase):
+
+    def test_nested_images_are_flattened(self):
+        images = build_images(3)
+        expected = copy.deepcopy(images)
+        result = ImageContainerSchema(unknown=EXCLUDE).load(images)
+        self.assertEqual(3, len(result.poster_tall))
+        self.assertIsInstance(result.poster_tall[0], ImageModel)
+        self.assertEqual(270, result.poster_wide[2].height)
+        self.assertEqual(expected, images)
+
+    def test_flat_images_are_loaded_as_is(self):
+        images = build_images(3)
+        flat = {image_type: values[0] for image_type, values in images.items()}
+        schema = ImageContainerSchema(unknown=EXCLUDE)
+        self.assertEqual(schema.load(images), schema.load(flat))
+
+    def test_invalid_images_are_reported_by_flattened_index(self):
+        images = build_images(3)
+        images['poster_tall'][0][1]['width'] = 'wide'
+        with self.assertRaises(ValidationError) as context:
+            ImageContainerSchema(unknown=EXCLUDE).load(images)
+        self.assertEqual([1], list(context.exception.messages['poster_tall']))
+
+    def test_non_list_images_are_rejected(self):
+        with self.assertRaises(ValidationError):
+            ImageContainerSchema(unknown=EXCLUDE).load({'poster_tall': 'poster'})
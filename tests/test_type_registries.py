@@ -0,0 +1,82 @@
+from typing import List
+from unittest import TestCase
+
+import bson
+from bson.raw_bson import RawBSONDocument
+from bson.codec_options import CodecOptions, TypeRegistry
+from marshmallow import EXCLUDE
+
+from benchmarks.payloads import build_collection_payload
+from data.entity import PanelEntity, AdBreakEntity
+from data.mapper import PanelMapper
+from data.model import CollectionContainerSchema, PanelModel
+from data.type_registry import ImageContainerEntityCodec, ImageEntityCodec, MoviePanelEntityCodec, \
+    SeriesPanelEntityCodec, SearchMetaEntityCodec, AdBreakEntityCodec, PanelEntityCodec, LazyEntity
+
+
+class TestTypeRegistries(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        payload = build_collection_payload(8)
+        models: List[PanelModel] = CollectionContainerSchema().load(payload, unknown=EXCLUDE)['items']
+        # noinspection PyProtectedMember
+        self.panels: List[PanelEntity] = [PanelMapper._map_to_entity(model) for model in models]
+
+    @staticmethod
+    def __encode(panel: PanelEntity, strict: bool) -> dict:
+        registry = TypeRegistry([
+            ImageContainerEntityCodec(strict),
+            ImageEntityCodec(strict),
+            MoviePanelEntityCodec(strict),
+            SeriesPanelEntityCodec(strict),
+            SearchMetaEntityCodec(strict)
+        ])
+        document = bson.encode(dict(panel), codec_options=CodecOptions(type_registry=registry))
+        return bson.decode(document)
+
+    def test_compiled_codecs_write_the_same_documents_as_strict_codecs(self):
+        for panel in self.panels:
+            self.assertEqual(self.__encode(panel, strict=True), self.__encode(panel, strict=False))
+
+    def test_compiled_codec_round_trip(self):
+        for strict in (False, True):
+            codec = PanelEntityCodec(strict)
+            for panel in self.panels:
+                self.assertEqual(panel, codec.transform_bson(self.__encode(panel, strict=False)))
+
+    def test_compiled_codec_fills_missing_optional_values(self):
+        codec = ImageContainerEntityCodec()
+        container = codec.transform_bson({'poster_tall': [{'width': 1, 'height': 2, 'type': 't', 'source': 's'}]})
+        self.assertEqual(1, container.poster_tall[0].width)
+        self.assertIsNone(container.poster_wide)
+        self.assertIsNone(container.thumbnail)
+
+    def test_strict_codec_validates_types(self):
+        value = {'type': 'midroll', 'offset_ms': 'not a number'}
+        self.assertEqual(AdBreakEntity('midroll', 'not a number'), AdBreakEntityCodec().transform_bson(value))
+        with self.assertRaises(Exception):
+            AdBreakEntityCodec(strict=True).transform_bson(value)
+
+    def test_compiled_codec_requires_required_values(self):
+        with self.assertRaises(KeyError):
+            AdBreakEntityCodec().transform_bson({'type': 'midroll'})
+
+    def test_lazy_entity_decodes_fields_on_access(self):
+        for panel in self.panels:
+            document = RawBSONDocument(bson.encode(self.__encode(panel, strict=False)))
+            entity = LazyEntity(document, PanelEntity)
+            self.assertEqual(panel.title, entity.title)
+            # noinspection PyProtectedMember
+            self.assertNotIn('images', entity._values)
+            self.assertEqual(panel.images, entity.images)
+            self.assertEqual(dict(panel), dict(entity))
+            self.assertEqual(panel, entity.to_entity())
+
+    def test_lazy_entity_reports_missing_fields(self):
+        entity = LazyEntity(RawBSONDocument(bson.encode({'id': 'G1'})), PanelEntity)
+        self.assertEqual('G1', entity.id)
+        self.assertFalse(hasattr(entity, 'title'))
+        self.assertIsNone(entity.images)
+        with self.assertRaises(AttributeError):
+            _ = entity.unknown
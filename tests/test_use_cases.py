@@ -0,0 +1,146 @@
+from asyncio import run, sleep
+from typing import Dict, Optional, Set, Tuple
+from unittest import TestCase
+
+from data.usecase.use_cases import ConcurrentUseCase, SeriesUseCase, SeasonUseCase, EpisodeUseCase
+from di import UtilityClientScopeProvider
+from domain.entity import Panel, Season, Series
+
+
+class InMemoryCatalogueRepository:
+
+    def __init__(self) -> None:
+        self.series: Dict[str, Series] = {}
+        self.seasons: Set[Tuple[str, int]] = set()
+        self.episodes: Set[Tuple[str, Optional[int]]] = set()
+        self.expired: Set[str] = set()
+
+    async def stored_series(self, series_id: str) -> Optional[Series]:
+        return self.series.get(series_id)
+
+    def is_cache_expired(self, panel: Panel) -> bool:
+        return panel.id in self.expired
+
+    async def contains_season(self, series_id: str, season_number: int) -> bool:
+        return (series_id, season_number) in self.seasons
+
+    async def contains_episode(self, season_id: str, episode_number: Optional[int] = None) -> bool:
+        if episode_number is None:
+            return any(stored_season_id == season_id for stored_season_id, _ in self.episodes)
+        return (season_id, episode_number) in self.episodes
+
+
+class TestConcurrentUseCase(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.logging_client = UtilityClientScopeProvider.logging_client()
+
+    def test_fan_out_respects_concurrency_limit(self):
+        use_case = ConcurrentUseCase(None, self.logging_client, concurrency_limit=3)
+        state = {'active': 0, 'peak': 0, 'completed': []}
+
+        async def action(item: int) -> None:
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+            await sleep(0.01)
+            state['active'] -= 1
+            state['completed'].append(item)
+
+        run(use_case.fan_out(range(10), action))
+        self.assertEqual(3, state['peak'])
+        self.assertCountEqual(list(range(10)), state['completed'])
+
+    def test_fan_out_continues_after_failure(self):
+        use_case = ConcurrentUseCase(None, self.logging_client, concurrency_limit=2)
+        completed = []
+
+        async def action(item: int) -> None:
+            if item == 1:
+                raise ValueError(item)
+            completed.append(item)
+
+        run(use_case.fan_out(range(4), action))
+        self.assertCountEqual([0, 2, 3], completed)
+
+    def test_fan_out_accepts_async_iterable(self):
+        use_case = ConcurrentUseCase(None, self.logging_client, concurrency_limit=2)
+        state = {'pulled': 0, 'completed': 0, 'ahead': 0}
+
+        async def items():
+            for item in range(6):
+                state['pulled'] += 1
+                state['ahead'] = max(state['ahead'], state['pulled'] - state['completed'])
+                yield item
+
+        async def action(item: int) -> None:
+            await sleep(0.01)
+            state['completed'] += 1
+
+        run(use_case.fan_out(items(), action))
+        self.assertEqual(6, state['completed'])
+        self.assertLessEqual(state['ahead'], 3)
+
+
+class TestIncrementalChanges(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        logging_client = UtilityClientScopeProvider.logging_client()
+        self.repository = InMemoryCatalogueRepository()
+        self.series_use_case = SeriesUseCase(self.repository, logging_client)
+        self.season_use_case = SeasonUseCase(self.repository, logging_client)
+        self.episode_use_case = EpisodeUseCase(self.repository, logging_client)
+        self.repository.series['A'] = Series(
+            id='A', channel_id='channel', title='title', slug='slug', maturity_ratings=[], episode_count=24,
+            season_count=2, media_count=24, content_provider='provider', is_mature=False, is_subbed=True,
+            is_dubbed=False, is_simulcast=False
+        )
+        self.repository.seasons.update({('A', 1), ('A', 2)})
+        self.repository.episodes.update({('S1', 12), ('S2', 12)})
+
+    @staticmethod
+    def create_panel(series_id: str = 'A', new: bool = False, episode_count: int = 24, season_number: int = 2,
+                     episode_number: int = 12) -> Panel:
+        return Panel(
+            id=series_id, channel_id='channel', title='title', external_id='SRZ', type='series', locale='en-US',
+            last_public=None, new=new, is_simulcast=False, episode_count=episode_count, season_count=season_number,
+            last_public_season_number=season_number, last_public_episode_number=episode_number
+        )
+
+    @staticmethod
+    def create_season(season_id: str, season_number: int) -> Season:
+        return Season(
+            id=season_id, channel_id='channel', title='title', series_id='A', season_number=season_number,
+            is_mature=False, is_subbed=True, is_dubbed=False, is_simulcast=False
+        )
+
+    def test_unchanged_panel_is_skipped(self):
+        panel = self.create_panel()
+        self.assertFalse(run(self.series_use_case.has_changed(panel)))
+        self.assertFalse(run(self.season_use_case.has_changed(panel)))
+        self.assertFalse(run(self.episode_use_case.has_changed(self.create_season('S1', 1), panel)))
+        self.assertFalse(run(self.episode_use_case.has_changed(self.create_season('S2', 2), panel)))
+
+    def test_unknown_series_has_changed(self):
+        self.assertTrue(run(self.series_use_case.has_changed(self.create_panel(series_id='B'))))
+        self.assertTrue(run(self.series_use_case.has_changed(self.create_panel(series_id='B', new=True))))
+
+    def test_new_panel_only_changes_once_stored_series_expires(self):
+        panel = self.create_panel(new=True)
+        self.assertFalse(run(self.series_use_case.has_changed(panel)))
+        self.repository.expired.add('A')
+        self.assertTrue(run(self.series_use_case.has_changed(panel)))
+        self.assertFalse(run(self.series_use_case.has_changed(self.create_panel())))
+
+    def test_new_episode_only_changes_latest_season(self):
+        panel = self.create_panel(episode_count=25, episode_number=13)
+        self.assertTrue(run(self.series_use_case.has_changed(panel)))
+        self.assertFalse(run(self.episode_use_case.has_changed(self.create_season('S1', 1), panel)))
+        self.assertTrue(run(self.episode_use_case.has_changed(self.create_season('S2', 2), panel)))
+
+    def test_new_season_has_changed(self):
+        panel = self.create_panel(episode_count=25, season_number=3, episode_number=1)
+        self.assertTrue(run(self.season_use_case.has_changed(panel)))
+        self.assertTrue(run(self.episode_use_case.has_changed(self.create_season('S3', 3), panel)))
+        self.assertFalse(run(self.episode_use_case.has_changed(self.create_season('S2', 2), panel)))